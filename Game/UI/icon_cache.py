@@ -0,0 +1,156 @@
+"""
+Модуль общего кеша иконок предметов.
+
+Содержит класс IconCache: одна поверхность на путь к изображению для всех
+экземпляров InventoryItem. Предмет берёт иконку через acquire и отпускает
+её при удалении (weakref.finalize), поэтому кеш знает число ссылок.
+Иконки без ссылок остаются в кеше (до ICON_CACHE["MAX_UNUSED"] штук,
+вытесняются самые давние) - предметы часто пересоздаются при загрузке
+сундуков и инвентаря, и сразу выгружать их иконки невыгодно.
+
+Для сеток сундука и инвентаря кеш хранит уменьшенные копии иконок
+(thumbnail) по ключу (путь, размер): smoothscale выполняется один раз,
+а не на каждый слот в каждом кадре. Уменьшенные копии удаляются вместе
+с иконкой, новый размер слота просто даёт новый ключ.
+"""
+
+import os
+from collections import OrderedDict
+
+import pygame
+
+from core.config import config
+from core.text_cache import text_cache
+
+
+class IconCache:
+    """
+    Кеш иконок предметов с подсчётом ссылок.
+    """
+
+    def __init__(self):
+        """Инициализация кеша."""
+        self.max_unused = config.ICON_CACHE.get("MAX_UNUSED", 32)
+        self._icons = {}  # путь -> поверхность
+        self._refs = {}  # путь -> число предметов с этой иконкой
+        self._unused = OrderedDict()  # пути без ссылок, от давних к недавним
+        self._thumbnails = {}  # (путь, (ширина, высота)) -> уменьшенная иконка
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "thumbnail_scales": 0}
+
+    def acquire(self, image_path: str, placeholder_size: int = 50) -> pygame.Surface | None:
+        """
+        Возвращает общую иконку и увеличивает число ссылок на неё.
+
+        Args:
+            image_path: Путь к файлу изображения.
+            placeholder_size: Сторона заглушки, если файла нет.
+
+        Returns:
+            Поверхность иконки (общая - не изменять) или None при ошибке загрузки.
+        """
+        icon = self._icons.get(image_path)
+        if icon is None:
+            self.stats["misses"] += 1
+            icon = self._load(image_path, placeholder_size)
+            if icon is None:
+                return None
+            self._icons[image_path] = icon
+        else:
+            self.stats["hits"] += 1
+            self._unused.pop(image_path, None)
+        self._refs[image_path] = self._refs.get(image_path, 0) + 1
+        return icon
+
+    def release(self, image_path: str):
+        """
+        Уменьшает число ссылок на иконку.
+
+        Иконка без ссылок переходит в список неиспользуемых и вытесняется,
+        когда их становится больше MAX_UNUSED.
+        """
+        refs = self._refs.get(image_path, 0) - 1
+        if refs > 0:
+            self._refs[image_path] = refs
+            return
+        self._refs.pop(image_path, None)
+        if image_path not in self._icons:
+            return
+        self._unused[image_path] = True
+        while len(self._unused) > self.max_unused:
+            path, _ = self._unused.popitem(last=False)
+            self._evict(path)
+
+    def clear_unused(self):
+        """Выгружает все иконки без ссылок."""
+        for path in self._unused:
+            self._evict(path)
+        self._unused.clear()
+
+    def thumbnail(self, image_path: str, size: tuple) -> pygame.Surface | None:
+        """
+        Возвращает иконку, уменьшенную под размер слота.
+
+        Args:
+            image_path: Путь иконки (она должна быть получена через acquire).
+            size: Размер (ширина, высота).
+
+        Returns:
+            Общая поверхность (не изменять) или None, если иконки нет в кеше.
+        """
+        key = (image_path, size)
+        thumb = self._thumbnails.get(key)
+        if thumb is None:
+            icon = self._icons.get(image_path)
+            if icon is None:
+                return None
+            thumb = pygame.transform.smoothscale(icon, size)
+            self._thumbnails[key] = thumb
+            self.stats["thumbnail_scales"] += 1
+        return thumb
+
+    def _evict(self, image_path: str):
+        """Удаляет иконку и её уменьшенные копии."""
+        del self._icons[image_path]
+        for key in [key for key in self._thumbnails if key[0] == image_path]:
+            del self._thumbnails[key]
+        self.stats["evictions"] += 1
+
+    def get_stats(self) -> dict:
+        """
+        Статистика кеша для отладочного вывода.
+
+        Returns:
+            Число иконок (всего и без ссылок), ссылок, уменьшенных копий,
+            занятая память в байтах, попадания, промахи (= декодирования
+            файлов), вытеснения и число вызовов smoothscale.
+        """
+        surfaces = list(self._icons.values()) + list(self._thumbnails.values())
+        return {
+            "icons": len(self._icons),
+            "unused": len(self._unused),
+            "refs": sum(self._refs.values()),
+            "thumbnails": len(self._thumbnails),
+            "bytes": sum(surface.get_pitch() * surface.get_height() for surface in surfaces),
+            **self.stats,
+        }
+
+    def _load(self, image_path: str, placeholder_size: int) -> pygame.Surface | None:
+        try:
+            if os.path.exists(image_path):
+                # Иконка загружается как есть: размер задаёт сам файл (например, 127x107)
+                return pygame.image.load(image_path).convert_alpha()
+
+            print(f"[ITEM WARNING] Файл не найден: {image_path}")
+            # Заглушка тоже кешируется, предупреждение выводится один раз
+            icon = pygame.Surface((placeholder_size, placeholder_size), pygame.SRCALPHA)
+            pygame.draw.rect(icon, (100, 100, 100, 200), (0, 0, placeholder_size, placeholder_size))
+            text = text_cache.render("?", 24, (255, 255, 255))
+            icon.blit(text, (placeholder_size // 2 - 5, placeholder_size // 2 - 10))
+            return icon
+        except Exception as e:
+            print(f"[ITEM ERROR] Ошибка загрузки {image_path}: {e}")
+            return None
+
+
+# Глобальный экземпляр
+icon_cache = IconCache()
@@ -8,6 +8,7 @@ from typing import Optional, List, Dict, Tuple, Any
 from level.player_stats import PlayerStats
 from core.config import config
 from UI.items import InventoryItem
+from core.text_cache import text_cache
 from UI.equipment_logic import recalculate_equipment_bonuses
 from items.items_loader import load_all_items, get_item, get_all_items, ITEMS_DATABASE
 
@@ -125,9 +126,6 @@ class Inventory:
         self._inventory_overlay_cache: Optional[pygame.Surface] = None
         self._inventory_overlay_cache_size: Optional[Tuple[int, int]] = None
         
-        # Кеш шрифтов для оптимизации производительности
-        self._font_cache: Dict[int, pygame.font.Font] = {}
-        
         # Категории для ползунка в ACS (больше не используются)
         self.acs_categories = ["Инвентарь", "Экипировка"]
         self.current_acs_category = 0  # Всегда показываем оба
@@ -336,6 +334,8 @@ class Inventory:
         # Сбрасываем текущие слоты
         self.inventory_slots = [None] * (self.inventory_cols * self.inventory_total_rows)
         self.equipment_slots = {slot_name: None for slot_name in self.equipment_slots}
+        # get_all_items возвращает копию базы - берём её один раз, а не на каждый слот
+        item_database = self._get_item_database()
 
         # Восстанавливаем слоты инвентаря
         for slot_info in data.get("inventory_slots", []):
@@ -349,7 +349,6 @@ class Inventory:
             if item_id is None or not (0 <= idx < len(self.inventory_slots)):
                 continue
 
-            item_database = self._get_item_database()
             item_data = item_database.get(item_id)
             if not item_data:
                 # Неизвестный предмет — пропускаем
@@ -385,7 +384,6 @@ class Inventory:
             if not item_id:
                 continue
 
-            item_database = self._get_item_database()
             item_data = item_database.get(item_id)
             if not item_data:
                 continue
@@ -690,7 +688,10 @@ class Inventory:
     def _capture_background(self):
         """Сохраняет скриншот фона и останавливает звуки."""
         game = getattr(self.player_stats, 'game', None)
-        if game and hasattr(game, 'virtual_screen'):
+        if game and hasattr(game, 'capture_scene'):
+            self.background = game.capture_scene()
+            self.acs_background = self.background.copy()
+        elif game and hasattr(game, 'virtual_screen'):
             self.background = game.virtual_screen.copy()
             self.acs_background = game.virtual_screen.copy()
         else:
@@ -1240,11 +1241,6 @@ class Inventory:
         # Получаем ВСЕ характеристики для отображения
         stats_display = self.player_stats.get_all_stats_display()
         
-        # Используем кешированный шрифт для оптимизации
-        if 28 not in self._font_cache:
-            self._font_cache[28] = pygame.font.Font(None, 28)
-        font = self._font_cache[28]
-        
         # Перевод названий на русский
         russian_names = {
             'health': 'Здоровье',
@@ -1272,7 +1268,7 @@ class Inventory:
         for i, (stat_name, value) in enumerate(stats_items[:7]):
             name = russian_names.get(stat_name, stat_name)
             stat_text = f"{name}: {value}"
-            stat_surface = font.render(stat_text, True, (220, 220, 240))
+            stat_surface = text_cache.render(stat_text, 28, (220, 220, 240))
             screen.blit(stat_surface, (base_x, base_y + i * line_spacing))
         
         # Профиль игрока
@@ -1281,12 +1277,8 @@ class Inventory:
             profile_y = config.VIRTUAL_WIDTH // 2 - 125
             screen.blit(self.inventory_profile, (profile_x, profile_y))
             
-            # Используем кешированный шрифт для оптимизации
-            if 32 not in self._font_cache:
-                self._font_cache[32] = pygame.font.Font(None, 32)
-            font_large = self._font_cache[32]
             nickname = "Алд"
-            text_surface = font_large.render(nickname, True, (255, 255, 255))
+            text_surface = text_cache.render(nickname, 32, (255, 255, 255))
             text_x = profile_x + (self.inventory_profile.get_width() - text_surface.get_width()) // 2
             text_y = profile_y + self.inventory_profile.get_height()
             screen.blit(text_surface, (text_x, text_y))
@@ -1317,10 +1309,6 @@ class Inventory:
         
         # Кнопки категорий
         button_width = slider_width // len(self.attribute_categories)
-        # Используем кешированный шрифт
-        if 22 not in self._font_cache:
-            self._font_cache[22] = pygame.font.Font(None, 22)
-        font = self._font_cache[22]
         
         for i, category in enumerate(self.attribute_categories):
             button_x = slider_x + i * button_width
@@ -1331,7 +1319,7 @@ class Inventory:
                 pygame.draw.rect(screen, (80, 80, 120, 200), button_rect)
             
             # Текст категории
-            text = font.render(category, True, (220, 220, 220))
+            text = text_cache.render(category, 22, (220, 220, 220))
             text_x = button_x + (button_width - text.get_width()) // 2
             text_y = slider_y + (slider_height - text.get_height()) // 2
             screen.blit(text, (text_x, text_y))
@@ -1344,11 +1332,6 @@ class Inventory:
     
     def _draw_attribute_buttons(self, screen):
         """Отрисовывает кнопки для прокачки атрибутов."""
-        # Используем кешированный шрифт
-        if 24 not in self._font_cache:
-            self._font_cache[24] = pygame.font.Font(None, 24)
-        font = self._font_cache[24]
-        
         # Позиции для атрибутов (под ползунком)
         start_x = config.VIRTUAL_WIDTH // 2 + 135
         start_y = config.VIRTUAL_HEIGHT // 2 - 125 + 240
@@ -1358,7 +1341,7 @@ class Inventory:
         
         # Отображаем очки прокачки
         points_text = f"Очки прокачки: {skill_points}"
-        points_surface = font.render(points_text, True, (255, 215, 0))
+        points_surface = text_cache.render(points_text, 24, (255, 215, 0))
         screen.blit(points_surface, (start_x, start_y - 30))
         
         # Определяем категорию для отображения
@@ -1386,7 +1369,7 @@ class Inventory:
             
             # Отображаем атрибут
             attr_text = attribute.get_display_value()
-            attr_surface = font.render(attr_text, True, (200, 200, 200))
+            attr_surface = text_cache.render(attr_text, 24, (200, 200, 200))
             screen.blit(attr_surface, (start_x, y_pos))
             
             # Кнопка "+" для прокачки (если есть очки и это не производный атрибут)
@@ -1397,7 +1380,7 @@ class Inventory:
                 pygame.draw.rect(screen, (60, 100, 60), button_rect)
                 pygame.draw.rect(screen, (100, 150, 100), button_rect, 2)
                 
-                plus_text = font.render("+", True, (220, 220, 220))
+                plus_text = text_cache.render("+", 24, (220, 220, 220))
                 screen.blit(plus_text, (start_x + 228, y_pos + 3))
                 
                 # Сохраняем кнопку для обработки кликов
@@ -1405,10 +1388,7 @@ class Inventory:
             elif attribute.category == "derived":
                 # Для производных атрибутов показываем информацию
                 info_text = "(Автоматически)"
-                # Используем кешированный шрифт
-                if 18 not in self._font_cache:
-                    self._font_cache[18] = pygame.font.Font(None, 18)
-                info_surface = self._font_cache[18].render(info_text, True, (150, 150, 150))
+                info_surface = text_cache.render(info_text, 18, (150, 150, 150))
                 screen.blit(info_surface, (start_x + 220, y_pos + 5))
     
     def _draw_attribute_tooltip(self, screen, attribute_name: str):
@@ -1424,10 +1404,6 @@ class Inventory:
         
         # Разбиваем текст на строки
         lines = tooltip_text.split('\n')
-        # Используем кешированный шрифт
-        if 22 not in self._font_cache:
-            self._font_cache[22] = pygame.font.Font(None, 22)
-        font = self._font_cache[22]
         
         # Вычисляем размеры подсказки
         max_width = 0
@@ -1435,7 +1411,7 @@ class Inventory:
         rendered_lines = []
         
         for line in lines:
-            text_surface = font.render(line, True, (220, 220, 220))
+            text_surface = text_cache.render(line, 22, (220, 220, 220))
             rendered_lines.append(text_surface)
             max_width = max(max_width, text_surface.get_width())
             total_height += text_surface.get_height() + 2
@@ -1639,10 +1615,6 @@ class Inventory:
         
         # Кнопки категорий
         button_width = slider_width // len(self.acs_categories)
-        # Используем кешированный шрифт
-        if 22 not in self._font_cache:
-            self._font_cache[22] = pygame.font.Font(None, 22)
-        font = self._font_cache[22]
         
         for i, category in enumerate(self.acs_categories):
             button_x = slider_x + i * button_width
@@ -1653,7 +1625,7 @@ class Inventory:
                 pygame.draw.rect(screen, (80, 80, 120, 200), button_rect)
             
             # Текст категории
-            text = font.render(category, True, (220, 220, 220))
+            text = text_cache.render(category, 22, (220, 220, 220))
             text_x = button_x + (button_width - text.get_width()) // 2
             text_y = slider_y + (slider_height - text.get_height()) // 2
             screen.blit(text, (text_x, text_y))
@@ -1678,10 +1650,6 @@ class Inventory:
         pygame.draw.rect(screen, (100, 100, 100), menu_rect, 1)
         
         # Опции меню
-        # Используем кешированный шрифт
-        if 24 not in self._font_cache:
-            self._font_cache[24] = pygame.font.Font(None, 24)
-        font = self._font_cache[24]
         mouse_pos = pygame.mouse.get_pos()
         
         for i, option in enumerate(self.context_menu["options"]):
@@ -1692,7 +1660,7 @@ class Inventory:
                 pygame.draw.rect(screen, (60, 60, 60), option_rect)
             
             # Текст опции
-            text = font.render(option, True, (220, 220, 220))
+            text = text_cache.render(option, 24, (220, 220, 220))
             text_x = menu_x + 10
             text_y = menu_y + i * option_height + (option_height - text.get_height()) // 2
             screen.blit(text, (text_x, text_y))
@@ -1,6 +1,8 @@
 import pygame
-import os
+import weakref
 from typing import Optional, Dict, Any, Tuple
+from UI.icon_cache import icon_cache
+from core.text_cache import text_cache
 
 class InventoryItem:
     """Класс для представления предмета в инвентаре."""
@@ -10,7 +12,6 @@ class InventoryItem:
     SLOT_SIZE = 50
     
     # Кеш для оптимизации производительности (класс-уровень)
-    _font_cache = {}
     _overlay_cache = {}
     _text_bg_cache = None
     
@@ -46,28 +47,39 @@ class InventoryItem:
         
         # Загружаем изображение
         self.image = None
+        self.image_path = None
+        self._icon_release = None
         if image_path:
             self.load_image(image_path)
     
     def load_image(self, image_path: str):
-        """Загружает и масштабирует изображение."""
-        try:
-            if os.path.exists(image_path):
-                # Загружаем изображение как есть, без дополнительного масштабирования.
-                # Размер иконки задаётся самим файлом (например, 127x107).
-                self.image = pygame.image.load(image_path).convert_alpha()
-            else:
-                print(f"[ITEM WARNING] Файл не найден: {image_path}")
-                # Создаем placeholder изображение
-                self.image = pygame.Surface((self.SLOT_SIZE, self.SLOT_SIZE), pygame.SRCALPHA)
-                pygame.draw.rect(self.image, (100, 100, 100, 200), 
-                               (0, 0, self.SLOT_SIZE, self.SLOT_SIZE))
-                font = pygame.font.Font(None, 24)
-                text = font.render("?", True, (255, 255, 255))
-                self.image.blit(text, (self.SLOT_SIZE//2-5, self.SLOT_SIZE//2-10))
-        except Exception as e:
-            print(f"[ITEM ERROR] Ошибка загрузки {image_path}: {e}")
-            self.image = None
+        """Берёт иконку из общего кеша (файл декодируется один раз на путь)."""
+        if self._icon_release is not None:
+            self._icon_release()
+            self._icon_release = None
+        self.image_path = image_path
+        self.image = icon_cache.acquire(image_path, self.SLOT_SIZE)
+        if self.image is not None:
+            # Ссылка на иконку отпускается, когда предмет удаляется сборщиком мусора
+            self._icon_release = weakref.finalize(self, icon_cache.release, image_path)
+    
+    def get_thumbnail(self, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """
+        Иконка, уменьшенная под размер слота (из общего кеша).
+
+        Args:
+            size: Размер (ширина, высота).
+
+        Returns:
+            Общая поверхность (не изменять) или None, если иконки нет.
+        """
+        if self.image is None:
+            return None
+        thumb = icon_cache.thumbnail(self.image_path, size) if self.image_path else None
+        if thumb is None:
+            # Иконка назначена в обход кеша - масштабируем без кеширования
+            thumb = pygame.transform.smoothscale(self.image, size)
+        return thumb
     
     def can_stack_with(self, other_item: 'InventoryItem') -> bool:
         """Можно ли сложить с другим предметом."""
@@ -85,6 +97,7 @@ class InventoryItem:
             name=self.name,
             description=self.description,
             item_type=self.type,
+            image_path=self.image_path,
             stats=self.stats.copy(),
             max_stack=self.max_stack,
             rarity=self.rarity,
@@ -94,8 +107,6 @@ class InventoryItem:
             origin=getattr(self, 'origin', []).copy() if hasattr(self, 'origin') else [],
             weapon_type=getattr(self, 'weapon_type', None)
         )
-        new_item.image = self.image  # Используем то же изображение
-        
         self.count -= amount
         new_item.count = amount
         
@@ -192,12 +203,7 @@ class InventoryItem:
     
     def _draw_count(self, surface: pygame.Surface, x: int, y: int, slot_w: int, slot_h: int):
         """Отрисовка количества предметов."""
-        # Используем кешированный шрифт
-        if 20 not in InventoryItem._font_cache:
-            InventoryItem._font_cache[20] = pygame.font.Font(None, 20)
-        font = InventoryItem._font_cache[20]
-        
-        count_text = font.render(str(self.count), True, (255, 255, 255))
+        count_text = text_cache.render(str(self.count), 20, (255, 255, 255))
         text_x = x + slot_w - 15
         text_y = y + slot_h - 20
         
@@ -2,6 +2,7 @@ import os
 import pygame
 from core.config import config
 from core.utils import load_image
+from core.text_cache import text_cache
 from .menu import Menu
 from .button import Button
 
@@ -193,7 +194,6 @@ class MusicSettingsMenu(Menu):
             img_rect.y = slider_y
             surface.blit(img, img_rect)
         if config.DEBUG_MODE:
-            font = pygame.font.Font(None, 24)
             levels = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
             hitboxes = self.slider_hitboxes.get(track_type, None)
             for idx, level in enumerate(levels):
@@ -203,7 +203,7 @@ class MusicSettingsMenu(Menu):
                     seg_w = slider_w // 11
                     seg_rect = pygame.Rect(slider_x + idx * seg_w, slider_y, seg_w, slider_h)
                 pygame.draw.rect(surface, (0, 255, 0, 80), seg_rect, 2)
-                text = font.render(str(level), True, (0, 255, 0))
+                text = text_cache.render(str(level), 24, (0, 255, 0))
                 text_rect = text.get_rect(center=seg_rect.center)
                 surface.blit(text, text_rect)
 
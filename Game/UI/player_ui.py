@@ -10,6 +10,7 @@ from typing import Optional, Tuple
 from level.player_stats import StatObserver, PlayerStats
 from core.config import config
 from UI.inventory import Inventory
+from core.text_cache import fonts, text_cache
 
 
 class PlayerUI(StatObserver):
@@ -66,9 +67,9 @@ class PlayerUI(StatObserver):
         self.debug_log_interval = 5.0  # секунды
         
         # Шрифты и цвета
-        self.font_small = pygame.font.Font(None, 20)
-        self.font_medium = pygame.font.Font(None, 24)
-        self.font_large = pygame.font.Font(None, 28)
+        self.font_small = fonts.get(20)
+        self.font_medium = fonts.get(24)
+        self.font_large = fonts.get(28)
         self.text_color = config.COLORS["WHITE"]
     
     def _load_game_bar_image(self) -> Optional[pygame.Surface]:
@@ -156,7 +157,7 @@ class PlayerUI(StatObserver):
             return
         
         damage_text = f"-{int(damage)}"
-        text_surface = self.font_large.render(damage_text, True, (255, 0, 0))
+        text_surface = text_cache.render(damage_text, 28, (255, 0, 0))
         
         text_x = position[0] - text_surface.get_width() // 2
         text_y = position[1] - text_surface.get_height() // 2
@@ -169,7 +170,7 @@ class PlayerUI(StatObserver):
             return
         
         heal_text = f"+{int(heal)}"
-        text_surface = self.font_large.render(heal_text, True, (0, 255, 0))
+        text_surface = text_cache.render(heal_text, 28, (0, 255, 0))
         
         text_x = position[0] - text_surface.get_width() // 2
         text_y = position[1] - text_surface.get_height() // 2
@@ -184,7 +185,7 @@ class PlayerUI(StatObserver):
         self.screen.blit(overlay, (0, 0))
         
         death_text = "YOU DIED"
-        text_surface = self.font_large.render(death_text, True, (255, 0, 0))
+        text_surface = text_cache.render(death_text, 28, (255, 0, 0))
         
         text_x = (self.screen.get_width() - text_surface.get_width()) // 2
         text_y = (self.screen.get_height() - text_surface.get_height()) // 2
@@ -192,7 +193,7 @@ class PlayerUI(StatObserver):
         self.screen.blit(text_surface, (text_x, text_y))
         
         instruction_text = "Press R to respawn"
-        instruction_surface = self.font_medium.render(instruction_text, True, self.text_color)
+        instruction_surface = text_cache.render(instruction_text, 24, self.text_color)
         
         instruction_x = (self.screen.get_width() - instruction_surface.get_width()) // 2
         instruction_y = text_y + text_surface.get_height() + 20
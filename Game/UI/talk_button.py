@@ -6,7 +6,6 @@
 """
 
 import time
-import pygame
 
 
 class TalkButton:
@@ -43,32 +42,25 @@ class TalkButton:
 
         in_zone = False
 
-        if not self.game.player or not self.game.interactive_objects:
+        if not self.game.player or not self.game.interaction_zones:
             self.game.talk_button_target_alpha = 0
             self.game.talk_button_enter_time = None
             return
 
-        player_rect = self.game.player.hitbox
+        # Зоны построены при загрузке карты; проверяются только соседние по сетке
+        zone = self.game.interaction_zones.find(self.game.player.hitbox)
+        if zone is not None:
+            obj = zone.obj
+            in_zone = True
 
-        for obj in self.game.interactive_objects:
-            obj_rect = pygame.Rect(int(obj.x), int(obj.y),
-                                   int(obj.width), int(obj.height))
-            npc_type = obj.properties.get('interactive_type', '').lower()
+            if (self.game.active_npc_obj != obj and
+                    self.game.show_dialogue):
+                self.game.show_dialogue = False
+                self.game.dialogue_text = ""
+                self.game.dialogue_text_shown = ""
+                self.game.active_npc_obj = None
 
-            if ((npc_type == 'the guard' or npc_type == 'royal_guard') or
-                npc_type == 'doors' or npc_type == 'king' or npc_type == 'chest') and \
-                    player_rect.colliderect(obj_rect.inflate(10, 10)):
-                in_zone = True
-
-                if (self.game.active_npc_obj != obj and
-                        self.game.show_dialogue):
-                    self.game.show_dialogue = False
-                    self.game.dialogue_text = ""
-                    self.game.dialogue_text_shown = ""
-                    self.game.active_npc_obj = None
-
-                self.game.active_npc_obj = obj
-                break
+            self.game.active_npc_obj = obj
 
         now = time.time()
 
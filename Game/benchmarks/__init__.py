@@ -0,0 +1,10 @@
+"""
+Пакет бенчмарков игры.
+
+Скрипты запускаются напрямую из корня репозитория, например:
+    python Game/benchmarks/bench_level_load.py
+
+Все бенчмарки работают без окна (SDL dummy-драйверы) и печатают
+результаты в консоль. bench_game_loop.py прогоняет настоящий GameLoop
+и дополнительно сохраняет результаты в JSON для сравнения между коммитами.
+"""
@@ -0,0 +1,98 @@
+"""
+Бенчмарк общего атласа кадров анимаций игрока.
+
+Снимает и надевает оружие N раз (Player.reload_animations с поддельным
+инвентарём; первый проход с холодными кадрами атаки, второй - с тёплым
+атласом) и сравнивает с прежней загрузкой анимаций: на каждую смену
+экипировки - pygame.image.load каждого спрайтшита и новая поверхность
+на каждый кадр. Затем создаётся второй Player и проверяется, что кадры
+у двух игроков - одни и те же поверхности.
+
+Запуск:
+    python Game/benchmarks/bench_animation_atlas.py [--toggles 20]
+"""
+
+import argparse
+from types import SimpleNamespace
+
+from common import patch_asset_case, setup_environment, timed
+
+config = setup_environment()
+patch_asset_case()
+
+import pygame  # noqa: E402
+from core.pathutils import resource_path  # noqa: E402
+from level.animation_atlas import animation_atlas  # noqa: E402
+from level.player import Player  # noqa: E402
+from UI.items import InventoryItem  # noqa: E402
+
+ATTACKS_PATH = "Game/assets/Sprites/player/armed/Attacks.png"
+
+
+def load_legacy(armed):
+    """Прежняя загрузка: спрайтшиты с диска и новая поверхность на кадр."""
+    frame_w, frame_h = config.FRAME_SIZE
+    frames = 0
+    for params in config.PLAYER_STATES.values():
+        sheet = pygame.image.load(resource_path(params["sprite_sheet"])).convert_alpha()
+        for x, y in params["frames"]:
+            frame = pygame.Surface((frame_w, frame_h), pygame.SRCALPHA)
+            frame.blit(sheet, (0, 0), (x, y, frame_w, frame_h))
+            frames += 1
+    if armed:
+        sheet = pygame.image.load(resource_path(ATTACKS_PATH)).convert_alpha()
+        per_row = sheet.get_width() // frame_w
+        for index in range(40):
+            frame = pygame.Surface((frame_w, frame_h), pygame.SRCALPHA)
+            frame.blit(sheet, (0, 0), ((index % per_row) * frame_w, (index // per_row) * frame_h,
+                                       frame_w, frame_h))
+            frames += 1
+    return frames
+
+
+def make_game():
+    """Поддельная игра: у Player есть доступ к инвентарю через player_ui."""
+    inventory = SimpleNamespace(equipment_slots={})
+    return SimpleNamespace(player_ui=SimpleNamespace(inventory=inventory), camera=None), inventory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--toggles", type=int, default=20, help="Сколько раз менять экипировку")
+    args = parser.parse_args()
+
+    sword = InventoryItem("bench_sword", "Меч", item_type="weapon")
+    game, inventory = make_game()
+
+    def toggle_legacy():
+        for index in range(args.toggles):
+            load_legacy(armed=index % 2 == 0)
+
+    cold_time, player = timed(Player, 0, 0, game=game)
+
+    def toggle_atlas():
+        for index in range(args.toggles):
+            inventory.equipment_slots = {"Правая рука": sword} if index % 2 == 0 else {}
+            player.reload_animations()
+
+    legacy_time, _ = timed(toggle_legacy)
+    # Первое надевание оружия вырезает кадры атаки - дальше только поиск в атласе
+    first_time, _ = timed(toggle_atlas)
+    atlas_time, _ = timed(toggle_atlas)
+    stats = animation_atlas.get_stats()
+    print(f"Player() с холодным атласом: {cold_time * 1000:.2f}ms")
+    print(f"Смена экипировки x{args.toggles}:")
+    print(f"  legacy {legacy_time * 1000 / args.toggles:>8.3f}ms/смена")
+    print(f"  atlas  {first_time * 1000 / args.toggles:>8.3f}ms/смена (первый проход, кадры атаки вырезаются)")
+    print(f"  atlas  {atlas_time * 1000 / args.toggles:>8.3f}ms/смена (x{legacy_time / atlas_time:.0f})")
+    print(f"Атлас: sheets={stats['sheets']} (загрузок {stats['sheet_loads']}) frames={stats['frames']} "
+          f"hit/miss {stats['frame_hits']}/{stats['frame_misses']} memory={stats['bytes'] / 1024 / 1024:.1f}MB")
+
+    other = Player(0, 0, game=make_game()[0])
+    shared = all(a is b for a, b in zip(player._animations["idle_front"]["frames"],
+                                        other._animations["idle_front"]["frames"]))
+    print(f"Второй Player использует те же кадры: {shared}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Микробенчмарк broadphase для CollisionHandler.check_collision.
+
+Сравнивает полный перебор списка объектов коллизий с запросом через
+пространственную сетку (CollisionObjects) на 100, 10k и 100k
+прямоугольниках. Плотность объектов на карте постоянна, поэтому время
+запроса через сетку не должно расти с их количеством.
+
+Запуск:
+    python Game/benchmarks/bench_collision_broadphase.py [--counts 100 10000 100000]
+"""
+
+import argparse
+import math
+import random
+import time
+
+from common import setup_environment
+
+config = setup_environment(init_display=False)
+
+import pygame  # noqa: E402
+from level.collisions import CollisionHandler, CollisionObjects  # noqa: E402
+
+HITBOX_SIZE = (config.PLAYER_HITBOX["WIDTH"], config.PLAYER_HITBOX["HEIGHT"])
+
+
+def make_objects(count, rng):
+    side = int(math.sqrt(count) * 96)
+    objects = []
+    for _ in range(count):
+        rect = pygame.Rect(rng.randrange(side), rng.randrange(side),
+                           rng.randrange(16, 64), rng.randrange(16, 64))
+        objects.append({'rect': rect, 'type': "solid", 'properties': {}})
+    return objects, side
+
+
+def make_queries(count, side, rng):
+    return [pygame.Rect(rng.randrange(side), rng.randrange(side), *HITBOX_SIZE) for _ in range(count)]
+
+
+def run_queries(handler, queries, collision_objects):
+    start = time.perf_counter()
+    hits = 0
+    for rect in queries:
+        if handler.check_collision(rect, collision_objects) is not None:
+            hits += 1
+    return time.perf_counter() - start, hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--counts", type=int, nargs="*", default=[100, 10_000, 100_000],
+                        help="Количество прямоугольников коллизий")
+    parser.add_argument("--queries", type=int, default=20_000, help="Запросов к сетке")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    handler = CollisionHandler()
+    print(f"cell={config.COLLISION_SETTINGS['GRID_CELL_SIZE']}px hitbox={HITBOX_SIZE[0]}x{HITBOX_SIZE[1]}")
+    for count in args.counts:
+        rng = random.Random(args.seed)
+        objects, side = make_objects(count, rng)
+
+        start = time.perf_counter()
+        indexed = CollisionObjects(objects)
+        build_time = time.perf_counter() - start
+
+        # Полный перебор дорог, поэтому для больших карт берём меньше запросов
+        list_queries = make_queries(max(50, min(args.queries, 2_000_000 // count)), side, rng)
+        grid_queries = make_queries(args.queries, side, rng)
+
+        for rect in list_queries:
+            assert handler.check_collision(rect, objects) is handler.check_collision(rect, indexed)
+
+        list_time, _ = run_queries(handler, list_queries, objects)
+        grid_time, hits = run_queries(handler, grid_queries, indexed)
+        list_us = list_time * 1e6 / len(list_queries)
+        grid_us = grid_time * 1e6 / len(grid_queries)
+        print(f"rects={count:>7} build={build_time * 1000:>8.1f}ms "
+              f"list={list_us:>10.2f}us/query grid={grid_us:>6.2f}us/query "
+              f"speedup=x{list_us / max(grid_us, 1e-9):.0f} hit_rate={hits / len(grid_queries):.1%}")
+
+
+if __name__ == "__main__":
+    main()
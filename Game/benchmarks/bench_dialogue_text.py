@@ -0,0 +1,84 @@
+"""
+Бенчмарк вывода реплики с эффектом печатной машинки.
+
+Реплика печатается по символу за кадр (как Game._update_typewriter_text
+при 40 символах в секунду и 60 FPS - с запасом), на каждом кадре текст
+выводится в панель диалога. Сравниваются:
+- render - прежний вывод: font.render всей показанной части одной
+  строкой в каждом кадре (длинная реплика вылезает за панель);
+- wrap+render - перенос по словам и font.render строк в каждом кадре;
+- layout - DialogueTextLayout: раскладка один раз, дальше blit видимой
+  части готовых строк.
+В конце проверяется, что полностью напечатанная однострочная реплика
+совпадает попиксельно с прежним выводом.
+
+Запуск:
+    python Game/benchmarks/bench_dialogue_text.py [--frames-per-char 2]
+"""
+
+import argparse
+
+from common import setup_environment, timed
+
+config = setup_environment()
+
+import pygame  # noqa: E402
+from core.dialogue_panel import DialogueTextLayout  # noqa: E402
+from core.text_cache import fonts  # noqa: E402
+
+TEXT = ("Королевство в опасности, герой. С севера идут войска тёмного лорда, "
+        "а стража не справляется даже с разбойниками на дорогах. "
+        "Возьми мой меч и отправляйся к старой крепости.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames-per-char", type=int, default=2, help="Кадров на один символ")
+    args = parser.parse_args()
+
+    font = fonts.get(config.DIALOGUE_PANEL["FONT_SIZE"], "Arial")
+    color = config.DIALOGUE_PANEL["FONT_COLOR"]
+    target = pygame.Surface((480, 400))
+    frames = [index // args.frames_per_char + 1 for index in range(len(TEXT) * args.frames_per_char)]
+
+    def draw_render():
+        for shown in frames:
+            target.blit(font.render(TEXT[:shown], True, color), (30, 40))
+
+    layout = DialogueTextLayout(font, color, 420)
+
+    def draw_wrap_render():
+        for shown in frames:
+            y = 40
+            for start, end in layout._wrap(TEXT[:shown]):
+                target.blit(font.render(TEXT[start:end], True, color), (30, y))
+                y += font.get_linesize()
+
+    def draw_layout():
+        layout.set_text(TEXT)
+        for shown in frames:
+            layout.draw(target, (30, 40), shown)
+
+    render_time, _ = timed(draw_render)
+    wrap_time, _ = timed(draw_wrap_render)
+    layout_time, _ = timed(draw_layout)
+    print(f"Реплика: {len(TEXT)} символов, строк после переноса: {len(layout.lines)}, кадров: {len(frames)}")
+    print(f"render      {render_time * 1e6 / len(frames):>8.1f}us/кадр")
+    print(f"wrap+render {wrap_time * 1e6 / len(frames):>8.1f}us/кадр")
+    print(f"layout      {layout_time * 1e6 / len(frames):>8.1f}us/кадр (x{wrap_time / layout_time:.1f} к wrap+render, "
+          f"раскладок: {layout.layouts})")
+
+    short = "Добро пожаловать, герой."
+    expected = pygame.Surface((480, 60))
+    actual = pygame.Surface((480, 60))
+    expected.blit(font.render(short, True, color), (0, 0))
+    check = DialogueTextLayout(font, color, 420)
+    check.set_text(short)
+    check.draw(actual, (0, 0), len(short))
+    if pygame.image.tobytes(expected, "RGB") != pygame.image.tobytes(actual, "RGB"):
+        raise SystemExit("Ошибка: вывод раскладки не совпадает с font.render")
+    print("Проверка: однострочная реплика совпадает с font.render")
+
+
+if __name__ == "__main__":
+    main()
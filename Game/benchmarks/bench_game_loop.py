@@ -0,0 +1,229 @@
+"""
+Headless-бенчмарк настоящего игрового цикла.
+
+Создаёт Game без окна (SDL dummy-драйверы), по очереди загружает карты
+Royal_one.tmx и Audience Hall .tmx и на каждой проигрывает сценарий ввода
+через GameLoop.step с фиксированным dt. Зажатые клавиши подменяются через
+core.input_state, нажатия отправляются в очередь событий pygame.
+
+Результат - JSON для сравнения между коммитами (например, на CI без GPU):
+время загрузки карт (холодной - с очищенными кешем карт и предзагрузкой,
+и повторной - из кеша), перцентили времени кадра и фаз (FrameProfiler),
+худший кадр, статистика частичной перерисовки, чанков и способов вывода,
+пиковая память процесса (и Python-кучи с --tracemalloc).
+
+Сценарий по умолчанию - DEFAULT_TRACE; свой можно передать файлом JSON
+со списком шагов {"frame": N, "hold": [...], "release": [...], "tap": [...]},
+где клавиши - имена pygame ("d", "s", "i", "escape").
+
+Запуск:
+    python Game/benchmarks/bench_game_loop.py [--output bench_game_loop.json]
+        [--trace trace.json] [--dt 0.016667] [--tracemalloc]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from common import ROOT_DIR, patch_asset_case, setup_environment
+
+config = setup_environment(init_display=False)
+patch_asset_case()
+
+import pygame  # noqa: E402
+import game as game_module  # noqa: E402
+from core.input_state import input_state  # noqa: E402
+from core.level_cache import level_cache  # noqa: E402
+from core.level_preloader import level_preloader  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MAPS = (
+    "Game/assets/Tiles/Royal_one.tmx",
+    "Game/assets/Tiles/Audience Hall .tmx",
+)
+
+# Обход по кругу, диагональ и открытие/закрытие инвентаря
+DEFAULT_TRACE = [
+    {"frame": 30, "hold": ["d"]},
+    {"frame": 150, "release": ["d"], "hold": ["s"]},
+    {"frame": 270, "release": ["s"], "hold": ["a"]},
+    {"frame": 390, "release": ["a"], "hold": ["w"]},
+    {"frame": 510, "release": ["w"]},
+    {"frame": 540, "tap": ["i"]},
+    {"frame": 600, "tap": ["i"]},
+    {"frame": 630, "hold": ["d", "s"]},
+    {"frame": 690, "release": ["d", "s"]},
+    {"frame": 720},
+]
+
+
+def _key_code(name: str) -> int:
+    return pygame.key.key_code(name)
+
+
+def _post_tap(key: int):
+    """Отправляет нажатие и отпускание клавиши в очередь событий."""
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+
+
+def _peak_rss_kb():
+    """Пиковый RSS процесса в КБ (None, если недоступно)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS отдаёт байты, Linux - килобайты
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_trace(game, loop, trace, dt):
+    """Проигрывает сценарий ввода на текущей карте.
+
+    Returns:
+        Число выполненных кадров
+    """
+    steps = {}
+    for entry in trace:
+        steps.setdefault(entry["frame"], []).append(entry)
+    total = max(steps) if steps else 0
+
+    input_state.set_override(True)
+    try:
+        for frame in range(total):
+            for entry in steps.get(frame, ()):
+                for name in entry.get("release", ()):
+                    input_state.release(_key_code(name))
+                for name in entry.get("hold", ()):
+                    input_state.press(_key_code(name))
+                for name in entry.get("tap", ()):
+                    _post_tap(_key_code(name))
+            loop.step(dt)
+    finally:
+        input_state.set_override(False)
+    return total
+
+
+def bench_map(game, loop, map_path, trace, dt):
+    """Загружает карту, проигрывает сценарий и собирает статистику."""
+    game.game_state_manager.change_state("new_game", None)
+    game.game_state_manager.cancel_transition()  # fade из главного меню не нужен
+    python_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+    # Холодная загрузка: карта не должна браться из кеша или из предзагрузки,
+    # подготовленной во время сценария предыдущей карты
+    level_preloader.clear()
+    level_cache.clear()
+    start = time.perf_counter()
+    game.load_new_map(map_path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    # Повторная загрузка той же карты - из кеша карт
+    start = time.perf_counter()
+    game.load_new_map(map_path)
+    warm_load_ms = (time.perf_counter() - start) * 1000
+
+    game.profiler.reset()
+    game.presenter.timings = {path: type(samples)(maxlen=samples.maxlen)
+                              for path, samples in game.presenter.timings.items()}
+    loop.dirty_tracker.reset()
+    loop.dirty_tracker.stats = {key: 0 for key in loop.dirty_tracker.stats}
+
+    start = time.perf_counter()
+    frames = run_trace(game, loop, trace, dt)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    profile = game.profiler.get_stats()
+    result = {
+        "load_ms": load_ms,
+        "warm_load_ms": warm_load_ms,
+        "frames": frames,
+        "wall_ms": wall_ms,
+        "frame_ms": profile.get("frame"),
+        "phases_ms": profile.get("phases"),
+        "worst_frame": profile.get("worst"),
+        "dirty_rects": dict(loop.dirty_tracker.stats),
+        "present": game.presenter.get_timings(),
+        "chunks": game.level_renderer.get_stats() if game.level_renderer else None,
+        "memory": {"peak_rss_kb": _peak_rss_kb()},
+    }
+    if python_before is not None:
+        current, peak = tracemalloc.get_traced_memory()
+        result["memory"].update({"python_current_kb": current // 1024,
+                                 "python_peak_kb": peak // 1024,
+                                 "python_delta_kb": (current - python_before) // 1024})
+        tracemalloc.reset_peak()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default="bench_game_loop.json",
+                        help="Куда сохранить JSON с результатами")
+    parser.add_argument("--trace", help="JSON-файл со сценарием ввода")
+    parser.add_argument("--dt", type=float, default=1 / 60,
+                        help="Фиксированная длительность кадра в секундах")
+    parser.add_argument("--maps", nargs="+", default=list(MAPS))
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Замерять память Python (заметно замедляет кадры)")
+    args = parser.parse_args()
+
+    trace = DEFAULT_TRACE
+    if args.trace:
+        with open(args.trace, "r", encoding="utf-8") as f:
+            trace = json.load(f)
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    game = game_module.Game()
+    init_ms = (time.perf_counter() - start) * 1000
+    loop = game_module.GameLoop(game)
+
+    results = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "video_driver": pygame.display.get_driver(),
+            "dt": args.dt,
+            "present_mode": game.presenter.mode,
+            "trace_frames": max((entry["frame"] for entry in trace), default=0),
+        },
+        "game_init_ms": init_ms,
+        "maps": {},
+    }
+    for map_path in args.maps:
+        name = os.path.splitext(os.path.basename(map_path))[0].strip()
+        results["maps"][name] = bench_map(game, loop, map_path, trace, args.dt)
+        stats = results["maps"][name]
+        frame = stats["frame_ms"] or {}
+        print(f"{name:<16} load {stats['load_ms']:8.1f} мс (из кеша {stats['warm_load_ms']:5.1f}) | кадр p50 {frame.get('p50', 0):6.2f} "
+              f"p95 {frame.get('p95', 0):6.2f} p99 {frame.get('p99', 0):6.2f} "
+              f"max {frame.get('max', 0):6.2f} мс | RSS {stats['memory']['peak_rss_kb']} КБ")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"Результаты сохранены: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Бенчмарк общего кеша иконок предметов.
+
+Заполняет все 128 слотов ACS-инвентаря через Inventory.load_from_dict
+(как при загрузке сохранения) и печатает время загрузки, число
+декодирований PNG (промахи кеша) и память иконок. Второй проход
+показывает загрузку с тёплым кешем, затем проверяется вытеснение иконок
+без ссылок.
+
+Отдельно замеряется отрисовка иконок сетки сундука (24 слота + 32 слота
+инвентаря): smoothscale в каждом кадре против общих уменьшенных копий.
+
+Запуск:
+    python Game/benchmarks/bench_icon_cache.py [--repeat 5]
+"""
+
+import argparse
+import gc
+
+from common import patch_asset_case, setup_environment, timed
+
+config = setup_environment()
+patch_asset_case()
+
+import pygame  # noqa: E402
+from items.items_loader import load_all_items  # noqa: E402
+from level.player_stats import PlayerStats  # noqa: E402
+from UI.icon_cache import icon_cache  # noqa: E402
+from UI.inventory import Inventory  # noqa: E402
+
+
+def build_inventory_data(slot_count, item_ids):
+    return {
+        "inventory_slots": [{"slot_index": index, "id": item_ids[index % len(item_ids)], "count": 1}
+                            for index in range(slot_count)],
+        "equipment_slots": {},
+    }
+
+
+def bench_thumbnails(items, frames, size=(60, 60)):
+    """Кадры сетки сундука: прежний smoothscale на слот против get_thumbnail."""
+    target = pygame.Surface((1280, 720), pygame.SRCALPHA)
+
+    def draw(get_image):
+        for _ in range(frames):
+            for index, item in enumerate(items):
+                target.blit(get_image(item), ((index % 8) * 70, (index // 8) * 70))
+
+    scale_time, _ = timed(draw, lambda item: pygame.transform.smoothscale(item.image, size))
+    cached_time, _ = timed(draw, lambda item: item.get_thumbnail(size))
+    print(f"thumbnails {len(items)} слотов x {frames} кадров: smoothscale {scale_time * 1000 / frames:.3f}ms/кадр, "
+          f"кеш {cached_time * 1000 / frames:.3f}ms/кадр, "
+          f"вызовов smoothscale в кеше {icon_cache.get_stats()['thumbnail_scales']}")
+
+
+def print_stats(label, elapsed):
+    stats = icon_cache.get_stats()
+    print(f"{label:<10} {elapsed * 1000:>8.2f}ms decodes={stats['misses']:>4} hits={stats['hits']:>5} "
+          f"icons={stats['icons']:>3} unused={stats['unused']:>3} refs={stats['refs']:>4} "
+          f"memory={stats['bytes'] / 1024:.1f}KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Повторы загрузки с тёплым кешем")
+    args = parser.parse_args()
+
+    item_ids = sorted(load_all_items())
+    inventory = Inventory(pygame.display.get_surface(), PlayerStats())
+    data = build_inventory_data(len(inventory.inventory_slots), item_ids)
+    print(f"Слотов: {len(inventory.inventory_slots)}, разных предметов: {len(item_ids)}")
+
+    icon_cache.clear_unused()
+    gc.collect()
+    elapsed, _ = timed(inventory.load_from_dict, data)
+    print_stats("cold", elapsed)
+    elapsed, _ = timed(inventory.load_from_dict, data, repeat=args.repeat)
+    print_stats("warm", elapsed)
+    bench_thumbnails(inventory.inventory_slots[:56], frames=100)
+
+    inventory.load_from_dict({})
+    gc.collect()
+    print_stats("released", 0.0)
+    icon_cache.clear_unused()
+    print_stats("evicted", 0.0)
+
+
+if __name__ == "__main__":
+    main()
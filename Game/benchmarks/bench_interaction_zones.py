@@ -0,0 +1,95 @@
+"""
+Микробенчмарк поиска зоны взаимодействия для TalkButton.
+
+Сравнивает прежний поиск (перебор всех интерактивных объектов: Rect,
+inflate и lower() на каждый объект в каждом кадре) с InteractionZones
+(зоны построены один раз, в кадре - запрос к сетке по хитбоксу игрока)
+на 100, 1000 и 10000 объектах: NPC, дверях, сундуках и объектах без
+кнопки. Результаты обоих способов сверяются.
+
+Запуск:
+    python Game/benchmarks/bench_interaction_zones.py [--counts 100 1000 10000]
+"""
+
+import argparse
+import math
+import random
+import time
+from types import SimpleNamespace
+
+from common import setup_environment
+
+config = setup_environment(init_display=False)
+
+import pygame  # noqa: E402
+from level.interaction_zones import InteractionZones  # noqa: E402
+
+HITBOX_SIZE = (config.PLAYER_HITBOX["WIDTH"], config.PLAYER_HITBOX["HEIGHT"])
+TYPES = ("the guard", "royal_guard", "King", "doors", "chest", "sign")
+
+
+def make_objects(count, rng):
+    side = int(math.sqrt(count) * 160)
+    objects = []
+    for _ in range(count):
+        objects.append(SimpleNamespace(
+            x=float(rng.randrange(side)), y=float(rng.randrange(side)),
+            width=float(rng.randrange(16, 64)), height=float(rng.randrange(16, 64)),
+            properties={'interactive': True, 'interactive_type': rng.choice(TYPES)}))
+    return objects, side
+
+
+def find_legacy(objects, player_rect):
+    """Прежний цикл TalkButton.update_talk_button_state."""
+    for obj in objects:
+        obj_rect = pygame.Rect(int(obj.x), int(obj.y), int(obj.width), int(obj.height))
+        npc_type = obj.properties.get('interactive_type', '').lower()
+        if ((npc_type == 'the guard' or npc_type == 'royal_guard') or
+            npc_type == 'doors' or npc_type == 'king' or npc_type == 'chest') and \
+                player_rect.colliderect(obj_rect.inflate(10, 10)):
+            return obj
+    return None
+
+
+def timed_queries(find, queries):
+    start = time.perf_counter()
+    hits = sum(1 for rect in queries if find(rect) is not None)
+    return (time.perf_counter() - start) * 1e6 / len(queries), hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--counts", type=int, nargs="*", default=[100, 1_000, 10_000],
+                        help="Количество интерактивных объектов")
+    parser.add_argument("--queries", type=int, default=20_000, help="Запросов (кадров)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"cell={config.INTERACTION_ZONES['GRID_CELL_SIZE']}px hitbox={HITBOX_SIZE[0]}x{HITBOX_SIZE[1]}")
+    for count in args.counts:
+        rng = random.Random(args.seed)
+        objects, side = make_objects(count, rng)
+
+        start = time.perf_counter()
+        zones = InteractionZones(objects)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Перебор дорог, поэтому для больших карт берём меньше запросов
+        legacy_queries = [pygame.Rect(rng.randrange(side), rng.randrange(side), *HITBOX_SIZE)
+                          for _ in range(max(50, min(args.queries, 2_000_000 // count)))]
+        grid_queries = [pygame.Rect(rng.randrange(side), rng.randrange(side), *HITBOX_SIZE)
+                        for _ in range(args.queries)]
+
+        for rect in legacy_queries:
+            zone = zones.find(rect)
+            assert find_legacy(objects, rect) is (zone.obj if zone else None)
+
+        legacy_us, _ = timed_queries(lambda rect: find_legacy(objects, rect), legacy_queries)
+        grid_us, hits = timed_queries(zones.find, grid_queries)
+        print(f"objects={count:>6} zones={len(zones):>6} build={build_ms:>6.1f}ms "
+              f"legacy={legacy_us:>9.2f}us/frame grid={grid_us:>5.2f}us/frame "
+              f"speedup=x{legacy_us / max(grid_us, 1e-9):.0f} in_zone={hits / len(grid_queries):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Бенчмарк переходов через двери с кешем карт.
+
+Создаёт Game без окна и N раз ходит туда и обратно между Royal_one.tmx
+и Audience Hall .tmx через Game.load_new_map (как DoorInteractionHandler).
+Сравниваются:
+- без кеша - прежнее поведение: кеш карт очищается перед каждым
+  переходом, игрок, UI и камера создаются заново;
+- с кешем - первый заход на карту (холодный) и возвраты (тёплые).
+Проверяется, что игрок и инвентарь при переходах не пересоздаются.
+Фоновая подготовка карт за дверями отключена, чтобы мерить только кеш
+(её эффект - bench_level_preload.py).
+
+Запуск:
+    python Game/benchmarks/bench_level_cache.py [--trips 5]
+"""
+
+import argparse
+import time
+
+from common import patch_asset_case, setup_environment
+
+config = setup_environment(init_display=False)
+patch_asset_case()
+
+import game as game_module  # noqa: E402
+from core.level_cache import level_cache  # noqa: E402
+from core.level_preloader import level_preloader  # noqa: E402
+
+MAPS = (
+    "Game/assets/Tiles/Royal_one.tmx",
+    "Game/assets/Tiles/Audience Hall .tmx",
+)
+
+
+def load_uncached(game, map_path):
+    """Прежний переход: карта разбирается заново, игрок создаётся заново."""
+    level_cache.clear()
+    config.LEVEL_MAP_PATH = map_path
+    game.game_resources.load_game_resources()
+
+
+def timed_trips(load, game, trips):
+    """Время каждого перехода в мс, по картам."""
+    times = {path: [] for path in MAPS}
+    for _ in range(trips):
+        for path in MAPS:
+            start = time.perf_counter()
+            load(game, path)
+            times[path].append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trips", type=int, default=5, help="Сколько раз сходить туда и обратно")
+    args = parser.parse_args()
+
+    level_preloader.enabled = False
+    game = game_module.Game()
+    game.game_state_manager.change_state("new_game", None)
+    game.game_state_manager.cancel_transition()  # fade из главного меню не нужен
+
+    uncached = timed_trips(load_uncached, game, args.trips)
+    level_cache.clear()
+    player, inventory = game.player, game.player_ui.inventory
+    cached = timed_trips(lambda g, path: g.load_new_map(path), game, args.trips)
+
+    print(f"Переходов: {args.trips * len(MAPS)}")
+    for path in MAPS:
+        name = path.rsplit("/", 1)[-1]
+        before = sum(uncached[path]) / len(uncached[path])
+        cold = cached[path][0]
+        warm = sum(cached[path][1:]) / max(1, len(cached[path]) - 1)
+        print(f"{name:<22} без кеша {before:>8.1f}ms | холодный {cold:>8.1f}ms | "
+              f"тёплый {warm:>6.2f}ms (x{before / warm:.0f})")
+
+    stats = level_cache.get_stats()
+    print(f"Кеш: карт {stats['levels']}, {stats['bytes'] / 1024 / 1024:.1f}MB, "
+          f"hit/miss {stats['hits']}/{stats['misses']}, вытеснений {stats['evictions']}")
+    print(f"Игрок и инвентарь те же: {game.player is player and game.player_ui.inventory is inventory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Бенчмарк загрузки уровня: парсинг TMX и запекание чанков LevelRenderer.
+
+Прогоняет реальные карты (Royal_one.tmx, Audience Hall .tmx) и синтетические
+квадратные карты растущего размера вплоть до 512x512. Для небольших карт
+дополнительно замеряется старый алгоритм (полный перебор слоёв на каждый
+чанк), чтобы было видно переход от O(тайлы * чанки) к O(тайлы).
+
+Для потокового режима (config.LEVEL_STREAMING) камера проезжает по
+синтетической карте змейкой, а в конце печатаются счётчики LevelRenderer:
+попадания, промахи, время запекания и занятая чанками память.
+
+Запуск:
+    python Game/benchmarks/bench_level_load.py [--sizes 64 128 256 512]
+"""
+
+import argparse
+import gc
+import time
+
+from common import setup_environment, timed
+
+config = setup_environment()
+
+import pygame  # noqa: E402
+import pytmx  # noqa: E402
+from core.pathutils import resource_path  # noqa: E402
+from level.camera import Camera  # noqa: E402
+from level.level_renderer import LevelRenderer  # noqa: E402
+from synthetic_map import build_map  # noqa: E402
+
+REAL_MAPS = (
+    "Game/assets/Tiles/Royal_one.tmx",
+    "Game/assets/Tiles/Audience Hall .tmx",
+)
+
+
+class LegacyLevelRenderer(LevelRenderer):
+    """Прежний алгоритм: каждый чанк заново обходит все слои карты."""
+
+    def _create_all_chunks(self):
+        size = self.chunk_size
+        seen = set()
+        for layer in self.tmx_data.layers:
+            if isinstance(layer, pytmx.TiledTileLayer):
+                for x, y, _ in layer.tiles():
+                    key = (x // size, y // size)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    tiles = []
+                    for scan_layer in self.tmx_data.layers:
+                        if isinstance(scan_layer, pytmx.TiledTileLayer):
+                            for tx, ty, image in scan_layer.tiles():
+                                if tx // size == key[0] and ty // size == key[1]:
+                                    tiles.append(((tx % size) * self.tmx_data.tilewidth,
+                                                  (ty % size) * self.tmx_data.tileheight, image))
+                    self._create_chunk(key[0], key[1], tiles)
+
+
+def count_tiles(tmx_data):
+    return sum(1 for layer in tmx_data.layers
+               if isinstance(layer, pytmx.TiledTileLayer)
+               for _ in layer.tiles())
+
+
+def set_streaming(enabled):
+    config.LEVEL_STREAMING["ENABLED"] = enabled
+
+
+def bake(renderer_cls, tmx_data):
+    camera = Camera(tmx_data.width * tmx_data.tilewidth, tmx_data.height * tmx_data.tileheight)
+    return renderer_cls(tmx_data, camera)
+
+
+def bench_map(label, path, legacy, repeat):
+    parse_time, tmx_data = timed(pytmx.TiledMap, path)
+    tiles = count_tiles(tmx_data)
+    set_streaming(False)
+    bake_time, renderer = timed(bake, LevelRenderer, tmx_data, repeat=repeat)
+    chunks = len(renderer.chunks_info)
+    del renderer
+    gc.collect()
+
+    line = (f"{label:<28} {tmx_data.width:>4}x{tmx_data.height:<4} tiles={tiles:>8} chunks={chunks:>4} "
+            f"parse={parse_time * 1000:>9.1f}ms bake={bake_time * 1000:>9.1f}ms "
+            f"({bake_time * 1e6 / max(tiles, 1):.2f}us/tile)")
+    if legacy:
+        legacy_time, renderer = timed(bake, LegacyLevelRenderer, tmx_data)
+        del renderer
+        gc.collect()
+        line += f" legacy={legacy_time * 1000:>9.1f}ms x{legacy_time / max(bake_time, 1e-9):.1f}"
+    print(line)
+    return tmx_data
+
+
+def bench_streaming(label, tmx_data, step):
+    """Проезд камеры змейкой по карте в потоковом режиме."""
+    set_streaming(True)
+    construct_time, renderer = timed(bake, LevelRenderer, tmx_data)
+    camera = renderer.camera
+    surface = pygame.Surface((config.VIRTUAL_WIDTH, config.VIRTUAL_HEIGHT))
+    max_x = max(0, camera.level_rect.width - config.VIRTUAL_WIDTH)
+    max_y = max(0, camera.level_rect.height - config.VIRTUAL_HEIGHT)
+
+    frames = 0
+    worst = 0.0
+    start = time.perf_counter()
+    row = 0
+    y = 0
+    while True:
+        xs = range(0, max_x + 1, step) if row % 2 == 0 else range(max_x, -1, -step)
+        for x in xs:
+            camera.offset.x, camera.offset.y = x, y
+            frame_start = time.perf_counter()
+            renderer.render(surface)
+            worst = max(worst, time.perf_counter() - frame_start)
+            frames += 1
+        if y >= max_y:
+            break
+        y = min(max_y, y + config.VIRTUAL_HEIGHT // 2)
+        row += 1
+    total = time.perf_counter() - start
+
+    stats = renderer.get_stats()
+    print(f"{label + ' streaming':<28} construct={construct_time * 1000:.1f}ms frames={frames} "
+          f"avg={total * 1000 / max(frames, 1):.2f}ms worst={worst * 1000:.1f}ms "
+          f"hits={stats['hits']} misses={stats['misses']} prefetched={stats['prefetched']} "
+          f"evictions={stats['evictions']} bake={stats['bake_time'] * 1000:.0f}ms "
+          f"resident={stats['resident_chunks']}/{stats['total_chunks']} "
+          f"{stats['resident_bytes'] / 2 ** 20:.0f}/{stats['budget_bytes'] / 2 ** 20:.0f}MB")
+    del renderer
+    gc.collect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="*", default=[64, 128, 256, 512],
+                        help="Стороны синтетических карт в тайлах")
+    parser.add_argument("--legacy-limit", type=int, default=128,
+                        help="Максимальная сторона карты для замера старого алгоритма")
+    parser.add_argument("--repeat", type=int, default=3, help="Повторы для реальных карт")
+    parser.add_argument("--camera-step", type=int, default=32,
+                        help="Сдвиг камеры за кадр (px) в проезде потокового режима")
+    args = parser.parse_args()
+
+    for path in REAL_MAPS:
+        bench_map(path.rsplit("/", 1)[-1], resource_path(path), legacy=True, repeat=args.repeat)
+
+    for size in args.sizes:
+        path = build_map(size, size)
+        label = f"synthetic {size}x{size}"
+        tmx_data = bench_map(label, path, legacy=size <= args.legacy_limit, repeat=1)
+        bench_streaming(label, tmx_data, args.camera_step)
+
+
+if __name__ == "__main__":
+    main()
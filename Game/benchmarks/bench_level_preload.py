@@ -0,0 +1,90 @@
+"""
+Бенчмарк фоновой подготовки карт за дверями.
+
+Создаёт Game без окна, загружает Royal_one.tmx, проигрывает N кадров
+простоя через GameLoop.step и проходит через дверь в Audience Hall .tmx
+(Game.load_new_map и следующий кадр). Сравниваются:
+- без предзагрузки - карта за дверью разбирается и запекается в кадре
+  перехода (кеш карт пуст, как при первом заходе);
+- с предзагрузкой - пока игрок стоит в комнате, карта разбирается
+  в фоновом потоке, а convert_alpha и запекание идут в свободное время
+  кадров.
+Кадры простоя идут в реальном темпе (остаток dt - сон, как в clock.tick).
+Для них выводится худший кадр и самый долгий шаг предзагрузки в главном
+потоке.
+
+Запуск:
+    python Game/benchmarks/bench_level_preload.py [--frames 120] [--dt 0.016667]
+"""
+
+import argparse
+import time
+
+from common import patch_asset_case, setup_environment
+
+config = setup_environment(init_display=False)
+patch_asset_case()
+
+import game as game_module  # noqa: E402
+from core.game_loop import GameLoop  # noqa: E402
+from core.level_cache import level_cache  # noqa: E402
+from core.level_preloader import level_preloader  # noqa: E402
+
+ROOM = "Game/assets/Tiles/Royal_one.tmx"
+TARGET = "Game/assets/Tiles/Audience Hall .tmx"
+
+
+def run(game, loop, preload, frames, dt):
+    """Простой в комнате и переход через дверь.
+
+    Returns:
+        (худший кадр простоя, мс; кадр перехода, мс)
+    """
+    level_preloader.enabled = preload
+    level_preloader.clear()
+    level_cache.clear()
+    game.load_new_map(ROOM)
+
+    worst = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        loop.step(dt)
+        elapsed = time.perf_counter() - start
+        worst = max(worst, elapsed * 1000)
+        # Остаток кадра ждём, как clock.tick: в это время работает фоновый поток
+        time.sleep(max(0.0, dt - elapsed))
+
+    start = time.perf_counter()
+    game.next_spawn_point_name = "royal_door_spawn"
+    game.load_new_map(TARGET)
+    loop.step(dt)
+    return worst, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=120, help="Кадров простоя перед переходом")
+    parser.add_argument("--dt", type=float, default=1 / 60, help="Длительность кадра, сек")
+    args = parser.parse_args()
+
+    game = game_module.Game()
+    loop = GameLoop(game)
+    game.game_state_manager.change_state("new_game", None)
+    game.game_state_manager.cancel_transition()  # fade из главного меню не нужен
+    # Первая загрузка прогревает атлас анимаций, шрифты и иконки
+    run(game, loop, False, 10, args.dt)
+
+    idle_off, door_off = run(game, loop, False, args.frames, args.dt)
+    idle_on, door_on = run(game, loop, True, args.frames, args.dt)
+    stats = level_preloader.get_stats()
+
+    print(f"Кадров простоя: {args.frames}")
+    print(f"без предзагрузки: худший кадр простоя {idle_off:>6.2f}ms | кадр перехода {door_off:>7.1f}ms")
+    print(f"с предзагрузкой:  худший кадр простоя {idle_on:>6.2f}ms | кадр перехода {door_on:>7.1f}ms "
+          f"(x{door_off / door_on:.0f})")
+    print(f"Предзагрузка: готово заранее {stats['ready']}, доделано при переходе {stats['taken']}, "
+          f"шагов {stats['steps']}, самый долгий шаг {stats['max_step_ms']:.2f}ms, ошибок {stats['errors']}")
+
+
+if __name__ == "__main__":
+    main()
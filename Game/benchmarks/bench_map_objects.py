@@ -0,0 +1,120 @@
+"""
+Бенчмарк выборки объектов карты при загрузке уровня.
+
+Сравнивает прежние проходы (коллизии через get_layer_by_name, отдельный
+обход всех слоёв за интерактивными объектами и сундуками, два обхода
+слоёв в find_spawn_point на каждую точку спавна, фильтрация дверей по
+interactive_type) с MapObjectRegistry: один проход по объектным слоям
+и запросы к индексам. Прогоняются реальные карты и синтетические карты
+растущего размера; результаты обоих способов сверяются.
+
+Запуск:
+    python Game/benchmarks/bench_map_objects.py [--sizes 64 128 256 512]
+"""
+
+import argparse
+
+from common import setup_environment, timed
+
+config = setup_environment(init_display=False)
+
+import pygame  # noqa: E402
+import pytmx  # noqa: E402
+from core.game_resources import find_spawn_point  # noqa: E402
+from core.pathutils import resource_path  # noqa: E402
+from level.map_objects import MapObjectRegistry  # noqa: E402
+from synthetic_map import build_map  # noqa: E402
+
+REAL_MAPS = (
+    "Game/assets/Tiles/Royal_one.tmx",
+    "Game/assets/Tiles/Audience Hall .tmx",
+)
+SPAWN_NAMES = (None, "player_spawn", "door_spawn", "missing_spawn")
+
+
+def legacy_spawn(level, spawn_point_name):
+    """Прежний find_spawn_point: обход слоёв на каждый запрос."""
+    if spawn_point_name:
+        for layer in level.layers:
+            if hasattr(layer, 'name') and layer.name == "PlayerSpawn":
+                for obj in layer:
+                    if (hasattr(obj, 'properties') and
+                        obj.properties.get("object_type") == spawn_point_name) or \
+                            (hasattr(obj, 'name') and obj.name == spawn_point_name):
+                        return int(obj.x), int(obj.y)
+    for layer in level.layers:
+        if hasattr(layer, 'name') and layer.name == "PlayerSpawn":
+            for obj in layer:
+                if hasattr(obj, 'properties') and obj.properties.get("object_type") == "player_spawn":
+                    return int(obj.x), int(obj.y)
+            break
+    return 200, 200
+
+
+def legacy_pass(level):
+    """Прежние проходы загрузки уровня."""
+    collisions = []
+    collision_layer = level.get_layer_by_name(config.COLLISION_SETTINGS["COLLISION_LAYER_NAME"])
+    for obj in collision_layer:
+        if obj.properties.get("collision", config.COLLISION_SETTINGS["DEFAULT_COLLISION"]):
+            collisions.append(pygame.Rect(int(obj.x), int(obj.y), int(obj.width), int(obj.height)))
+
+    interactive, chests = [], []
+    for layer in level.layers:
+        if hasattr(layer, 'name') and hasattr(layer, '__iter__'):
+            for obj in layer:
+                if hasattr(obj, 'properties') and obj.properties.get('interactive', False):
+                    interactive.append(obj)
+                if hasattr(obj, 'properties') and obj.properties.get('chest', False):
+                    chests.append(obj)
+
+    doors = [obj for obj in interactive
+             if str(obj.properties.get('interactive_type', '')).lower() == 'doors']
+    spawns = [legacy_spawn(level, name) for name in SPAWN_NAMES]
+    return collisions, interactive, chests, doors, spawns
+
+
+def registry_pass(level):
+    """Один проход MapObjectRegistry и запросы к индексам."""
+    map_objects = MapObjectRegistry(level)
+    collisions = []
+    for obj in map_objects.find(layer=config.COLLISION_SETTINGS["COLLISION_LAYER_NAME"]):
+        if obj.properties.get("collision", config.COLLISION_SETTINGS["DEFAULT_COLLISION"]):
+            collisions.append(pygame.Rect(int(obj.x), int(obj.y), int(obj.width), int(obj.height)))
+    doors = [obj for obj in map_objects.find(interactive_type='doors')
+             if obj.properties.get('interactive', False)]
+    spawns = [find_spawn_point(map_objects, name) for name in SPAWN_NAMES]
+    return collisions, map_objects.interactive, map_objects.chests, doors, spawns
+
+
+def measure(label, level, repeat):
+    legacy = legacy_pass(level)
+    registry = registry_pass(level)
+    assert legacy == registry, f"{label}: результаты расходятся"
+
+    objects = sum(len(layer) for layer in level.layers if isinstance(layer, pytmx.TiledObjectGroup))
+    legacy_ms = timed(legacy_pass, level, repeat=repeat)[0] * 1000
+    registry_ms = timed(registry_pass, level, repeat=repeat)[0] * 1000
+    build_ms = timed(MapObjectRegistry, level, repeat=repeat)[0] * 1000
+    print(f"{label:<22} objects={objects:>6} legacy={legacy_ms:>8.3f}ms "
+          f"registry={registry_ms:>8.3f}ms (build {build_ms:.3f}ms) "
+          f"x{legacy_ms / max(registry_ms, 1e-9):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="*", default=[64, 128, 256, 512],
+                        help="Стороны синтетических карт в тайлах")
+    parser.add_argument("--repeat", type=int, default=20, help="Повторов на замер")
+    args = parser.parse_args()
+
+    for map_path in REAL_MAPS:
+        level = pytmx.TiledMap(resource_path(map_path))
+        measure(map_path.rsplit("/", 1)[-1], level, args.repeat)
+    for size in args.sizes:
+        level = pytmx.TiledMap(build_map(size, size))
+        measure(f"synthetic {size}x{size}", level, max(1, args.repeat // (size // 64 or 1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Бенчмарк формата сохранений: JSON (savegame.json + chests.json) против save.bin.
+
+Строит сохранение с N сундуками, заполненными предметами из ITEMS_DATABASE
+(по умолчанию 1000 сундуков по 24 слота), плюс игрок, инвентарь и диалоги.
+Для обоих форматов замеряются размер файлов, кодирование, декодирование,
+запись и чтение с диска; в конце проверяется, что данные после
+двоичного контейнера совпадают с исходными.
+
+Отдельно сравнивается сохранение после изменения одного сундука:
+полная перезапись секции сундуков против записи в журнал ChestManager.
+
+Запуск:
+    python Game/benchmarks/bench_save_format.py [--chests 1000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+
+from common import setup_environment, timed
+
+config = setup_environment(init_display=False)
+
+from core.save_format import (BinarySaveCodec, JsonSaveCodec, decode_save,  # noqa: E402
+                               encode_journal_record)
+from items.items_loader import load_all_items  # noqa: E402
+
+GAME_SECTIONS = ("player", "inventory", "dialogues")
+
+
+def build_save(chest_count, seed=1):
+    """Собирает словарь сохранения в том же виде, что save_manager и ChestManager."""
+    # load_all_items заменяет глобальный ITEMS_DATABASE, поэтому берём результат
+    item_ids = sorted(load_all_items()) or ["gold_coin"]
+    rng = random.Random(seed)
+
+    def slots(count):
+        return [{"slot_index": index, "id": rng.choice(item_ids), "count": rng.randint(1, 99)}
+                for index in range(count)]
+
+    chests = {}
+    for index in range(chest_count):
+        chest_id = f"chest_{index // 40}_{index % 40}"
+        chests[chest_id] = {"chest_id": chest_id, "max_slots": 24, "items": slots(24)}
+
+    return {
+        "player": {"map_path": "assets/Tiles/Royal_one.tmx", "position": [1234, 567]},
+        "inventory": {"inventory_slots": slots(20),
+                      "equipment_slots": {"weapon": {"id": item_ids[0], "count": 1}}},
+        "dialogues": {
+            "1": {"type": "royal_guard", "interaction_count": 3, "phase_index": 1},
+            "2": {"type": "king", "interaction_count": 1, "phase_index": 0, "current_chain_index": 2,
+                  "current_chain_position": 4, "in_dialogue_chain": True},
+        },
+        "chests": chests,
+    }
+
+
+def split_json(data):
+    """Делит сохранение на два прежних JSON-файла."""
+    game = {key: data[key] for key in GAME_SECTIONS if key in data}
+    return game, data.get("chests", {})
+
+
+def write_file(path, content, binary):
+    with open(path, "wb" if binary else "w", encoding=None if binary else "utf-8") as f:
+        f.write(content)
+
+
+def bench_json(data, directory, repeat):
+    codec = JsonSaveCodec()
+    game, chests = split_json(data)
+    save_path = os.path.join(directory, "savegame.json")
+    chests_path = os.path.join(directory, "chests.json")
+
+    encode_time, (game_text, chests_text) = timed(
+        lambda: (codec.encode(game), codec.encode(chests)), repeat=repeat)
+    decode_time, _ = timed(lambda: (json.loads(game_text), json.loads(chests_text)), repeat=repeat)
+    write_time, _ = timed(lambda: (write_file(save_path, game_text, False),
+                                   write_file(chests_path, chests_text, False)), repeat=repeat)
+    read_time, _ = timed(lambda: (codec.read(save_path), codec.read(chests_path)), repeat=repeat)
+    size = os.path.getsize(save_path) + os.path.getsize(chests_path)
+    return {"size": size, "encode": encode_time, "decode": decode_time,
+            "write": write_time, "read": read_time}
+
+
+def bench_binary(data, directory, repeat):
+    codec = BinarySaveCodec()
+    path = os.path.join(directory, "save.bin")
+
+    encode_time, raw = timed(codec.encode, data, repeat=repeat)
+    write_time, _ = timed(write_file, path, raw, True, repeat=repeat)
+    read_time, restored = timed(codec.read, path, repeat=repeat)
+    # decode отдельно от чтения файла, чтобы сравнить с json.loads
+    decode_time, _ = timed(decode_save, raw, repeat=repeat)
+    return {"size": os.path.getsize(path), "encode": encode_time, "decode": decode_time,
+            "write": write_time, "read": read_time}, restored
+
+
+def bench_incremental(data, repeat):
+    """Сохранение после изменения одного сундука: весь контейнер или запись журнала."""
+    chests = data["chests"]
+    chest_id = next(iter(chests))
+    changed = {chest_id: chests[chest_id]}
+    full_time, full = timed(BinarySaveCodec.encode, data, repeat=repeat)
+    journal_time, record = timed(encode_journal_record, changed, repeat=repeat)
+    print(f"Изменён 1 сундук из {len(chests)}:")
+    print(f"  full    {len(full) / 1024:>9.1f}KB {full_time * 1000:>8.3f}ms")
+    print(f"  journal {len(record) / 1024:>9.1f}KB {journal_time * 1000:>8.3f}ms")
+
+
+def print_row(label, result):
+    print(f"{label:<8} size={result['size'] / 1024:>9.1f}KB "
+          f"encode={result['encode'] * 1000:>8.2f}ms decode={result['decode'] * 1000:>8.2f}ms "
+          f"write={result['write'] * 1000:>8.2f}ms read={result['read'] * 1000:>8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chests", type=int, default=1000, help="Количество сундуков в сохранении")
+    parser.add_argument("--repeat", type=int, default=5, help="Повторы каждого замера")
+    args = parser.parse_args()
+
+    data = build_save(args.chests)
+    with tempfile.TemporaryDirectory() as directory:
+        json_result = bench_json(data, directory, args.repeat)
+        binary_result, restored = bench_binary(data, directory, args.repeat)
+
+    print(f"Сундуков: {args.chests}, слотов в сундуке: 24")
+    print_row("json", json_result)
+    print_row("binary", binary_result)
+    for key in ("size", "encode", "decode", "write", "read"):
+        if binary_result[key]:
+            print(f"  {key:<6} json/binary = {json_result[key] / binary_result[key]:.1f}x")
+
+    if restored != data:
+        raise SystemExit("Ошибка: данные после save.bin не совпадают с исходными")
+    print("Круговая проверка: данные совпадают")
+    bench_incremental(data, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Бенчмарк кеша отрисованного текста.
+
+Кадр интерфейса с открытым профилем инвентаря: характеристики игрока,
+кнопки атрибутов, количество предметов в 32 слотах и отладочные строки
+(одна из них - FPS - меняется каждый кадр). Сравниваются font.render
+в каждом кадре (как было) и text_cache.render; печатается время кадра
+и доля попаданий кеша.
+
+Запуск:
+    python Game/benchmarks/bench_text_cache.py [--frames 300]
+"""
+
+import argparse
+
+from common import setup_environment, timed
+
+config = setup_environment()
+
+import pygame  # noqa: E402
+from core.text_cache import fonts, text_cache  # noqa: E402
+
+
+def build_frame_texts(frame):
+    """Строки одного кадра: (текст, размер, цвет, имя шрифта)."""
+    texts = [(f"Характеристика {index}: {index * 10}", 28, (220, 220, 240), None) for index in range(7)]
+    texts += [(f"Атрибут {index}: {index + 5}", 24, (200, 200, 200), None) for index in range(6)]
+    texts += [("+", 24, (220, 220, 220), None)] * 6
+    texts += [(str(count % 20 + 2), 20, (255, 255, 255), None) for count in range(32)]
+    texts += [(f"Debug line {index}", 16, (255, 255, 255), "Arial") for index in range(8)]
+    texts.append((f"FPS: {60 + frame % 7 / 10:.1f}", 16, (255, 255, 255), "Arial"))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=300, help="Количество кадров")
+    args = parser.parse_args()
+
+    target = pygame.Surface((config.VIRTUAL_WIDTH, config.VIRTUAL_HEIGHT))
+    frames = [build_frame_texts(frame) for frame in range(args.frames)]
+
+    def draw_direct():
+        for texts in frames:
+            for index, (text, size, color, name) in enumerate(texts):
+                target.blit(fonts.get(size, name).render(text, True, color), (10, index * 20))
+
+    def draw_cached():
+        for texts in frames:
+            for index, (text, size, color, name) in enumerate(texts):
+                target.blit(text_cache.render(text, size, color, name=name), (10, index * 20))
+
+    direct_time, _ = timed(draw_direct)
+    cached_time, _ = timed(draw_cached)
+    stats = text_cache.get_stats()
+    print(f"Строк в кадре: {len(frames[0])}, кадров: {args.frames}")
+    print(f"font.render  {direct_time * 1000 / args.frames:>7.3f}ms/кадр")
+    print(f"text_cache   {cached_time * 1000 / args.frames:>7.3f}ms/кадр "
+          f"(x{direct_time / cached_time:.1f})")
+    print(f"hit rate {stats['hit_rate'] * 100:.1f}% entries={stats['entries']} fonts={stats['fonts']} "
+          f"evictions={stats['evictions']} memory={stats['bytes'] / 1024:.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
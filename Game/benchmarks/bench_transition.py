@@ -0,0 +1,84 @@
+"""
+Бенчмарк fade-перехода из главного меню в игру.
+
+Создаёт Game без окна и запускает новую игру так же, как
+MenuHandler.start_game без сохранения: стартовая карта ставится
+в фоновую предзагрузку, GameStateManager начинает переход. Кадры идут
+через GameLoop.step в реальном темпе (остаток dt - сон, как clock.tick),
+пока переход не закончится. Выводятся число кадров, худший кадр, кадр
+загрузки на чёрном экране (карта из предзагрузки, игрок и его UI
+создаются в нём) и фаза "transition" профилировщика.
+
+Для сравнения выводится прежнее поведение: animate_transition блокировал
+цикл на 2 * FADE_DURATION, а карта разбиралась и запекалась целиком
+в первом кадре после него (замеряется с пустым кешем карт).
+
+Запуск:
+    python Game/benchmarks/bench_transition.py [--dt 0.016667]
+"""
+
+import argparse
+import time
+
+from common import patch_asset_case, setup_environment
+
+config = setup_environment(init_display=False)
+patch_asset_case()
+
+import game as game_module  # noqa: E402
+from core.game_loop import GameLoop  # noqa: E402
+from core.level_cache import level_cache  # noqa: E402
+from core.level_preloader import level_preloader  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dt", type=float, default=1 / 60, help="Длительность кадра, сек")
+    args = parser.parse_args()
+
+    game = game_module.Game()
+    loop = GameLoop(game)
+    manager = game.game_state_manager
+    loop.step(args.dt)  # Кадр главного меню - фон для затемнения
+
+    # Как MenuHandler.start_game для новой игры без сохранения
+    level_preloader.schedule([(config.LEVEL_MAP_PATH, None)])
+    game.waiting_for_first_update = True
+    manager.change_state("new_game", None)
+    game.profiler.reset()
+
+    frames = []
+    load_frame = None
+    while manager.transition is not None:
+        loading = game.player is None
+        start = time.perf_counter()
+        loop.step(args.dt)
+        elapsed = time.perf_counter() - start
+        frames.append(elapsed * 1000)
+        if loading and game.player is not None:
+            load_frame = elapsed * 1000
+        time.sleep(max(0.0, args.dt - elapsed))
+
+    stats = game.profiler.get_stats()
+    transition = stats["phases"]["transition"]
+    preload = level_preloader.get_stats()
+
+    level_cache.clear()
+    level_preloader.clear()
+    start = time.perf_counter()
+    game.game_resources.load_game_resources()
+    legacy_load = (time.perf_counter() - start) * 1000
+
+    print(f"FADE_DURATION: {config.FADE_DURATION}s")
+    print(f"прежний переход: цикл заблокирован {2 * config.FADE_DURATION * 1000:.0f}ms, "
+          f"затем кадр загрузки {legacy_load:.1f}ms")
+    print(f"покадровый переход: кадров {len(frames)}, худший {max(frames):.2f}ms, "
+          f"кадр загрузки {load_frame:.2f}ms")
+    print(f"фаза transition: p50 {transition['p50']:.3f}ms max {transition['max']:.3f}ms")
+    print(f"предзагрузка стартовой карты: готово заранее {preload['ready']}, "
+          f"доделано при загрузке {preload['taken']}, самый долгий шаг {preload['max_step_ms']:.2f}ms")
+    print(f"игрок создан: {game.player is not None}, состояние {manager.get_state()}")
+
+
+if __name__ == "__main__":
+    main()
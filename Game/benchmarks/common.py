@@ -0,0 +1,116 @@
+"""
+Общая подготовка окружения для бенчмарков.
+
+Должен импортироваться раньше pygame: выставляет dummy-драйверы SDL,
+добавляет папку Game в sys.path и делает корень репозитория текущей
+директорией (как при запуске python Game/game.py).
+"""
+
+import os
+import sys
+import time
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT_DIR = os.path.dirname(GAME_DIR)
+
+
+def setup_environment(init_display=True):
+    """Готовит headless-окружение pygame.
+
+    Args:
+        init_display: Создать ли скрытое окно (нужно для convert_alpha)
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    if GAME_DIR not in sys.path:
+        sys.path.insert(0, GAME_DIR)
+    os.chdir(ROOT_DIR)
+
+    # config импортируется первым, как в game.py (иначе циклический импорт level)
+    from core.config import config  # noqa: F401
+    import pygame
+
+    pygame.init()
+    if init_display:
+        pygame.display.set_mode((config.VIRTUAL_WIDTH, config.VIRTUAL_HEIGHT))
+    return config
+
+
+_exists = os.path.exists
+
+
+def _resolve_case(path):
+    """Ищет путь без учёта регистра, как его видит Windows.
+
+    В репозитории есть папки, различающиеся только регистром
+    (assets/sprites и assets/Sprites), поэтому перебираются все варианты.
+
+    Returns:
+        Существующий путь на диске или исходный путь, если не найден.
+    """
+    if not isinstance(path, str) or _exists(path):
+        return path
+    parts = [part for part in os.path.normpath(path).split(os.sep) if part]
+    base = os.sep if os.path.isabs(path) else ""
+
+    def search(resolved, index):
+        if index == len(parts):
+            return resolved
+        part = parts[index]
+        try:
+            names = os.listdir(resolved or ".")
+        except OSError:
+            return None
+        for name in names:
+            if name.lower() == part.lower():
+                found = search(os.path.join(resolved, name), index + 1)
+                if found:
+                    return found
+        return None
+
+    return search(base, 0) or path
+
+
+def patch_asset_case():
+    """Разрешает пути ассетов без учёта регистра.
+
+    Игра разрабатывается под Windows, и часть путей в коде отличается
+    от папок на диске регистром ("assets/images" и "assets/Images").
+    На CI с Linux загрузчики pygame и os.path.exists в процессе бенчмарка
+    оборачиваются поиском без учёта регистра.
+    """
+    import pygame
+
+    if getattr(pygame.image.load, "_case_insensitive", False):
+        return
+
+    def wrap(loader):
+        def load(path, *args, **kwargs):
+            return loader(_resolve_case(path), *args, **kwargs)
+        load._case_insensitive = True
+        return load
+
+    pygame.image.load = wrap(pygame.image.load)
+    pygame.mixer.music.load = wrap(pygame.mixer.music.load)
+    sound = pygame.mixer.Sound
+
+    def load_sound(*args, **kwargs):
+        if args:
+            args = (_resolve_case(args[0]),) + args[1:]
+        return sound(*args, **kwargs)
+    pygame.mixer.Sound = load_sound
+    os.path.exists = lambda path: _exists(_resolve_case(path))
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    """Выполняет функцию repeat раз и возвращает (лучшее время, результат)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
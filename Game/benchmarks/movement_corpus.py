@@ -0,0 +1,173 @@
+"""
+Детерминированный корпус случаев движения игрока.
+
+Каждый случай прогоняется через PlayerMovementHandler.resolve_position
+дважды: прежним перебором диагональ/X/Y и swept AABB
+(COLLISION_SETTINGS["SWEPT_RESOLVER"]). Печатается финальная позиция
+каждого алгоритма, число кадров, закончившихся внутри стены, и признак
+пролёта сквозь стену.
+
+Ожидаемые расхождения: swept подходит к стене вплотную (перебор
+останавливается за шаг до неё), не пролетает тонкие стены на большом dt
+и хранит дробный остаток позиции, поэтому проходит ровно PLAYER_SPEED
+пикселей в секунду (перебор теряет доли пикселя при округлении hitbox).
+Скрипт завершается с кодом 1, если swept хоть раз оставил хитбокс
+внутри стены или пролетел сквозь неё.
+
+Запуск:
+    python Game/benchmarks/movement_corpus.py [--verbose]
+"""
+
+import argparse
+import random
+import sys
+
+from common import setup_environment
+
+config = setup_environment(init_display=False)
+
+import pygame  # noqa: E402
+import pytmx  # noqa: E402
+from core.pathutils import resource_path  # noqa: E402
+from level.collisions import CollisionHandler, CollisionObjects  # noqa: E402
+from level.player_movement import PlayerMovementHandler  # noqa: E402
+
+HITBOX_W = config.PLAYER_HITBOX["WIDTH"]
+HITBOX_H = config.PLAYER_HITBOX["HEIGHT"]
+LEVEL_SIZE = (2000, 2000)
+DIAG = 0.7071067811865475
+
+
+class CorpusBody:
+    """Минимальное тело для PlayerMovementHandler: хитбокс и скорость."""
+
+    def __init__(self, x, y, speed):
+        self.hitbox = pygame.Rect(x, y, HITBOX_W, HITBOX_H)
+        self.speed = speed
+
+
+def walls(*rects):
+    return [{'rect': pygame.Rect(r), 'type': "solid", 'properties': {}} for r in rects]
+
+
+def hold(move_x, move_y, frames, dt=1 / 144):
+    return [(move_x, move_y, dt)] * frames
+
+
+def build_cases():
+    cases = [
+        ("free_right", [], (100, 100), hold(1, 0, 144)),
+        ("free_left", [], (400, 100), hold(-1, 0, 144)),
+        ("free_diagonal", [], (100, 100), hold(DIAG, DIAG, 144)),
+        ("wall_right_144fps", walls((200, 80, 32, 64)), (100, 100), hold(1, 0, 144)),
+        ("wall_left_144fps", walls((40, 80, 32, 64)), (150, 100), hold(-1, 0, 144)),
+        ("wall_down_60fps", walls((80, 200, 64, 32)), (100, 100), hold(0, 1, 60, 1 / 60)),
+        ("wall_up_30fps", walls((80, 20, 64, 32)), (100, 100), hold(0, -1, 30, 1 / 30)),
+        ("slide_diag_along_wall", walls((200, 0, 32, 400)), (150, 100), hold(DIAG, DIAG, 144)),
+        ("slide_diag_along_floor", walls((0, 200, 400, 32)), (100, 150), hold(DIAG, DIAG, 144)),
+        ("inner_corner", walls((200, 0, 32, 400), (0, 200, 400, 32)), (150, 150), hold(DIAG, DIAG, 144)),
+        ("outer_corner_exact", walls((200, 200, 64, 64)), (170, 175), hold(DIAG, DIAG, 144)),
+        ("corridor_exact_fit", walls((100, 0, 32, 100), (100 + 32 + HITBOX_W - 1, 0, 32, 100)),
+         (132, 150), hold(0, -1, 144)),
+        ("corridor_too_narrow", walls((100, 0, 32, 100), (100 + 32 + HITBOX_W - 3, 0, 32, 100)),
+         (132, 150), hold(0, -1, 144)),
+        ("thin_wall_low_fps", walls((200, 0, 4, 400)), (150, 100), hold(1, 0, 10, 0.25)),
+        ("thin_wall_lag_spike", walls((200, 0, 2, 400)), (150, 100),
+         hold(1, 0, 20) + hold(1, 0, 1, 0.5) + hold(1, 0, 20)),
+        ("start_inside_wall", walls((90, 90, 40, 40)), (100, 100), hold(-1, 0, 144)),
+        ("level_border", [], (10, 10), hold(-DIAG, -DIAG, 144)),
+    ]
+    cases.extend(map_random_walks())
+    return cases
+
+
+def map_random_walks(seed=7, walks=4, frames=600):
+    """Случайные блуждания по коллизиям реальной карты Royal_one."""
+    tmx = pytmx.TiledMap(resource_path("Game/assets/Tiles/Royal_one.tmx"))
+    objects = list(CollisionHandler.load_collision_objects(tmx))
+    spawn = next(iter(tmx.get_layer_by_name("PlayerSpawn")))
+    rng = random.Random(seed)
+    directions = [(1, 0), (-1, 0), (0, 1), (0, -1),
+                  (DIAG, DIAG), (DIAG, -DIAG), (-DIAG, DIAG), (-DIAG, -DIAG)]
+    cases = []
+    for walk in range(walks):
+        steps = []
+        while len(steps) < frames:
+            direction = rng.choice(directions)
+            dt = rng.choice((1 / 144, 1 / 60, 1 / 30))
+            steps.extend(hold(direction[0], direction[1], rng.randrange(10, 60), dt))
+        cases.append((f"royal_one_walk_{walk}", objects, (int(spawn.x), int(spawn.y)), steps[:frames]))
+    return cases
+
+
+def overlaps(handler, hitbox, objects, ignore):
+    hit = handler.check_collision(hitbox, objects)
+    return hit is not None and id(hit) not in ignore
+
+
+def crossed_wall(handler, before, after, objects):
+    """Проверяет, прошёл ли хитбокс сквозь стену за один шаг."""
+    swept = before.union(after)
+    for obj in objects:
+        rect = obj['rect']
+        if not swept.colliderect(rect) or handler.check_collision(before, [obj]):
+            continue
+        # Стена лежит строго между начальной и конечной позицией
+        if before.right <= rect.left and after.left >= rect.right:
+            return True
+        if before.left >= rect.right and after.right <= rect.left:
+            return True
+        if before.bottom <= rect.top and after.top >= rect.bottom:
+            return True
+        if before.top >= rect.bottom and after.bottom <= rect.top:
+            return True
+    return False
+
+
+def run_case(objects, start, steps, swept):
+    config.COLLISION_SETTINGS["SWEPT_RESOLVER"] = swept
+    body = CorpusBody(start[0], start[1], config.PLAYER_SPEED)
+    mover = PlayerMovementHandler(body)
+    handler = mover.collision_handler
+    indexed = CollisionObjects(objects)
+    ignore = {id(obj) for obj in objects if handler.check_collision(body.hitbox, [obj])}
+
+    stuck_frames = 0
+    tunnels = 0
+    for move_x, move_y, dt in steps:
+        before = body.hitbox.copy()
+        new_x, new_y = mover.resolve_position(move_x, move_y, dt, LEVEL_SIZE[0], LEVEL_SIZE[1], indexed)
+        mover.apply_position(new_x, new_y)
+        if overlaps(handler, body.hitbox, objects, ignore):
+            stuck_frames += 1
+        if crossed_wall(handler, before, body.hitbox, objects):
+            tunnels += 1
+    return body.hitbox.topleft, stuck_frames, tunnels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--verbose", action="store_true", help="Печатать совпадающие случаи подробно")
+    args = parser.parse_args()
+
+    failures = 0
+    same = 0
+    cases = build_cases()
+    print(f"{'case':<26} {'legacy':>12} {'swept':>12}  legacy stuck/tunnel  swept stuck/tunnel")
+    for name, objects, start, steps in cases:
+        legacy_pos, legacy_stuck, legacy_tunnels = run_case(objects, start, steps, swept=False)
+        swept_pos, swept_stuck, swept_tunnels = run_case(objects, start, steps, swept=True)
+        if swept_stuck or swept_tunnels:
+            failures += 1
+        if legacy_pos == swept_pos:
+            same += 1
+        mark = "=" if legacy_pos == swept_pos else "~"
+        print(f"{name:<26} {str(legacy_pos):>12} {str(swept_pos):>12} {mark} "
+              f"{legacy_stuck:>8}/{legacy_tunnels:<8} {swept_stuck:>8}/{swept_tunnels:<8}")
+
+    print(f"\n{len(cases)} cases, {same} identical final positions, {failures} swept failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
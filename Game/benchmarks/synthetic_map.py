@@ -0,0 +1,89 @@
+"""
+Генератор синтетических TMX-карт для бенчмарков.
+
+Карта строится из тайлсета Inside_A5.png: сплошной слой пола, разреженный
+слой декора с отражёнными тайлами и слой CollisionLayer с прямоугольниками.
+"""
+
+import os
+import random
+import tempfile
+
+from common import GAME_DIR
+
+TILESET_IMAGE = os.path.join(GAME_DIR, "assets", "Tiles", "Tilesets", "Inside_A5.png")
+TILESET_COLUMNS = 8
+TILESET_COUNT = 128
+
+FLIP_H = 0x80000000
+FLIP_V = 0x40000000
+FLIP_D = 0x20000000
+
+
+def _layer_csv(width, height, gid_for):
+    rows = []
+    for y in range(height):
+        rows.append(",".join(str(gid_for(x, y)) for x in range(width)))
+    return ",\n".join(rows)
+
+
+def build_map(width, height, seed=1, collision_count=None, directory=None):
+    """Записывает синтетическую карту и возвращает путь к файлу.
+
+    Args:
+        width: Ширина карты в тайлах
+        height: Высота карты в тайлах
+        seed: Зерно генератора (карта детерминирована)
+        collision_count: Количество коллизионных прямоугольников
+        directory: Папка для файла (по умолчанию временная)
+
+    Returns:
+        str: Абсолютный путь к .tmx
+    """
+    rng = random.Random(seed)
+    if collision_count is None:
+        collision_count = max(1, (width * height) // 64)
+    directory = directory or tempfile.mkdtemp(prefix="swordfall_bench_")
+    path = os.path.join(directory, f"synthetic_{width}x{height}.tmx")
+
+    def floor_gid(x, y):
+        return 1 + (x * 7 + y * 3) % 16
+
+    decor = {}
+    for _ in range((width * height) // 10):
+        x, y = rng.randrange(width), rng.randrange(height)
+        gid = 17 + rng.randrange(TILESET_COUNT - 17)
+        gid |= rng.choice((0, 0, FLIP_H, FLIP_V, FLIP_D))
+        decor[(x, y)] = gid
+
+    objects = []
+    for index in range(collision_count):
+        x = rng.randrange(width * 32)
+        y = rng.randrange(height * 32)
+        w = rng.randrange(8, 128)
+        h = rng.randrange(8, 128)
+        objects.append(f'  <object id="{index + 1}" x="{x}" y="{y}" width="{w}" height="{h}"/>')
+
+    content = f"""<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="{width}" height="{height}" tilewidth="32" tileheight="32" infinite="0" nextlayerid="5" nextobjectid="{collision_count + 1}">
+ <tileset firstgid="1" name="synthetic" tilewidth="32" tileheight="32" tilecount="{TILESET_COUNT}" columns="{TILESET_COLUMNS}">
+  <image source="{TILESET_IMAGE}" width="256" height="512"/>
+ </tileset>
+ <layer id="1" name="Floor" width="{width}" height="{height}">
+  <data encoding="csv">
+{_layer_csv(width, height, floor_gid)}
+</data>
+ </layer>
+ <layer id="2" name="Decor" width="{width}" height="{height}">
+  <data encoding="csv">
+{_layer_csv(width, height, lambda x, y: decor.get((x, y), 0))}
+</data>
+ </layer>
+ <objectgroup id="3" name="CollisionLayer">
+{chr(10).join(objects)}
+ </objectgroup>
+</map>
+"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
@@ -11,6 +11,7 @@ import pygame
 from core.config import config
 from core.pathutils import resource_path
 from core.chest_storage import ChestStorage
+from core.chest_panel import ChestPanelCompositor
 
 
 class ChestInteractionHandler:
@@ -40,6 +41,12 @@ class ChestInteractionHandler:
         self.current_chest_storage: Optional[ChestStorage] = None
         self.current_chest_id: Optional[str] = None
         
+        # Панель открытого сундука (слои) и перетаскивание предмета
+        self.panel = ChestPanelCompositor()
+        self.dragged_item = None
+        self.drag_source = None  # ('chest' | 'inventory', индекс слота)
+        self.panel_revision = 0  # Растёт при каждом действии в панели (для DirtyRectTracker)
+        
         self._load_chest_tileset()
 
     def _load_chest_tileset(self):
@@ -105,6 +112,7 @@ class ChestInteractionHandler:
         """Сбросить кэш изображения (вызвать при смене языка)."""
         self._chest_image = None
         self._current_lang = None
+        self.panel.invalidate()
 
     def interact(self, obj):
         """
@@ -196,6 +204,9 @@ class ChestInteractionHandler:
         if self.chest_state != 'open':
             return
         
+        # Перетаскиваемый предмет возвращается на место
+        self._cancel_drag()
+        
         # Сохраняем содержимое сундука
         if hasattr(self.game, 'chest_manager') and self.current_chest_storage:
             self.game.chest_manager.save_chests()
@@ -282,6 +293,8 @@ class ChestInteractionHandler:
                 obj_rect = pygame.Rect(world_x, world_y, frame.get_width(), frame.get_height())
                 screen_pos = camera.apply(obj_rect)
                 screen.blit(frame, screen_pos.topleft)
+
+    def draw_panel(self, screen: pygame.Surface):
         """
         Отрисовывает интерфейс сундука с слотами и инвентарем.
         
@@ -291,107 +304,21 @@ class ChestInteractionHandler:
         if self.chest_state != 'open' or not self.current_chest_storage:
             return
         
-        # Фоновое изображение сундука (если есть)
-        if self.game.chest_panel_img:
-            img = self.game.chest_panel_img
-            img_w, img_h = img.get_size()
-            x = (config.WIDTH - img_w) // 2
-            y = (config.HEIGHT - img_h) // 2
-            
-            # Черный фон под изображением
-            screen.fill((0, 0, 0), (x, y, img_w, img_h))
-            screen.blit(img, (x, y))
-        
-        # Параметры слотов
-        slot_size = 70
-        slot_spacing = 10
-        cols = 6  # 6 колонок
-        rows = 4  # 4 ряда (всего 24 слота)
-        
-        # Позиция сетки слотов сундука (слева)
-        chest_grid_x = 100
-        chest_grid_y = 200
-        
-        # Отрисовываем заголовок
-        font = pygame.font.Font(None, 36)
-        title_text = "Сундук" if config.current_language == "russian" else "Chest"
-        title_surface = font.render(title_text, True, (255, 255, 255))
-        screen.blit(title_surface, (chest_grid_x, chest_grid_y - 50))
-        
-        # Отрисовываем слоты сундука
-        for idx in range(self.current_chest_storage.max_slots):
-            row = idx // cols
-            col = idx % cols
-            
-            slot_x = chest_grid_x + col * (slot_size + slot_spacing)
-            slot_y = chest_grid_y + row * (slot_size + slot_spacing)
-            slot_rect = pygame.Rect(slot_x, slot_y, slot_size, slot_size)
-            
-            # Рисуем рамку слота
-            pygame.draw.rect(screen, (80, 80, 80), slot_rect, 2)
-            
-            # Рисуем предмет в слоте (если есть)
-            item = self.current_chest_storage.get_item(idx)
-            if item and item.image:
-                # Масштабируем изображение предмета под размер слота
-                item_img = pygame.transform.smoothscale(item.image, (slot_size - 10, slot_size - 10))
-                screen.blit(item_img, (slot_x + 5, slot_y + 5))
-        
-        # Отрисовываем инвентарь справа (используя существующую систему Inventory)
-        if hasattr(self.game, 'player_ui') and self.game.player_ui and hasattr(self.game.player_ui, 'inventory'):
-            self._draw_inventory_side(screen)
+        self.panel.draw(screen, self.game.chest_panel_img, self.current_chest_storage.slots,
+                        self._visible_inventory_items(), self.dragged_item)
     
-    def _draw_inventory_side(self, screen: pygame.Surface):
-        """
-        Отрисовывает инвентарь игрока справа от сундука.
-        
-        Args:
-            screen: Поверхность для рисования.
-        """
-        # Параметры слотов инвентаря
-        slot_size = 70
-        slot_spacing = 10
-        cols = 4  # 4 колонки
-        
-        # Позиция сетки инвентаря (справа)
-        inv_grid_x = 800
-        inv_grid_y = 200
-        
-        # Заголовок
-        font = pygame.font.Font(None, 36)
-        title_text = "Инвентарь" if config.current_language == "russian" else "Inventory"
-        title_surface = font.render(title_text, True, (255, 255, 255))
-        screen.blit(title_surface, (inv_grid_x, inv_grid_y - 50))
-        
-        # Получаем инвентарь игрока
-        inventory = self.game.player_ui.inventory
-        
-        # Отрисовываем видимые слоты инвентаря
-        for visible_idx in range(len(inventory.inventory_slots_positions)):
+    def _visible_inventory_items(self) -> list:
+        """Предметы видимых слотов инвентаря (с учётом прокрутки)."""
+        player_ui = getattr(self.game, 'player_ui', None)
+        inventory = getattr(player_ui, 'inventory', None) if player_ui else None
+        if inventory is None:
+            return []
+        items = []
+        for visible_idx in range(inventory.inventory_cols * inventory.inventory_visible_rows):
             global_idx = inventory._visible_index_to_global(visible_idx)
-            if 0 <= global_idx < len(inventory.inventory_slots):
-                item = inventory.inventory_slots[global_idx]
-                
-                row = visible_idx // cols
-                col = visible_idx % cols
-                
-                slot_x = inv_grid_x + col * (slot_size + slot_spacing)
-                slot_y = inv_grid_y + row * (slot_size + slot_spacing)
-                slot_rect = pygame.Rect(slot_x, slot_y, slot_size, slot_size)
-                
-                # Рисуем рамку слота
-                pygame.draw.rect(screen, (80, 80, 80), slot_rect, 2)
-                
-                # Рисуем предмет (если есть)
-                if item and item.image:
-                    item_img = pygame.transform.smoothscale(item.image, (slot_size - 10, slot_size - 10))
-                    screen.blit(item_img, (slot_x + 5, slot_y + 5))
-        
-        # Отрисовываем перетаскиваемый предмет у курсора
-        if self.dragged_item and self.dragged_item.image:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            drag_img = pygame.transform.smoothscale(self.dragged_item.image, (self.chest_slot_size - 10, self.chest_slot_size - 10))
-            screen.blit(drag_img, (mouse_x - drag_img.get_width() // 2, mouse_y - drag_img.get_height() // 2))
+            items.append(inventory.inventory_slots[global_idx]
+                         if 0 <= global_idx < len(inventory.inventory_slots) else None)
+        return items
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -408,6 +335,7 @@ class ChestInteractionHandler:
         
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Левая кнопка мыши
             mouse_x, mouse_y = event.pos
+            self.panel_revision += 1
             
             # Проверяем клик по слотам сундука
             chest_slot = self._get_chest_slot_at_pos(mouse_x, mouse_y)
@@ -428,6 +356,16 @@ class ChestInteractionHandler:
         
         return False
     
+    def panel_state(self):
+        """
+        Состояние панели для DirtyRectTracker: кадр перерисовывается после
+        кликов и, пока предмет перетаскивается, при движении мыши.
+        """
+        if self.chest_state != 'open':
+            return None
+        mouse_pos = pygame.mouse.get_pos() if self.dragged_item else None
+        return (self.panel_revision, mouse_pos)
+    
     def _get_chest_slot_at_pos(self, x: int, y: int) -> Optional[int]:
         """
         Определяет индекс слота сундука по координатам мыши.
@@ -438,18 +376,7 @@ class ChestInteractionHandler:
         Returns:
             Индекс слота или None.
         """
-        for idx in range(self.current_chest_storage.max_slots):
-            row = idx // self.chest_cols
-            col = idx % self.chest_cols
-            
-            slot_x = self.chest_grid_x + col * (self.chest_slot_size + self.chest_slot_spacing)
-            slot_y = self.chest_grid_y + row * (self.chest_slot_size + self.chest_slot_spacing)
-            slot_rect = pygame.Rect(slot_x, slot_y, self.chest_slot_size, self.chest_slot_size)
-            
-            if slot_rect.collidepoint(x, y):
-                return idx
-        
-        return None
+        return self.panel.chest_slot_at((x, y), self.current_chest_storage.max_slots)
     
     def _get_inventory_slot_at_pos(self, x: int, y: int) -> Optional[int]:
         """
@@ -462,20 +389,12 @@ class ChestInteractionHandler:
             Глобальный индекс слота инвентаря или None.
         """
         inventory = self.game.player_ui.inventory
-        
-        for visible_idx in range(len(inventory.inventory_slots_positions)):
-            row = visible_idx // self.inv_cols
-            col = visible_idx % self.inv_cols
-            
-            slot_x = self.inv_grid_x + col * (self.inv_slot_size + self.inv_slot_spacing)
-            slot_y = self.inv_grid_y + row * (self.inv_slot_size + self.inv_slot_spacing)
-            slot_rect = pygame.Rect(slot_x, slot_y, self.inv_slot_size, self.inv_slot_size)
-            
-            if slot_rect.collidepoint(x, y):
-                global_idx = inventory._visible_index_to_global(visible_idx)
-                return global_idx if 0 <= global_idx < len(inventory.inventory_slots) else None
-        
-        return None
+        visible_count = inventory.inventory_cols * inventory.inventory_visible_rows
+        visible_idx = self.panel.inventory_slot_at((x, y), visible_count)
+        if visible_idx is None:
+            return None
+        global_idx = inventory._visible_index_to_global(visible_idx)
+        return global_idx if 0 <= global_idx < len(inventory.inventory_slots) else None
     
     def _handle_chest_slot_click(self, slot_idx: int):
         """
@@ -3,14 +3,19 @@
 
 Содержит классы для управления содержимым сундуков в игре,
 включая хранение предметов и сохранение состояния.
+
+Сохраняются только изменённые сундуки: их снимки дописываются в журнал
+(Game/userdata/chests.journal), а после JOURNAL_COMPACT_RECORDS записей
+журнал сжимается в секцию сундуков основного сохранения.
 """
 
-import json
-import os
 from typing import Optional, Dict, List, Any
 from UI.items import InventoryItem
-from items.items_loader import ITEMS_DATABASE
+from items.items_loader import get_item as get_item_data
 from core.config import config
+from core.save_format import encode_journal_record, read_chest_journal
+from core.save_manager import CHEST_JOURNAL_PATH, read_save_data, submit_save_sections
+from core.save_worker import save_worker
 
 
 class ChestStorage:
@@ -29,6 +34,7 @@ class ChestStorage:
         self.chest_id = chest_id
         self.max_slots = max_slots
         self.slots: List[Optional[InventoryItem]] = [None] * max_slots
+        self.dirty = False  # Содержимое изменилось после последнего сохранения
     
     def add_item(self, item: InventoryItem, slot_index: Optional[int] = None) -> bool:
         """
@@ -45,6 +51,7 @@ class ChestStorage:
             # Добавляем в конкретный слот
             if 0 <= slot_index < self.max_slots:
                 self.slots[slot_index] = item
+                self.dirty = True
                 return True
             return False
         else:
@@ -52,6 +59,7 @@ class ChestStorage:
             for i in range(self.max_slots):
                 if self.slots[i] is None:
                     self.slots[i] = item
+                    self.dirty = True
                     return True
             return False
     
@@ -68,6 +76,8 @@ class ChestStorage:
         if 0 <= slot_index < self.max_slots:
             item = self.slots[slot_index]
             self.slots[slot_index] = None
+            if item is not None:
+                self.dirty = True
             return item
         return None
     
@@ -134,8 +144,8 @@ class ChestStorage:
             if item_id is None or not (0 <= slot_index < max_slots):
                 continue
             
-            # Получаем данные предмета из JSON базы данных
-            item_info = ITEMS_DATABASE.get(item_id)
+            # Данные предмета из базы (load_all_items заменяет ITEMS_DATABASE, поэтому через get_item)
+            item_info = get_item_data(item_id)
             if not item_info:
                 continue
             
@@ -173,7 +183,8 @@ class ChestManager:
     def __init__(self):
         """Инициализирует менеджер сундуков."""
         self.chests: Dict[str, ChestStorage] = {}
-        self.save_file = "Game/userdata/chests.json"
+        self.journal_records = 0  # Записей в журнале с последнего сжатия
+        self._journal_failed = False  # Запись журнала не удалась - нужно сжатие
         self.load_chests()
     
     def get_or_create_chest(self, chest_id: str, max_slots: int = 24) -> ChestStorage:
@@ -194,53 +205,102 @@ class ChestManager:
         return self.chests[chest_id]
     
     def save_chests(self):
-        """Сохраняет все сундуки в файл."""
+        """Сохраняет изменённые сундуки (запись идёт в фоновом потоке)."""
         try:
-            # Создаем директорию если не существует
-            os.makedirs(os.path.dirname(self.save_file), exist_ok=True)
-            
-            # Преобразуем все сундуки в словари
-            chests_data = {
-                chest_id: chest.to_dict()
-                for chest_id, chest in self.chests.items()
-            }
+            if self._journal_failed:
+                # Изменения из неудавшейся записи потеряны, а хвост журнала
+                # мог оборваться: переносим все сундуки в основное сохранение
+                self.compact()
+                return
+
+            # Снимок только изменённых сундуков; запись - в SaveWorker
+            changed = {}
+            for chest_id, chest in self.chests.items():
+                if chest.dirty:
+                    changed[chest_id] = chest.to_dict()
+                    chest.dirty = False
+            if not changed:
+                return
             
-            # Сохраняем в файл
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(chests_data, f, ensure_ascii=False, indent=2)
+            save_worker.append(CHEST_JOURNAL_PATH, encode_journal_record(changed),
+                               on_error=self._on_journal_error)
+            self.journal_records += 1
             
             if config.DEBUG_MODE:
-                print(f"[CHEST_MANAGER] Сохранено {len(self.chests)} сундуков")
+                print(f"[CHEST_MANAGER] В журнал поставлено сундуков: {len(changed)} "
+                      f"(запись {self.journal_records})")
+            
+            if self.journal_records >= config.SAVE.get("JOURNAL_COMPACT_RECORDS", 32):
+                self.compact()
         except Exception as e:
             if config.DEBUG_MODE:
                 print(f"[CHEST_MANAGER] Ошибка сохранения сундуков: {e}")
     
+    def compact(self):
+        """Переносит все сундуки в основное сохранение и очищает журнал."""
+        chests_data = {
+            chest_id: chest.to_dict()
+            for chest_id, chest in self.chests.items()
+        }
+        for chest in self.chests.values():
+            chest.dirty = False
+        self._journal_failed = False
+        # Сохранение ставится в очередь раньше очистки журнала и записывается первым
+        submit_save_sections({"chests": chests_data})
+        save_worker.truncate(CHEST_JOURNAL_PATH, on_error=self._on_journal_error)
+        self.journal_records = 0
+        
+        if config.DEBUG_MODE:
+            print(f"[CHEST_MANAGER] Журнал сжат, сундуков в сохранении: {len(chests_data)}")
+    
+    def _on_journal_error(self, error: Exception):
+        """Неудачная запись журнала (фоновый поток): следующее сохранение сожмёт журнал."""
+        self._journal_failed = True
+        if config.DEBUG_MODE:
+            print(f"[CHEST_MANAGER] Журнал сундуков не записан: {error}")
+
     def load_chests(self):
-        """Загружает все сундуки из файла."""
-        if not os.path.exists(self.save_file):
+        """Загружает все сундуки из сохранения и журнала изменений."""
+        data = read_save_data()
+        chests_data = dict((data or {}).get("chests") or {})
+        journal_complete = True
+        try:
+            journal, self.journal_records, journal_complete = read_chest_journal(CHEST_JOURNAL_PATH)
+        except OSError as e:
+            journal = {}
+            if config.DEBUG_MODE:
+                print(f"[CHEST_MANAGER] Ошибка чтения журнала сундуков: {e}")
+        chests_data.update(journal)
+        if not chests_data:
             if config.DEBUG_MODE:
-                print(f"[CHEST_MANAGER] Файл сохранения не найден: {self.save_file}")
+                print("[CHEST_MANAGER] Сохранённых сундуков нет")
+            if not journal_complete:
+                self.compact()
             return
         
         try:
-            with open(self.save_file, 'r', encoding='utf-8') as f:
-                chests_data = json.load(f)
-            
             # Восстанавливаем сундуки
             for chest_id, chest_data in chests_data.items():
                 self.chests[chest_id] = ChestStorage.from_dict(chest_data)
             
             if config.DEBUG_MODE:
-                print(f"[CHEST_MANAGER] Загружено {len(self.chests)} сундуков")
+                print(f"[CHEST_MANAGER] Загружено {len(self.chests)} сундуков "
+                      f"(записей журнала: {self.journal_records})")
         except Exception as e:
             if config.DEBUG_MODE:
                 print(f"[CHEST_MANAGER] Ошибка загрузки сундуков: {e}")
+
+        if not journal_complete:
+            # Хвост журнала оборван при сбое: всё, что дописывалось бы после
+            # него, было бы нечитаемо - сразу переносим сундуки в сохранение
+            if config.DEBUG_MODE:
+                print("[CHEST_MANAGER] Журнал сундуков оборван, сжатие")
+            self.compact()
     
     def clear_all(self):
         """Очищает все сундуки (для отладки)."""
         self.chests.clear()
-        if os.path.exists(self.save_file):
-            os.remove(self.save_file)
+        self.compact()
         if config.DEBUG_MODE:
             print("[CHEST_MANAGER] Все сундуки очищены")
 
@@ -4,10 +4,9 @@
 """
 
 from typing import Dict, Union, Optional
-import json
-import os
 import pygame
 from core.pathutils import resource_path
+from core.settings_store import settings_store, CONFIG_SETTINGS_PATH
 
 
 class GameConfig:
@@ -26,6 +25,43 @@ class GameConfig:
         self.VIRTUAL_WIDTH = 960
         self.VIRTUAL_HEIGHT = 540
 
+        # Настройки отрисовки
+        self.RENDERING = {
+            "DIRTY_RECTS": True,  # Пропускать неизменившиеся кадры и обновлять только изменения
+            "DIRTY_RECT_MARGIN": 32,  # Запас вокруг спрайта (тайлы overlap_player, кнопка)
+            "MAX_PARTIAL_AREA": 0.5,  # Доля экрана, после которой выгоднее полный показ
+            "PRESENT_MODE": "integer",  # "scale", "integer" или "native" (см. core/presenter.py)
+            "PRESENT_TIMING_HISTORY": 240  # Кадров в замерах времени каждого способа вывода
+        }
+
+        # Фоновая запись сохранений (core/save_worker.py)
+        self.SAVE = {
+            "ASYNC": True,  # False - писать файлы сразу в главном потоке
+            "COALESCE_DELAY": 0.1,  # Секунд ожидания, чтобы объединить серию сохранений в одну запись
+            "FORMAT": "binary",  # "binary" - Game/userdata/save.bin, "json" - прежние savegame.json и chests.json
+            "JOURNAL_COMPACT_RECORDS": 32,  # Записей в журнале сундуков, после которых он сжимается в сохранение
+            "SETTINGS_DEBOUNCE": 0.5  # Секунд без изменений настроек (громкость, язык) до записи файла
+        }
+
+        # Покадровый профилировщик (core/profiler.py): график по F3, выгрузка по F4
+        self.PROFILER = {
+            "ENABLED": True,  # Замерять фазы кадра
+            "HISTORY": 600,  # Кадров в кольцевом буфере
+            "FPS_HISTORY": 300,  # Записей в истории FPS (раз в 2 секунды)
+            "OVERLAY_REFRESH_FRAMES": 30,  # Раз во сколько кадров пересчитывать перцентили на экране (F3)
+            "EXPORT_DIR": "Game/userdata/profiles"  # Куда сохранять CSV и Chrome trace
+        }
+
+        # Общий кеш иконок предметов (UI/icon_cache.py)
+        self.ICON_CACHE = {
+            "MAX_UNUSED": 32  # Иконок без ссылок, которые держатся в памяти до вытеснения
+        }
+
+        # Кеш отрисованного текста (core/text_cache.py)
+        self.TEXT_CACHE = {
+            "MAX_ENTRIES": 512  # Строк текста в памяти, давно не использованные вытесняются
+        }
+
         # Настройки интерфейса
         self.BUTTON_SPACING = 125
         self._image_cache = {}
@@ -65,6 +101,14 @@ class GameConfig:
         self.CHEST_PANEL = {
             "IMAGE_PATH_RUS": "Game/assets/images/game/playerData/chest_rus.png",
             "IMAGE_PATH_ENG": "Game/assets/images/game/playerData/chest_eng.png",
+            # Раскладка слотов панели (core/chest_panel.py), координаты окна
+            "SLOT_SIZE": 70,
+            "SLOT_SPACING": 10,
+            "CHEST_COLS": 6,
+            "CHEST_GRID": (100, 200),
+            "INVENTORY_COLS": 4,
+            "INVENTORY_GRID": (800, 200),
+            "TITLE_FONT_SIZE": 36,
         }
 
         # Изображения NPC для диалогов
@@ -96,9 +140,41 @@ class GameConfig:
         self.TILE_SIZE = 100
         self.LEVEL_MAP_PATH = "Game/assets/Tiles/Royal_one.tmx"
 
+        # Потоковая подгрузка чанков карты (LevelRenderer)
+        self.LEVEL_STREAMING = {
+            "ENABLED": True,  # False - запекать все чанки при загрузке карты
+            "BUDGET_BYTES": 64 * 1024 * 1024,  # Лимит памяти под запечённые чанки
+            "PREFETCH_RING": 1,  # Сколько чанков заранее готовить по направлению движения
+            "PREFETCH_PER_FRAME": 1  # Не больше стольких фоновых запеканий за кадр
+        }
+
+        # Кеш посещённых карт (core/level_cache.py)
+        self.LEVEL_CACHE = {
+            "MAX_LEVELS": 4,  # Сколько карт держать разобранными и запечёнными
+            "MAX_BYTES": 192 * 1024 * 1024  # Лимит памяти чанков и тайлсетов всех карт в кеше
+        }
+
+        # Фоновая подготовка карт за дверями текущей комнаты (core/level_preloader.py)
+        self.LEVEL_PRELOAD = {
+            "ENABLED": True,
+            "FRAME_BUDGET_MS": 2.0,  # Сколько времени кадра можно отдать на конвертацию и запекание
+            "TRANSITION_BUDGET_MS": 8.0,  # То же, пока экран затемняется (сцена не рисуется)
+            "MIN_IDLE_MS": 2.0,  # Шаг делается, только если до следующего кадра осталось столько
+            "SWITCH_INTERVAL_MS": 0.5  # Интервал переключения GIL, пока фоновый поток разбирает TMX
+        }
+
         # Параметры игрока
         self.PLAYER_SPEED = 180
 
+        # Симуляция с фиксированным шагом (GameLoop)
+        self.SIMULATION = {
+            "FIXED_STEP": True,  # False - обновлять мир с переменным dt кадра
+            "TICK_RATE": 120,  # Шагов симуляции в секунду
+            "MAX_STEPS": 5,  # Максимум шагов догонки за один кадр
+            "INTERPOLATE": True,  # Интерполировать позиции спрайтов при отрисовке
+            "MAX_INTERPOLATION_DISTANCE": 64  # Большие скачки (телепорт) не интерполируются
+        }
+
         # Параметры хитбокса игрока
         self.PLAYER_HITBOX = {
             "WIDTH": 15,
@@ -165,7 +241,15 @@ class GameConfig:
         # Коллизии и дебаг
         self.COLLISION_SETTINGS = {
             "COLLISION_LAYER_NAME": "CollisionLayer",
-            "DEFAULT_COLLISION": True
+            "DEFAULT_COLLISION": True,
+            "GRID_CELL_SIZE": 128,  # Размер ячейки сетки коллизий (px)
+            "SWEPT_RESOLVER": True  # Swept AABB вместо перебора диагональ/X/Y
+        }
+
+        # Зоны кнопки взаимодействия (level/interaction_zones.py)
+        self.INTERACTION_ZONES = {
+            "INFLATE": 10,  # На сколько пикселей зона больше объекта (по ширине и высоте)
+            "GRID_CELL_SIZE": 128  # Размер ячейки сетки зон (px)
         }
 
         self.DEBUG_MODE = False  # Отключено для лучшей производительности
@@ -321,39 +405,13 @@ class GameConfig:
             self._save_language_setting()
 
     def _load_language_setting(self):
-        try:
-            dir_path = "userdata"
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-            config_path = os.path.join(dir_path, "config_settings.json")
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    settings = json.load(f)
-                    lang = settings.get("language")
-                    if lang in ["english", "russian"]:
-                        self.current_language = lang
-        except (FileNotFoundError, json.JSONDecodeError, OSError) as e:
-            if self.DEBUG_MODE:
-                print(f"Ошибка загрузки настроек языка: {e}")
-            pass
+        lang = settings_store.get(CONFIG_SETTINGS_PATH, "language")
+        if lang in ["english", "russian"]:
+            self.current_language = lang
 
     def _save_language_setting(self):
-        try:
-            dir_path = "userdata"
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-            config_path = os.path.join(dir_path, "config_settings.json")
-            settings = {}
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    settings = json.load(f)
-            settings["language"] = self.current_language
-            with open(config_path, "w") as f:
-                json.dump(settings, f)
-        except (FileNotFoundError, json.JSONDecodeError, OSError) as e:
-            if self.DEBUG_MODE:
-                print(f"Ошибка сохранения настроек языка: {e}")
-            pass
+        # Запись файла отложена и идёт в фоне (core/settings_store.py)
+        settings_store.update(CONFIG_SETTINGS_PATH, {"language": self.current_language})
 
     def get_text(self, key: str) -> str:
         """Возвращает локализованный текст по ключу"""
@@ -2,11 +2,98 @@
 Модуль панели диалогов.
 
 Содержит класс DialoguePanel для отображения диалоговых панелей
-с NPC, включая изображения персонажей и текст диалогов.
+с NPC, включая изображения персонажей и текст диалогов, и класс
+DialogueTextLayout - раскладку текста для эффекта печатной машинки.
 """
 
+import re
+from typing import List, Tuple
+
 import pygame
+
 from core.config import config
+from core.text_cache import fonts, text_cache
+
+
+class DialogueTextLayout:
+    """
+    Раскладка реплики для эффекта печатной машинки.
+
+    Реплика один раз разбивается по словам на строки шириной не больше
+    max_width, каждая строка отрисовывается целиком в свою поверхность,
+    и для неё запоминается ширина каждого префикса. Показ n символов -
+    это blit видимой части готовых строк (area по ширине префикса), без
+    font.render в каждом кадре.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: Tuple[int, int, int], max_width: int):
+        """
+        Инициализация раскладки.
+
+        Args:
+            font: Шрифт текста.
+            color: Цвет текста.
+            max_width: Максимальная ширина строки в пикселях.
+        """
+        self.font = font
+        self.color = color
+        self.max_width = max_width
+        self.text = None
+        # (индекс первого символа в реплике, поверхность, ширины префиксов)
+        self.lines: List[Tuple[int, pygame.Surface, List[int]]] = []
+        self.layouts = 0
+
+    def set_text(self, text: str):
+        """Раскладывает новую реплику (повторный вызов с тем же текстом ничего не делает)."""
+        if text == self.text:
+            return
+        self.text = text
+        self.lines = []
+        for start, end in self._wrap(text):
+            line = text[start:end]
+            widths = [self.font.size(line[:count])[0] for count in range(len(line) + 1)]
+            self.lines.append((start, self.font.render(line, True, self.color), widths))
+        self.layouts += 1
+
+    def _wrap(self, text: str) -> List[Tuple[int, int]]:
+        """Границы строк (начало, конец) в реплике: перенос по словам и по \\n."""
+        bounds = []
+        offset = 0
+        for paragraph in text.split("\n"):
+            line_start = line_end = None
+            for word in re.finditer(r"\S+", paragraph):
+                start, end = offset + word.start(), offset + word.end()
+                if line_start is not None and self.font.size(text[line_start:end])[0] > self.max_width:
+                    bounds.append((line_start, line_end))
+                    line_start = None
+                if line_start is None:
+                    line_start = start
+                line_end = end
+            if line_start is not None:
+                bounds.append((line_start, line_end))
+            offset += len(paragraph) + 1
+        return bounds
+
+    def draw(self, surface: pygame.Surface, pos: Tuple[int, int], shown_chars: int):
+        """
+        Выводит первые shown_chars символов реплики.
+
+        Args:
+            surface: Поверхность для отрисовки.
+            pos: Левый верхний угол текста.
+            shown_chars: Сколько символов реплики уже напечатано.
+        """
+        x, y = pos
+        line_height = self.font.get_linesize()
+        for start, line_surface, widths in self.lines:
+            visible = shown_chars - start
+            if visible <= 0:
+                break
+            if visible >= len(widths) - 1:
+                surface.blit(line_surface, (x, y))
+            else:
+                surface.blit(line_surface, (x, y), (0, 0, widths[visible], line_surface.get_height()))
+            y += line_height
 
 
 class DialoguePanel:
@@ -25,6 +112,15 @@ class DialoguePanel:
             game: Ссылка на основной объект игры.
         """
         self.game = game
+        self._layout = None
+
+    def _get_layout(self, panel_w: int) -> DialogueTextLayout:
+        """Раскладка текста под ширину панели (создаётся один раз)."""
+        max_width = panel_w - 2 * config.DIALOGUE_PANEL["TEXT_OFFSET_X"]
+        if self._layout is None or self._layout.max_width != max_width:
+            self._layout = DialogueTextLayout(fonts.get(config.DIALOGUE_PANEL["FONT_SIZE"], 'Arial'),
+                                              config.DIALOGUE_PANEL["FONT_COLOR"], max_width)
+        return self._layout
 
     def render(self):
         """Отрисовывает панель диалога с NPC."""
@@ -61,21 +157,18 @@ class DialoguePanel:
             if npc_type == 'king':
                 npc_name = "Король"
 
-        name_font = pygame.font.SysFont(
-            'Arial', config.DIALOGUE_PANEL["FONT_SIZE"] + 8, bold=True)
-        name_surface = name_font.render(
-            npc_name, True, config.DIALOGUE_PANEL["FONT_COLOR"])
+        name_surface = text_cache.render(
+            npc_name, config.DIALOGUE_PANEL["FONT_SIZE"] + 8,
+            config.DIALOGUE_PANEL["FONT_COLOR"], name='Arial', bold=True)
         name_x = x + config.DIALOGUE_PANEL["TEXT_OFFSET_X"]
         name_y = y
         self.game.virtual_screen.blit(name_surface, (name_x, name_y))
 
         # Отрисовка текста диалога
+        # Реплика раскладывается один раз, печать - это рост видимой части строк
         if self.game.dialogue_text_shown:
-            text_surface = self.game.dialogue_font.render(
-                self.game.dialogue_text_shown,
-                True,
-                config.DIALOGUE_PANEL["FONT_COLOR"]
-            )
+            layout = self._get_layout(panel_w)
+            layout.set_text(self.game.dialogue_text)
             text_x = x + config.DIALOGUE_PANEL["TEXT_OFFSET_X"]
             text_y = name_y + name_surface.get_height() + 8
-            self.game.virtual_screen.blit(text_surface, (text_x, text_y))
+            layout.draw(self.game.virtual_screen, (text_x, text_y), len(self.game.dialogue_text_shown))
@@ -0,0 +1,172 @@
+"""
+Модуль отслеживания изменившихся областей кадра.
+
+Содержит класс DirtyRectTracker, который по снимку состояния сцены
+решает, как показать кадр: пропустить (ничего не изменилось), обновить
+только изменившиеся прямоугольники или перерисовать экран целиком.
+"""
+
+import pygame
+from core.config import config
+
+
+class DirtyRectTracker:
+    """
+    Трекер «грязных» прямоугольников для состояния new_game.
+
+    Кадр описывается снимком: ключ полной перерисовки (камера, открытые
+    панели, режим отладки и т.п.) и набор отслеживаемых областей (спрайты,
+    кнопка разговора) с токенами их содержимого. Если ключ совпал с прошлым
+    кадром, перерисовываются только области с изменившимся токеном.
+    """
+
+    SKIP = "skip"
+    PARTIAL = "partial"
+    FULL = "full"
+
+    def __init__(self):
+        """Инициализация трекера."""
+        settings = config.RENDERING
+        self.enabled = settings.get("DIRTY_RECTS", False)
+        self.margin = settings.get("DIRTY_RECT_MARGIN", 32)
+        self.max_partial_ratio = settings.get("MAX_PARTIAL_AREA", 0.5)
+        self.screen_rect = pygame.Rect(0, 0, config.VIRTUAL_WIDTH, config.VIRTUAL_HEIGHT)
+        self._previous = None
+        self.stats = {self.SKIP: 0, self.PARTIAL: 0, self.FULL: 0}
+
+    def reset(self):
+        """Сбрасывает прошлый снимок: следующий кадр будет полным."""
+        self._previous = None
+
+    def capture(self, game) -> dict:
+        """
+        Делает снимок состояния сцены перед отрисовкой.
+
+        Args:
+            game: Ссылка на основной объект игры.
+
+        Returns:
+            Снимок с ключом полной перерисовки и отслеживаемыми областями.
+        """
+        player = game.player
+        camera = game.camera
+        inventory = getattr(game.player_ui, 'inventory', None) if game.player_ui else None
+        chest_handler = getattr(game, 'chest_handler', None)
+
+        # Всё, что меняет кадр целиком или рисуется поверх всего экрана;
+        # покадровые анимации (печать диалога, кадр сундука, всплывающие
+        # индикаторы) входят в ключ, иначе кадр без движения пропускался бы
+        full_key = (
+            id(game.level_renderer),
+            (camera.offset.x, camera.offset.y) if camera else None,
+            game.virtual_screen.get_size(),
+            config.DEBUG_MODE,
+            game.show_dialogue,
+            len(game.dialogue_text_shown) if game.show_dialogue else 0,
+            id(game.active_npc_obj) if game.show_dialogue else None,
+            getattr(game, 'show_chest', False),
+            chest_handler.chest_state if chest_handler else None,
+            chest_handler.current_frame if chest_handler else None,
+            chest_handler.panel_state() if chest_handler else None,
+            bool(inventory and (inventory.inventory_open or inventory.acs_open)),
+            bool(player and not player.is_alive()),
+            player.indicator_positions() if player else (),
+        )
+
+        regions = {}
+        if camera and game.all_sprites:
+            offset_x, offset_y = camera.offset.x, camera.offset.y
+            margin = self.margin
+            for sprite in game.all_sprites:
+                rect = sprite.rect
+                regions[id(sprite)] = (
+                    (int(rect.x - offset_x) - margin, int(rect.y - offset_y) - margin,
+                     rect.width + margin * 2, rect.height + margin * 2),
+                    id(sprite.image)
+                )
+
+        return {"full_key": full_key, "regions": regions,
+                "talk_alpha": game.talk_button_alpha, "talk_button": None}
+
+    def plan(self, snapshot: dict) -> str:
+        """
+        Решает, как показывать кадр.
+
+        Args:
+            snapshot: Снимок из capture().
+
+        Returns:
+            SKIP, PARTIAL или FULL.
+        """
+        previous = self._previous
+        # Отладочный текст и график профилировщика меняются каждый кадр
+        if (not self.enabled or config.DEBUG_MODE or previous is None or
+                previous["full_key"] != snapshot["full_key"]):
+            mode = self.FULL
+        elif (previous["regions"] == snapshot["regions"] and
+              previous["talk_alpha"] == snapshot["talk_alpha"]):
+            mode = self.SKIP
+        else:
+            mode = self.PARTIAL
+        self.stats[mode] += 1
+        return mode
+
+    def collect(self, snapshot: dict, talk_button_rect) -> list[pygame.Rect] | None:
+        """
+        Собирает изменившиеся прямоугольники после отрисовки и запоминает снимок.
+
+        Args:
+            snapshot: Снимок из capture().
+            talk_button_rect: Прямоугольник кнопки разговора в этом кадре
+                (None, если кнопка не рисовалась).
+
+        Returns:
+            Список прямоугольников в координатах виртуального экрана или
+            None, если выгоднее обновить экран целиком.
+        """
+        previous = self._previous
+        snapshot["talk_button"] = talk_button_rect
+        self._previous = snapshot
+        if previous is None:
+            return None
+
+        dirty = []
+        old_regions = previous["regions"]
+        new_regions = snapshot["regions"]
+        for key in old_regions.keys() | new_regions.keys():
+            old = old_regions.get(key)
+            new = new_regions.get(key)
+            if old == new:
+                continue
+            if old:
+                dirty.append(pygame.Rect(old[0]))
+            if new:
+                dirty.append(pygame.Rect(new[0]))
+
+        # Кнопка разговора: сменилась позиция/прозрачность или её задел спрайт
+        if (previous["talk_button"] != talk_button_rect or
+                previous["talk_alpha"] != snapshot["talk_alpha"] or dirty):
+            for rect in (previous["talk_button"], talk_button_rect):
+                if rect:
+                    dirty.append(pygame.Rect(rect))
+
+        return self._merge(dirty)
+
+    def _merge(self, rects: list[pygame.Rect]) -> list[pygame.Rect] | None:
+        """Обрезает по экрану и объединяет пересекающиеся прямоугольники."""
+        merged = []
+        for rect in rects:
+            rect = rect.clip(self.screen_rect)
+            if not rect.width or not rect.height:
+                continue
+            # Поглощаем все уже собранные прямоугольники, которые пересекаются с новым
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        area = sum(rect.width * rect.height for rect in merged)
+        if area > self.screen_rect.width * self.screen_rect.height * self.max_partial_ratio:
+            return None
+        return merged
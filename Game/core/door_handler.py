@@ -5,6 +5,12 @@
 с дверями и перехода между локациями.
 """
 
+from core.pathutils import normalize_map_path
+
+# Карта и точка спавна для двери без свойств target_map / spawn_point_name
+DEFAULT_TARGET_MAP = 'Game/assets/Tiles/Audience Hall .tmx'
+DEFAULT_SPAWN_POINT = 'royal_door_spawn'
+
 
 class DoorInteractionHandler:
     """
@@ -39,12 +45,23 @@ class DoorInteractionHandler:
                 setattr(player, '_steps_channel', None)
             player.is_walking = False
 
-        # Путь к новой карте можно хранить в свойстве объекта или задать явно
-        new_map_path = obj.properties.get('target_map',
-                                          'Game/assets/Tiles/Audience Hall .tmx')
-
-        # Если у двери указано spawn_point_name, передаем его
-        spawn_point_name = obj.properties.get('spawn_point_name',
-                                              'royal_door_spawn')
+        new_map_path, spawn_point_name = self.get_target(obj)
         self.game.next_spawn_point_name = spawn_point_name
         self.game.load_new_map(new_map_path)
+
+    @staticmethod
+    def get_target(obj) -> tuple[str, str]:
+        """
+        Куда ведёт дверь.
+
+        Args:
+            obj: Объект двери из карты.
+
+        Returns:
+            Кортеж (путь к карте с префиксом Game/, имя точки спавна).
+        """
+        # Путь к новой карте можно хранить в свойстве объекта или задать явно
+        new_map_path = obj.properties.get('target_map', DEFAULT_TARGET_MAP)
+        # Если у двери указано spawn_point_name, передаем его
+        spawn_point_name = obj.properties.get('spawn_point_name', DEFAULT_SPAWN_POINT)
+        return normalize_map_path(new_map_path), spawn_point_name
@@ -8,6 +8,9 @@
 import time
 import pygame
 from core.config import config
+from core.dirty_rects import DirtyRectTracker
+from core.input_state import input_state
+from core.level_preloader import level_preloader
 from core.save_manager import save_game_state
 
 
@@ -28,20 +31,66 @@ class GameLoop:
         """
         self.game = game
 
+        # Фиксированный шаг симуляции (config.SIMULATION)
+        self.accumulator = 0.0
+        self.sim_alpha = 1.0  # Доля шага для интерполяции при отрисовке
+        self.sim_steps = 0  # Шагов симуляции в последнем кадре
+        self._prev_positions = {}  # sprite -> (x, y) до последнего шага
+        self._prev_camera = None
+        self._level_loads = game.level_loads  # Загрузка карты, к которой относится состояние
+
+        # Частичная перерисовка экрана (config.RENDERING)
+        self.dirty_tracker = DirtyRectTracker()
+
     def run(self):
         """Запускает основной игровой цикл."""
         running = True
         while running:
-            self.game.dt = self.game.clock.tick(self.game.target_fps) / 1000.0
-            current_time = time.time()
+            running = self.step()
+
+    def step(self, dt: float | None = None) -> bool:
+        """
+        Выполняет один кадр: события, обновление и отрисовку.
 
-            if current_time - self.game.last_log_time >= 2.0:
-                self._log_performance()
-                self.game.last_log_time = current_time
+        Args:
+            dt: Длительность кадра в секундах. None - ждать следующего кадра
+                по target_fps (обычный режим); иначе кадр выполняется сразу
+                с заданным dt (бенчмарки и проигрывание сценариев).
 
+        Returns:
+            True, если игра должна продолжиться, False для выхода.
+        """
+        if dt is None:
+            dt = self.game.clock.tick(self.game.target_fps) / 1000.0
+        else:
+            self.game.clock.tick()
+        self.game.dt = dt
+        frame_start = time.perf_counter()
+        current_time = time.time()
+
+        if current_time - self.game.last_log_time >= 2.0:
+            self._log_performance()
+            self.game.last_log_time = current_time
+
+        profiler = self.game.profiler
+        profiler.begin_frame()
+        if self.game.game_state_manager.transition:
+            with profiler.phase("transition"):
+                self.game.game_state_manager.update_transition(dt)
+        with profiler.phase("events"):
             running = self._handle_events()
+        with profiler.phase("update"):
             self._update_game_state()
-            self._render_frame()
+        self._render_frame()
+        if self.game.game_state_manager.game_state == "new_game":
+            # Свободное время кадра - на подготовку карт за дверями; во время
+            # затемнения сцена не рисуется, и карте отдаётся больше времени
+            transition = self.game.game_state_manager.transition
+            budget = level_preloader.transition_budget if transition and transition.covers_scene else None
+            with profiler.phase("update"):
+                level_preloader.update(frame_start + 1.0 / self.game.target_fps, budget)
+        profiler.end_frame()
+        return running
 
     def _handle_events(self) -> bool:
         """
@@ -52,7 +101,8 @@ class GameLoop:
         """
         self.game.update_talk_button_state()
 
-        if self.game.waiting_for_first_update:
+        transition = self.game.game_state_manager.transition
+        if self.game.waiting_for_first_update or (transition and transition.covers_scene):
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     # Сохраняем состояние игры и настройки звука при выходе
@@ -103,6 +153,10 @@ class GameLoop:
                     self.game.player.start_attack(attack_direction)
                 continue
 
+            # Клики по слотам открытого сундука (перетаскивание предметов)
+            if is_chest_open and self.game.chest_handler.handle_event(event):
+                continue
+
             # Блокируем обработку остальных меню и UI, кроме событий для диалога/инвентаря
             if is_any_npc_dialogue or is_chest_open or is_chest_animating or is_inventory_open:
                 continue
@@ -113,6 +167,10 @@ class GameLoop:
                     config.set_debug_mode(not config.DEBUG_MODE)
                     print(f"[DEBUG] Режим отладки {'включен' if config.DEBUG_MODE else 'выключен'} (был: {old_debug})")
 
+                # Выгрузка истории профилировщика (только в режиме отладки)
+                if event.key == pygame.K_F4 and config.DEBUG_MODE:
+                    self._export_profile()
+
                 if (event.key == pygame.K_e and
                         self.game.game_state_manager.game_state == "new_game"):
                     # Не взаимодействовать, если сундук анимируется
@@ -204,6 +262,12 @@ class GameLoop:
             return
 
         if self.game.game_state_manager.game_state == "new_game":
+            transition = self.game.game_state_manager.transition
+            if transition and transition.phase == transition.FADE_OUT:
+                # Ресурсы загружаются, когда экран затемнён; пока идёт
+                # затемнение, карту готовит фоновая предзагрузка
+                return
+
             if not all([self.game.player, self.game.camera, self.game.level]):
                 self.game.game_resources.load_game_resources()
                 self.game.waiting_for_first_update = True
@@ -211,15 +275,10 @@ class GameLoop:
             if (all([self.game.player, self.game.camera, self.game.level,
                      self.game.all_sprites]) and not self.game.waiting_for_first_update):
                 if not self.game.wait_for_key_release:
-                    self.game.all_sprites.update(
-                        self.game.dt,
-                        self.game.level.width * self.game.level.tilewidth,
-                        self.game.level.height * self.game.level.tileheight,
-                        self.game.collision_objects
-                    )
-                    self.game.camera.update(self.game.player)
+                    self._simulate()
                 else:
-                    keys = pygame.key.get_pressed()
+                    self.accumulator = 0.0
+                    keys = input_state.get_pressed()
                     move_keys = [
                         pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
                         pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT
@@ -233,6 +292,8 @@ class GameLoop:
                 self.game.waiting_for_first_update = False
                 self.game.wait_for_key_release = True
 
+            self._update_dialogue()
+
             # Обновляем анимацию сундука
             if hasattr(self.game, 'chest_handler'):
                 self.game.chest_handler.update(self.game.dt)
@@ -246,68 +307,241 @@ class GameLoop:
                 if not self.game.player.hitbox.colliderect(obj_rect.inflate(40, 40)):
                     self.game.chest_handler.close()
 
+    def _update_dialogue(self):
+        """Печатает текст диалога и закрывает его по истечении SHOW_DURATION.
+
+        Выполняется в обновлении, а не в отрисовке: кадр без изменений
+        пропускается трекером, и печать не должна от этого зависеть.
+        """
+        if not (self.game.show_dialogue and self.game.dialogue_panel_img):
+            return
+        self.game.update_typewriter_text()
+
+        # --- Авто-закрытие диалога для всех NPC, включая короля ---
+        if (self.game.active_npc_obj and
+                time.time() - self.game.dialogue_start_time > config.DIALOGUE_PANEL["SHOW_DURATION"]):
+            self.game.show_dialogue = False
+            self.game.dialogue_text = ""
+            self.game.dialogue_text_shown = ""
+            self.game.active_npc_obj = None
+
+    def _simulate(self):
+        """Продвигает игровой мир: фиксированными шагами или на dt кадра.
+
+        В режиме фиксированного шага время кадра копится в аккумуляторе и
+        расходуется шагами 1/TICK_RATE, поэтому физика и выносливость не
+        зависят от FPS отрисовки. Число шагов догонки за кадр ограничено,
+        лишнее время после подвисания отбрасывается.
+        """
+        self._sync_level()
+        level_width = self.game.level.width * self.game.level.tilewidth
+        level_height = self.game.level.height * self.game.level.tileheight
+        sim = config.SIMULATION
+
+        if not sim.get("FIXED_STEP", False):
+            self.game.all_sprites.update(self.game.dt, level_width, level_height,
+                                         self.game.collision_objects)
+            self.game.camera.update(self.game.player)
+            self.sim_alpha = 1.0
+            self.sim_steps = 1
+            self._prev_positions.clear()
+            return
+
+        step = 1.0 / sim["TICK_RATE"]
+        self.accumulator += self.game.dt
+        steps = 0
+        while self.accumulator >= step and steps < sim["MAX_STEPS"]:
+            self._store_previous_state()
+            self.game.all_sprites.update(step, level_width, level_height,
+                                         self.game.collision_objects)
+            self.game.camera.update(self.game.player)
+            self.accumulator -= step
+            steps += 1
+
+        if self.accumulator >= step:
+            if config.DEBUG_MODE:
+                print(f"[SIM] Догонка ограничена {steps} шагами, "
+                      f"отброшено {self.accumulator * 1000:.1f} мс")
+            self.accumulator %= step
+
+        self.sim_steps = steps
+        self.sim_alpha = self.accumulator / step
+
+    def reset_simulation(self):
+        """Сбрасывает аккумулятор и позиции для интерполяции (новая карта)."""
+        self.accumulator = 0.0
+        self.sim_alpha = 1.0
+        self._prev_positions = {}
+        self._prev_camera = None
+
+    def _sync_level(self):
+        """Сбрасывает состояние симуляции, если с прошлого кадра загружена карта."""
+        if self._level_loads != self.game.level_loads:
+            self._level_loads = self.game.level_loads
+            self.reset_simulation()
+
+    def _store_previous_state(self):
+        """Запоминает позиции спрайтов и камеры перед шагом симуляции."""
+        self._prev_positions = {sprite: (sprite.rect.x, sprite.rect.y)
+                                for sprite in self.game.all_sprites}
+        offset = self.game.camera.offset
+        self._prev_camera = (offset.x, offset.y)
+
+    def _apply_interpolation(self):
+        """Временно сдвигает спрайты и камеру между двумя шагами симуляции.
+
+        Returns:
+            Сохранённые позиции для _restore_interpolation или None.
+        """
+        self._sync_level()
+        sim = config.SIMULATION
+        if not (sim.get("FIXED_STEP", False) and sim.get("INTERPOLATE", False)):
+            return None
+        if not self._prev_positions or self.sim_alpha >= 1.0:
+            return None
+
+        alpha = self.sim_alpha
+        max_distance = sim.get("MAX_INTERPOLATION_DISTANCE", 64)
+        saved_rects = []
+        for sprite, (prev_x, prev_y) in self._prev_positions.items():
+            rect = sprite.rect
+            cur_x, cur_y = rect.x, rect.y
+            if abs(cur_x - prev_x) > max_distance or abs(cur_y - prev_y) > max_distance:
+                continue
+            saved_rects.append((rect, cur_x, cur_y))
+            rect.x = prev_x + (cur_x - prev_x) * alpha
+            rect.y = prev_y + (cur_y - prev_y) * alpha
+
+        saved_camera = None
+        camera = self.game.camera
+        if camera and self._prev_camera:
+            prev_x, prev_y = self._prev_camera
+            cur_x, cur_y = camera.offset.x, camera.offset.y
+            if abs(cur_x - prev_x) <= max_distance and abs(cur_y - prev_y) <= max_distance:
+                saved_camera = (cur_x, cur_y)
+                camera.offset.x = prev_x + (cur_x - prev_x) * alpha
+                camera.offset.y = prev_y + (cur_y - prev_y) * alpha
+
+        return saved_rects, saved_camera
+
+    def _restore_interpolation(self, saved):
+        """Возвращает спрайтам и камере позиции последнего шага симуляции."""
+        if saved is None:
+            return
+        saved_rects, saved_camera = saved
+        for rect, x, y in saved_rects:
+            rect.x = x
+            rect.y = y
+        if saved_camera and self.game.camera:
+            self.game.camera.offset.x, self.game.camera.offset.y = saved_camera
+
     def _render_frame(self):
         """Отрисовывает текущий кадр."""
         if self.game.game_state_manager.current_menu:
+            self.dirty_tracker.reset()
             self.game.screen.fill((0, 0, 0))
             mouse_pos = pygame.mouse.get_pos()
-            self.game.game_state_manager.current_menu.draw(self.game.screen, mouse_pos)
-            pygame.display.flip()
+            with self.game.profiler.phase("ui"):
+                self.game.game_state_manager.current_menu.draw(self.game.screen, mouse_pos)
+            with self.game.profiler.phase("flip"):
+                pygame.display.flip()
 
         elif self.game.game_state_manager.game_state == "new_game":
-            self.game.virtual_screen.fill((0, 0, 0))
-            self.game.render_game()
+            frame_start = time.perf_counter()
+            presenter = self.game.presenter
+            profiler = self.game.profiler
+            transition = self.game.game_state_manager.transition
+            if transition and transition.covers_scene:
+                # Затемнение поверх снимка прежнего экрана; сцену не рисуем
+                with profiler.phase("transition"):
+                    self.game.game_state_manager.draw_transition(self.game.screen)
+                with profiler.phase("flip"):
+                    pygame.display.flip()
+                return
+            if transition:
+                # Осветление меняет весь экран - кадр всегда полный
+                self.dirty_tracker.reset()
             self.game.update_talk_button_alpha()
-
-            # Отрисовка кнопки разговора
-            if (self.game.talk_button_img and self.game.talk_button_alpha > 0 and
-                    not self.game.show_dialogue and not self.game.game_state_manager.current_menu):
-                btn_w, btn_h = self.game.talk_button_img.get_size()
-
-                if self.game.player and self.game.camera:
-                    player_screen_x = (self.game.player.hitbox.centerx -
-                                       self.game.camera.offset.x)
-                    player_screen_y = (self.game.player.hitbox.centery -
-                                       self.game.camera.offset.y)
-                    x = player_screen_x - btn_w // 2
-                    y = player_screen_y - btn_h + config.DIALOGUE_BUTTON["OFFSET_Y"]
+            interpolation = self._apply_interpolation()
+
+            # Ничего не изменилось - не рисуем и не показываем кадр
+            snapshot = self.dirty_tracker.capture(self.game)
+            present_mode = self.dirty_tracker.plan(snapshot)
+            if present_mode == DirtyRectTracker.SKIP:
+                self._restore_interpolation(interpolation)
+                if self.game.player_ui:
+                    with profiler.phase("ui"):
+                        self.game.player_ui.update(self.game.dt)
+                return
+
+            # В режиме native уровень рисуется прямо в окно уже увеличенным
+            native = presenter.wants_native()
+            if native:
+                with profiler.phase("level"):
+                    presenter.begin_native()
+            else:
+                self.game.virtual_screen.fill((0, 0, 0))
+            self.game.render_game(draw_level=not native)
+            talk_button_rect = None
+
+            with profiler.phase("ui"):
+                # Отрисовка кнопки разговора
+                if (self.game.talk_button_img and self.game.talk_button_alpha > 0 and
+                        not self.game.show_dialogue and not self.game.game_state_manager.current_menu):
+                    btn_w, btn_h = self.game.talk_button_img.get_size()
+
+                    if self.game.player and self.game.camera:
+                        player_screen_x = (self.game.player.hitbox.centerx -
+                                           self.game.camera.offset.x)
+                        player_screen_y = (self.game.player.hitbox.centery -
+                                           self.game.camera.offset.y)
+                        x = player_screen_x - btn_w // 2
+                        y = player_screen_y - btn_h + config.DIALOGUE_BUTTON["OFFSET_Y"]
+                    else:
+                        x = (config.VIRTUAL_WIDTH - btn_w) // 2
+                        y = config.VIRTUAL_HEIGHT - btn_h - config.DIALOGUE_BUTTON["FALLBACK_Y"]
+
+                    btn_img = self.game.talk_button_img.copy()
+                    btn_img.set_alpha(int(self.game.talk_button_alpha))
+                    self.game.virtual_screen.blit(btn_img, (x, y))
+                    self.game.talk_button_rect = pygame.Rect(x, y, btn_w, btn_h)
+                    talk_button_rect = self.game.talk_button_rect
+
+                self._restore_interpolation(interpolation)
+
+                # Отрисовка диалогов
+                if self.game.show_dialogue and self.game.dialogue_panel_img:
+                    self.game.dialogue_panel.render()
+
+            # Камера стоит - показываем только изменившиеся области
+            dirty_rects = self.dirty_tracker.collect(snapshot, talk_button_rect)
+            # Панель сундука рисуется поверх окна: частичный вывод затёр бы её
+            chest_open = getattr(self.game, 'show_chest', False)
+            with profiler.phase("scale"):
+                if native:
+                    present_path = "native"
+                    presenter.end_native()
+                elif (present_mode == DirtyRectTracker.PARTIAL and dirty_rects is not None and not chest_open and
+                        presenter.present_partial(self.game.virtual_screen, dirty_rects)):
+                    present_path = "partial"
                 else:
-                    x = (config.VIRTUAL_WIDTH - btn_w) // 2
-                    y = config.VIRTUAL_HEIGHT - btn_h - config.DIALOGUE_BUTTON["FALLBACK_Y"]
-
-                btn_img = self.game.talk_button_img.copy()
-                btn_img.set_alpha(int(self.game.talk_button_alpha))
-                self.game.virtual_screen.blit(btn_img, (x, y))
-                self.game.talk_button_rect = pygame.Rect(x, y, btn_w, btn_h)
-
-            # Отрисовка диалогов
-            if self.game.show_dialogue and self.game.dialogue_panel_img:
-                self.game.update_typewriter_text()
-                self.game.dialogue_panel.render()
-
-                if self.game.active_npc_obj:
-                    npc_type = self.game.active_npc_obj.properties.get(
-                        'interactive_type', '').lower()
-                    # --- Авто-закрытие диалога для всех NPC, включая короля ---
-                    if (time.time() - self.game.dialogue_start_time > config.DIALOGUE_PANEL["SHOW_DURATION"]):
-                        self.game.show_dialogue = False
-                        self.game.dialogue_text = ""
-                        self.game.dialogue_text_shown = ""
-                        self.game.active_npc_obj = None
-
-            scaled_screen = pygame.transform.scale(
-                self.game.virtual_screen, (config.WIDTH, config.HEIGHT))
-            self.game.screen.blit(scaled_screen, (0, 0))
+                    present_path = presenter.present(self.game.virtual_screen)
+            if present_path == "partial":
+                presenter.record("partial", time.perf_counter() - frame_start)
+                return
             
             # Отрисовка интерфейса сундука на фактическом экране (как инвентарь)
-            if getattr(self.game, 'show_chest', False) and self.game.chest_panel_img:
-                img = self.game.chest_panel_img
-                img_w, img_h = img.get_width(), img.get_height()
-                x = (config.WIDTH - img_w) // 2
-                y = (config.HEIGHT - img_h) // 2
-                self.game.screen.blit(img, (x, y))
-            
-            pygame.display.flip()
+            if chest_open:
+                with profiler.phase("ui"):
+                    self.game.chest_handler.draw_panel(self.game.screen)
+
+            if transition:
+                with profiler.phase("transition"):
+                    self.game.game_state_manager.draw_transition(self.game.screen)
+
+            with profiler.phase("flip"):
+                pygame.display.flip()
+            presenter.record(present_path, time.perf_counter() - frame_start)
 
     def _get_attack_direction(self) -> str:
         """
@@ -347,5 +581,21 @@ class GameLoop:
         self.game.fps_history.append(current_fps)
 
         if config.DEBUG_MODE:
+            stats = self.game.profiler.get_stats()
+            frame_text = ""
+            if stats["frames"]:
+                frame = stats["frame"]
+                frame_text = (f" | Frame p50/p95/p99: {frame['p50']:.1f}/{frame['p95']:.1f}/"
+                              f"{frame['p99']:.1f} ms, max {frame['max']:.1f} ms")
             print(f"[PERF] FPS: {current_fps:.1f} | "
-                  f"State: {self.game.game_state_manager.game_state}")
+                  f"State: {self.game.game_state_manager.game_state}{frame_text}")
+
+    def _export_profile(self):
+        """Сохраняет историю кадров профилировщика в CSV и Chrome trace."""
+        profiler = self.game.profiler
+        try:
+            csv_path = profiler.export_csv()
+            trace_path = profiler.export_chrome_trace()
+            print(f"[PROFILER] История кадров сохранена: {csv_path}, {trace_path}")
+        except OSError as e:
+            print(f"[PROFILER ERROR] Не удалось сохранить профиль: {e}")
@@ -11,11 +11,100 @@ from level.player import Player
 from level.camera import Camera
 from level.level_renderer import LevelRenderer
 from level.collisions import CollisionHandler
+from level.interaction_zones import InteractionZones
+from level.map_objects import MapObjectRegistry
 from core.config import config
+from core.door_handler import DoorInteractionHandler
+from core.level_cache import level_cache
+from core.level_preloader import level_preloader
 from core.pathutils import resource_path
 from core.sound_manager import SoundManager
 
 
+def load_level_data(map_path: str) -> dict:
+    """
+    Разбирает карту: TMX, реестр объектов, коллизии, интерактивные объекты и сундуки.
+
+    Не создаёт поверхностей pygame, поэтому вызывается и из фонового
+    потока предзагрузки (core/level_preloader.py).
+
+    Args:
+        map_path: Путь к TMX.
+
+    Returns:
+        Запись для кеша карт (рендерер создаётся позже, с камерой).
+    """
+    if config.DEBUG_MODE:
+        print("Загрузка карты...")
+
+    level = pytmx.TiledMap(resource_path(map_path))
+    map_width = level.width * level.tilewidth
+    map_height = level.height * level.tileheight
+
+    if config.DEBUG_MODE:
+        print(f"Карта загружена. Размер: {map_width}x{map_height}")
+
+    # Один проход по объектным слоям; коллизии, интерактивные объекты,
+    # сундуки и точки спавна берутся из индексов реестра
+    map_objects = MapObjectRegistry(level)
+    collision_handler = CollisionHandler()
+    collision_objects = collision_handler.load_collision_objects(level, map_objects)
+    interactive_objects = map_objects.interactive
+    chest_objects = map_objects.chests  # Список объектов сундуков для анимации
+
+    if config.DEBUG_MODE:
+        for obj in chest_objects:
+            print(f"[RESOURCES] Найден объект chest на слое {map_objects.layer_of(obj)}: pos=({obj.x}, {obj.y}), properties={dict(obj.properties)}")
+
+    if config.DEBUG_MODE:
+        print(f"Загружено объектов коллизий: {len(collision_objects)}")
+        print(f"Загружено интерактивных объектов: {len(interactive_objects)}")
+        print(f"Загружено объектов chest: {len(chest_objects)}")
+
+    return {
+        "level": level,
+        "map_objects": map_objects,
+        "collision_handler": collision_handler,
+        "collision_objects": collision_objects,
+        "interactive_objects": interactive_objects,
+        "interaction_zones": InteractionZones(interactive_objects),
+        "chest_objects": chest_objects,
+        "level_renderer": None,
+        "map_size": (map_width, map_height),
+    }
+
+
+def find_spawn_point(map_objects: MapObjectRegistry, spawn_point_name: str | None = None) -> tuple[int, int]:
+    """
+    Находит точку спавна игрока на карте.
+
+    Args:
+        map_objects: Реестр объектов карты.
+        spawn_point_name: Имя (или object_type) точки на слое PlayerSpawn;
+            если не найдена - точка player_spawn.
+
+    Returns:
+        Кортеж (x, y) с координатами точки спавна.
+    """
+    if spawn_point_name:
+        spawn = map_objects.first(map_objects.find(layer="PlayerSpawn", object_type=spawn_point_name),
+                                  map_objects.find(layer="PlayerSpawn", name=spawn_point_name))
+        if spawn is not None:
+            return int(spawn.x), int(spawn.y)
+
+    spawn = map_objects.first(map_objects.find(layer="PlayerSpawn", object_type="player_spawn"))
+    if spawn is not None:
+        if config.DEBUG_MODE:
+            print(f"Найден спавн игрока: ({int(spawn.x)}, {int(spawn.y)})")
+        return int(spawn.x), int(spawn.y)
+
+    spawn_x = 200
+    spawn_y = 200
+    if config.DEBUG_MODE:
+        print(f"Спавн не найден, используем fallback: ({spawn_x}, {spawn_y})")
+    return spawn_x, spawn_y
+
+
 class GameResources:
     """
     Класс для загрузки и управления игровыми ресурсами.
@@ -33,138 +122,178 @@ class GameResources:
         """
         self.game = game
 
-    def load_game_resources(self):
+    def load_game_resources(self, keep_player: bool = False):
         """
         Загружает все игровые ресурсы.
         
         Включает загрузку карты, создание игрока, камеры,
         обработчика коллизий и других игровых объектов.
+
+        Args:
+            keep_player: Оставить текущих игрока, UI и камеру (переход
+                через дверь). Иначе они создаются заново (новая игра, загрузка).
         """
         try:
-            if config.DEBUG_MODE:
-                print("Загрузка карты...")
+            map_path = config.LEVEL_MAP_PATH
+            entry = level_cache.get(map_path)
+            if entry is None:
+                # Карта могла быть уже разобрана фоном, пока игрок шёл к двери
+                entry = level_preloader.take(map_path) or load_level_data(map_path)
+            elif config.DEBUG_MODE:
+                print(f"[LEVEL CACHE] Карта взята из кеша: {map_path}")
 
-            self.game.level = pytmx.TiledMap(resource_path(config.LEVEL_MAP_PATH))
-            map_width = self.game.level.width * self.game.level.tilewidth
-            map_height = self.game.level.height * self.game.level.tileheight
+            self.game.level = entry["level"]
+            self.game.map_objects = entry["map_objects"]
+            self.game.collision_handler = entry["collision_handler"]
+            self.game.collision_objects = entry["collision_objects"]
+            self.game.interactive_objects = entry["interactive_objects"]
+            self.game.interaction_zones = entry["interaction_zones"]
+            self.game.chest_objects = entry["chest_objects"]
+            map_width, map_height = entry["map_size"]
 
-            if config.DEBUG_MODE:
-                print(f"Карта загружена. Размер: {map_width}x{map_height}")
+            if keep_player and self.game.player and self.game.player_ui and self.game.camera:
+                self._move_player(map_width, map_height)
+            else:
+                self._create_player(map_width, map_height)
 
-            # Загрузка коллизий
-            self.game.collision_handler = CollisionHandler()
-            self.game.collision_objects = self.game.collision_handler.load_collision_objects(self.game.level)
-            self.game.interactive_objects = []
-            self.game.chest_objects = []  # Список объектов сундуков для анимации
+            # Рендерер с запечёнными чанками живёт в кеше вместе с картой
+            if entry["level_renderer"] is None:
+                entry["level_renderer"] = LevelRenderer(self.game.level, self.game.camera)
+            else:
+                entry["level_renderer"].attach_camera(self.game.camera)
+            self.game.level_renderer = entry["level_renderer"]
+            level_cache.put(map_path, entry)
+            # Игрок и камера перенесены: GameLoop не должен интерполировать
+            # их от позиций прежней карты
+            self.game.level_loads += 1
 
-            # Загрузка интерактивных объектов
-            for layer in self.game.level.layers:
-                if hasattr(layer, 'name') and hasattr(layer, '__iter__'):
-                    if config.DEBUG_MODE:
-                        print(f"[RESOURCES] Проверка слоя: {layer.name}")
-                    for obj in layer:
-                        if hasattr(obj, 'properties') and obj.properties.get('interactive', False):
-                            self.game.interactive_objects.append(obj)
-                        # Отдельно сохраняем сундуки из слоя chest
-                        if hasattr(obj, 'properties') and obj.properties.get('chest', False):
-                            if config.DEBUG_MODE:
-                                print(f"[RESOURCES] Найден объект chest на слое {layer.name}: pos=({obj.x}, {obj.y}), properties={dict(obj.properties)}")
-                            self.game.chest_objects.append(obj)
+            # Обновление игрока и камеры
+            self.game.player.update(0, map_width, map_height, self.game.collision_objects)
+            if self.game.camera and self.game.player:
+                self.game.camera.update(self.game.player)
+                self.game.level_renderer.warm_up()
 
-            if config.DEBUG_MODE:
-                print(f"Загружено объектов коллизий: {len(self.game.collision_objects)}")
-                print(f"Загружено интерактивных объектов: {len(self.game.interactive_objects)}")
-                print(f"Загружено объектов chest: {len(self.game.chest_objects)}")
+            # Карты за дверями этой комнаты готовятся заранее
+            level_preloader.schedule(self._door_targets(map_path))
 
-            # Создаем менеджер звука
-            self.sound_manager = SoundManager()
-            if config.DEBUG_MODE:
-                print(f"[RESOURCES DEBUG] Создан sound_manager: {self.sound_manager}")
-            
-            # Устанавливаем ссылку на game в sound_manager для доступа к глобальному состоянию
-            self.sound_manager.game = self.game
+        except Exception as e:
             if config.DEBUG_MODE:
-                print(f"[RESOURCES DEBUG] Установлен game в sound_manager: {self.sound_manager.game}")
-                print(f"[RESOURCES DEBUG] inventory_open_state: {getattr(self.game, 'inventory_open_state', 'NOT_FOUND')}")
-
-            # Сохраняем данные инвентаря (включая экипировку) ПЕРЕД созданием нового игрока
-            saved_inventory_data = None
-            if hasattr(self.game, 'player_ui') and self.game.player_ui:
-                if hasattr(self.game.player_ui, 'inventory') and hasattr(self.game.player_ui.inventory, 'to_dict'):
-                    saved_inventory_data = self.game.player_ui.inventory.to_dict()
-                    self.game.inventory_open_state = self.game.player_ui.inventory.inventory_open
-                    if config.DEBUG_MODE:
-                        print(f"[RESOURCES DEBUG] Сохранены данные инвентаря (включая экипировку)")
-                        print(f"[RESOURCES DEBUG] Состояние открытия инвентаря: {self.game.inventory_open_state}")
-                else:
-                    self.game.inventory_open_state = False
+                print(f"Ошибка загрузки ресурсов: {e}")
+            raise
+
+    def _door_targets(self, map_path: str) -> list[tuple[str, str]]:
+        """
+        Карты, в которые ведут двери текущей карты.
+
+        Returns:
+            Список (путь к карте, имя точки спавна) без текущей карты.
+        """
+        targets = []
+        for obj in self.game.map_objects.find(interactive_type='doors'):
+            if obj.properties.get('interactive', False):
+                target = DoorInteractionHandler.get_target(obj)
+                if target[0] != map_path and target not in targets:
+                    targets.append(target)
+        return targets
+
+    def _move_player(self, map_width: int, map_height: int):
+        """
+        Переносит текущего игрока на точку спавна новой карты.
+
+        Игрок, его UI с инвентарём и камера не пересоздаются: меняются
+        только позиция и границы камеры.
+        """
+        spawn_x, spawn_y = self._find_spawn_point()
+        self.game.player.place_at(spawn_x, spawn_y)
+        self.game.camera.set_level_size(map_width, map_height)
+        if config.DEBUG_MODE:
+            print(f"[RESOURCES DEBUG] Игрок перенесён на новую карту: {self.game.player.hitbox.topleft}")
+
+    def _create_player(self, map_width: int, map_height: int):
+        """
+        Создаёт игрока, его UI и камеру.
+
+        Данные инвентаря прежнего игрока (если он был) переносятся
+        в новый инвентарь.
+        """
+        # Создаем менеджер звука
+        self.sound_manager = SoundManager()
+        if config.DEBUG_MODE:
+            print(f"[RESOURCES DEBUG] Создан sound_manager: {self.sound_manager}")
+
+        # Устанавливаем ссылку на game в sound_manager для доступа к глобальному состоянию
+        self.sound_manager.game = self.game
+        if config.DEBUG_MODE:
+            print(f"[RESOURCES DEBUG] Установлен game в sound_manager: {self.sound_manager.game}")
+            print(f"[RESOURCES DEBUG] inventory_open_state: {getattr(self.game, 'inventory_open_state', 'NOT_FOUND')}")
+
+        # Сохраняем данные инвентаря (включая экипировку) ПЕРЕД созданием нового игрока
+        saved_inventory_data = None
+        if hasattr(self.game, 'player_ui') and self.game.player_ui:
+            if hasattr(self.game.player_ui, 'inventory') and hasattr(self.game.player_ui.inventory, 'to_dict'):
+                saved_inventory_data = self.game.player_ui.inventory.to_dict()
+                self.game.inventory_open_state = self.game.player_ui.inventory.inventory_open
+                if config.DEBUG_MODE:
+                    print(f"[RESOURCES DEBUG] Сохранены данные инвентаря (включая экипировку)")
+                    print(f"[RESOURCES DEBUG] Состояние открытия инвентаря: {self.game.inventory_open_state}")
             else:
                 self.game.inventory_open_state = False
-                if config.DEBUG_MODE:
-                    print(f"[RESOURCES DEBUG] player_ui не существует, используем False")
-
-            # Создание игрока
+        else:
+            self.game.inventory_open_state = False
             if config.DEBUG_MODE:
-                print("Создание игрока...")
+                print(f"[RESOURCES DEBUG] player_ui не существует, используем False")
 
-            spawn_x, spawn_y = self._find_spawn_point()
+        # Создание игрока
+        if config.DEBUG_MODE:
+            print("Создание игрока...")
 
-            # Передаем ссылку на game в sound_manager, чтобы Player мог получить game
-            self.game.sound_manager.game = self.game
-            self.game.player = Player(spawn_x, spawn_y, self.game.sound_manager)
+        spawn_x, spawn_y = self._find_spawn_point()
 
-            if config.DEBUG_MODE:
-                print(f"Игрок создан. Позиция: {self.game.player.hitbox.topleft}")
-                print(f"Размер спрайта: {self.game.player.image.get_size()}")
-                print(f"Размер хитбокса: {self.game.player.hitbox.size}")
+        # Передаем ссылку на game в sound_manager, чтобы Player мог получить game
+        self.game.sound_manager.game = self.game
+        self.game.player = Player(spawn_x, spawn_y, self.game.sound_manager)
 
-            if config.DEBUG_MODE:
-                print(f"[RESOURCES DEBUG] Перед созданием UI: inventory_open_state={self.game.inventory_open_state}")
-
-            # Инициализация UI игрока
-            from UI.player_ui import PlayerUI
-            self.game.player_ui = PlayerUI(self.game.virtual_screen, self.game.player.stats)
-            
-            # Восстанавливаем данные инвентаря (включая экипировку), если они были сохранены
-            if saved_inventory_data and hasattr(self.game.player_ui, 'inventory'):
-                if hasattr(self.game.player_ui.inventory, 'load_from_dict'):
-                    try:
-                        self.game.player_ui.inventory.load_from_dict(saved_inventory_data)
-                        if config.DEBUG_MODE:
-                            print(f"[RESOURCES DEBUG] Данные инвентаря восстановлены (включая экипировку)")
-                        
-                        # Обновляем анимации игрока после восстановления экипировки
-                        if hasattr(self.game.player, 'reload_animations'):
-                            self.game.player.reload_animations()
-                            if config.DEBUG_MODE:
-                                print(f"[RESOURCES DEBUG] Анимации игрока обновлены после восстановления экипировки")
-                    except Exception as e:
+        if config.DEBUG_MODE:
+            print(f"Игрок создан. Позиция: {self.game.player.hitbox.topleft}")
+            print(f"Размер спрайта: {self.game.player.image.get_size()}")
+            print(f"Размер хитбокса: {self.game.player.hitbox.size}")
+
+        if config.DEBUG_MODE:
+            print(f"[RESOURCES DEBUG] Перед созданием UI: inventory_open_state={self.game.inventory_open_state}")
+
+        # Инициализация UI игрока
+        from UI.player_ui import PlayerUI
+        self.game.player_ui = PlayerUI(self.game.virtual_screen, self.game.player.stats)
+
+        # Восстанавливаем данные инвентаря (включая экипировку), если они были сохранены
+        if saved_inventory_data and hasattr(self.game.player_ui, 'inventory'):
+            if hasattr(self.game.player_ui.inventory, 'load_from_dict'):
+                try:
+                    self.game.player_ui.inventory.load_from_dict(saved_inventory_data)
+                    if config.DEBUG_MODE:
+                        print(f"[RESOURCES DEBUG] Данные инвентаря восстановлены (включая экипировку)")
+
+                    # Обновляем анимации игрока после восстановления экипировки
+                    if hasattr(self.game.player, 'reload_animations'):
+                        self.game.player.reload_animations()
                         if config.DEBUG_MODE:
-                            print(f"[RESOURCES DEBUG] Ошибка при восстановлении инвентаря: {e}")
-            
-            # Подписываем UI на изменения характеристик
-            self.game.player.stats.add_observer(self.game.player_ui)
-            
-            if config.DEBUG_MODE:
-                print(f"[RESOURCES DEBUG] UI игрока создан: {self.game.player_ui}")
-                print(f"[RESOURCES DEBUG] Статистика игрока: HP={self.game.player.stats.health.current_value}/{self.game.player.stats.health.max_value}")
-                print(f"[RESOURCES DEBUG] UI подписан на изменения характеристик")
+                            print(f"[RESOURCES DEBUG] Анимации игрока обновлены после восстановления экипировки")
+                except Exception as e:
+                    if config.DEBUG_MODE:
+                        print(f"[RESOURCES DEBUG] Ошибка при восстановлении инвентаря: {e}")
 
-            self.game.all_sprites = pygame.sprite.Group()
-            # Player наследуется от pygame.sprite.Sprite, поэтому можно добавлять в группу
-            self.game.all_sprites.add(self.game.player)  # type: ignore
-            self.game.camera = Camera(map_width, map_height)
-            self.game.level_renderer = LevelRenderer(self.game.level, self.game.camera)
+        # Подписываем UI на изменения характеристик
+        self.game.player.stats.add_observer(self.game.player_ui)
 
-            # Обновление игрока и камеры
-            self.game.player.update(0, map_width, map_height, self.game.collision_objects)
-            if self.game.camera and self.game.player:
-                self.game.camera.update(self.game.player)
+        if config.DEBUG_MODE:
+            print(f"[RESOURCES DEBUG] UI игрока создан: {self.game.player_ui}")
+            print(f"[RESOURCES DEBUG] Статистика игрока: HP={self.game.player.stats.health.current_value}/{self.game.player.stats.health.max_value}")
+            print(f"[RESOURCES DEBUG] UI подписан на изменения характеристик")
 
-        except Exception as e:
-            if config.DEBUG_MODE:
-                print(f"Ошибка загрузки ресурсов: {e}")
-            raise
+        self.game.all_sprites = pygame.sprite.Group()
+        # Player наследуется от pygame.sprite.Sprite, поэтому можно добавлять в группу
+        self.game.all_sprites.add(self.game.player)  # type: ignore
+        self.game.camera = Camera(map_width, map_height)
 
     def _find_spawn_point(self) -> tuple[int, int]:
         """
@@ -173,45 +302,9 @@ class GameResources:
         Returns:
             Кортеж (x, y) с координатами точки спавна.
         """
-        spawn_x = 200
-        spawn_y = 200
-
-        # Поиск точки спавна
-        spawn_found = False
         spawn_point_name = getattr(self.game, 'next_spawn_point_name', None)
-
-        if spawn_point_name:
-            for layer in self.game.level.layers:
-                if hasattr(layer, 'name') and layer.name == "PlayerSpawn":
-                    for obj in layer:
-                        if (hasattr(obj, 'properties') and
-                            obj.properties.get("object_type") == spawn_point_name) or \
-                                (hasattr(obj, 'name') and obj.name == spawn_point_name):
-                            spawn_x = int(obj.x)
-                            spawn_y = int(obj.y)
-                            spawn_found = True
-                            break
-                    if spawn_found:
-                        break
-            self.game.next_spawn_point_name = None
-
-        if not spawn_found:
-            for layer in self.game.level.layers:
-                if hasattr(layer, 'name') and layer.name == "PlayerSpawn":
-                    for obj in layer:
-                        if (hasattr(obj, 'properties') and
-                                obj.properties.get("object_type") == "player_spawn"):
-                            spawn_x = int(obj.x)
-                            spawn_y = int(obj.y)
-                            if config.DEBUG_MODE:
-                                print(f"Найден спавн игрока: ({spawn_x}, {spawn_y})")
-                            break
-                    break
-            else:
-                if config.DEBUG_MODE:
-                    print(f"Спавн не найден, используем fallback: ({spawn_x}, {spawn_y})")
-
-        return spawn_x, spawn_y
+        self.game.next_spawn_point_name = None
+        return find_spawn_point(self.game.map_objects, spawn_point_name)
 
     def load_new_map(self, map_path: str):
         """
@@ -221,6 +314,6 @@ class GameResources:
             map_path: Путь к новой карте.
         """
         setattr(config, 'LEVEL_MAP_PATH', map_path)
-        self.load_game_resources()
+        self.load_game_resources(keep_player=True)
         self.game.waiting_for_first_update = True
         self.game.wait_for_key_release = True
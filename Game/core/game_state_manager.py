@@ -2,11 +2,11 @@
 Модуль управления состоянием игры.
 
 Содержит класс GameStateManager для управления различными состояниями игры,
-включая переходы между меню и игровым процессом с анимациями.
+включая переходы между меню и игровым процессом с анимациями, и класс
+FadeTransition - fade-переход, который обновляется в игровом цикле
+покадрово, не блокируя его.
 """
 
-import sys
-import time
 import pygame
 from core.config import config
 
@@ -29,8 +29,10 @@ class GameStateManager:
         self.game_state = "main_menu"
         self.current_menu = None
         self.sound_manager = sound_manager
-        self.fade_surface = pygame.Surface(config.SCREEN_SIZE, pygame.SRCALPHA)
+        # Непрозрачная чёрная поверхность: прозрачность задаётся set_alpha, без заливки в каждом кадре
+        self.fade_surface = pygame.Surface(config.SCREEN_SIZE)
         self.should_process_menu = True  # Новый флаг
+        self.transition = None  # Текущий FadeTransition (обновляет GameLoop)
 
     def change_state(self, new_state: str, menu=None) -> None:
         """
@@ -42,7 +44,7 @@ class GameStateManager:
         """
         # Fade-переход только для перехода main_menu -> new_game (New Game)
         if self.game_state == "main_menu" and new_state == "new_game":
-            self.animate_transition(menu, config.FADE_DURATION)
+            self.start_transition(config.FADE_DURATION)
         if new_state == "new_game":
             self.should_process_menu = False  # Отключаем обработку меню
         else:
@@ -59,48 +61,124 @@ class GameStateManager:
         """
         return self.game_state
 
-    def animate_transition(self, menu, duration: float = config.FADE_DURATION) -> None:
+    def start_transition(self, duration: float = config.FADE_DURATION) -> None:
         """
-        Анимирует переход между состояниями.
-        
+        Начинает fade-переход поверх текущего кадра.
+
+        Переход не блокирует игровой цикл: GameLoop обновляет и рисует
+        его каждый кадр, а загрузка ресурсов выполняется, когда экран
+        полностью затемнён.
+
+        Args:
+            duration: Длительность каждой фазы (затемнения и осветления) в секундах.
+        """
+        screen = pygame.display.get_surface()
+        background = screen.copy() if screen is not None else None
+        self.transition = FadeTransition(duration, background)
+
+    def update_transition(self, dt: float) -> None:
+        """
+        Продвигает текущий переход на один кадр.
+
+        Args:
+            dt: Длительность кадра в секундах.
+        """
+        if self.transition is None:
+            return
+        self.transition.update(dt)
+        if self.transition.done:
+            self.transition = None
+
+    def cancel_transition(self) -> None:
+        """Прерывает текущий переход (бенчмарки и сценарии без затемнения)."""
+        self.transition = None
+
+    def draw_transition(self, surface: pygame.Surface) -> None:
+        """
+        Рисует затемнение текущего перехода.
+
+        Пока экран затемняется (и в кадре загрузки), под затемнением
+        рисуется снимок экрана до перехода; при осветлении затемнение
+        накладывается на уже нарисованный игровой кадр.
+
+        Args:
+            surface: Поверхность окна.
+        """
+        transition = self.transition
+        if transition is None:
+            return
+        if transition.alpha >= 255:
+            # Полная темнота: заливка вместо блендинга на весь экран
+            surface.fill((0, 0, 0))
+            return
+        if transition.covers_scene:
+            if transition.background is not None:
+                surface.blit(transition.background, (0, 0))
+            else:
+                surface.fill((0, 0, 0))
+        if self.fade_surface.get_size() != surface.get_size():
+            self.fade_surface = pygame.Surface(surface.get_size()).convert()
+            self.fade_surface.fill((0, 0, 0))
+        if transition.alpha > 0:
+            self.fade_surface.set_alpha(transition.alpha)
+            surface.blit(self.fade_surface, (0, 0))
+
+
+class FadeTransition:
+    """
+    Fade-переход, обновляемый раз в кадр.
+
+    Фазы: затемнение (FADE_OUT), один кадр на чёрном экране для загрузки
+    ресурсов (LOAD) и осветление (FADE_IN) поверх игрового кадра.
+    """
+
+    FADE_OUT = "fade_out"
+    LOAD = "load"
+    FADE_IN = "fade_in"
+
+    # Кадр загрузки длится долго; без ограничения осветление бы пропускалось
+    MAX_STEP = 0.05
+
+    def __init__(self, duration: float, background: pygame.Surface | None = None):
+        """
+        Инициализация перехода.
+
         Args:
-            menu: Меню для отображения во время перехода.
-            duration: Длительность анимации в секундах.
-        """
-        # Фаза затемнения
-        alpha = 0
-        start_time = time.time()
-
-        while alpha < 255:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-            time_elapsed = time.time() - start_time
-            alpha = min(255, int(255 * time_elapsed / duration))
-            self.fade_surface.fill((0, 0, 0, alpha))
-
-            if menu:
-                menu.draw(pygame.display.get_surface(), pygame.mouse.get_pos())
-
-            pygame.display.get_surface().blit(self.fade_surface, (0, 0))
-            pygame.display.flip()
-            pygame.time.Clock().tick(config.TARGET_FPS)
-
-        # Фаза осветления
-        alpha = 255
-        start_time = time.time()
-
-        while alpha > 0:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-            time_elapsed = time.time() - start_time
-            alpha = max(0, 255 - int(255 * time_elapsed / duration))
-            self.fade_surface.fill((0, 0, 0, alpha))
-            pygame.display.get_surface().blit(self.fade_surface, (0, 0))
-            pygame.display.flip()
-            pygame.time.Clock().tick(config.TARGET_FPS)
+            duration: Длительность каждой фазы в секундах.
+            background: Снимок экрана до перехода.
+        """
+        self.duration = max(duration, 1e-3)
+        self.background = background
+        self.phase = self.FADE_OUT
+        self.elapsed = 0.0
+        self.alpha = 0
+        self.done = False
+
+    @property
+    def covers_scene(self) -> bool:
+        """Игровой кадр ещё не виден (затемнение или загрузка)."""
+        return self.phase != self.FADE_IN
+
+    def update(self, dt: float) -> None:
+        """
+        Продвигает переход на один кадр.
+
+        Args:
+            dt: Длительность кадра в секундах.
+        """
+        if self.phase == self.LOAD:
+            # Загрузка выполнена в прошлом кадре - осветляем с полной темноты
+            self.phase = self.FADE_IN
+            self.background = None
+            self.elapsed = 0.0
+            return
+
+        self.elapsed += min(dt, self.MAX_STEP)
+        progress = min(1.0, self.elapsed / self.duration)
+        if self.phase == self.FADE_OUT:
+            self.alpha = int(255 * progress)
+            if progress >= 1.0:
+                self.phase = self.LOAD
+        else:
+            self.alpha = 255 - int(255 * progress)
+            self.done = progress >= 1.0
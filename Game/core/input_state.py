@@ -0,0 +1,73 @@
+"""
+Модуль состояния клавиатуры.
+
+Содержит класс InputState - единую точку опроса зажатых клавиш. Обычно
+это pygame.key.get_pressed(), но состояние можно подменить набором
+клавиш (проигрывание сценария ввода в бенчмарках без окна).
+"""
+
+import pygame
+
+
+class _ScriptedKeys:
+    """Замена результата pygame.key.get_pressed() для подменённого ввода."""
+
+    __slots__ = ("held",)
+
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class InputState:
+    """
+    Опрос зажатых клавиш с возможностью подмены.
+
+    Пока подмена не включена, get_pressed() возвращает реальное
+    состояние клавиатуры.
+    """
+
+    def __init__(self):
+        """Инициализация состояния ввода."""
+        self._held = set()
+        self._override = None
+
+    @property
+    def overridden(self) -> bool:
+        """Включена ли подмена клавиатуры."""
+        return self._override is not None
+
+    def set_override(self, enabled: bool = True):
+        """
+        Включает или выключает подмену клавиатуры.
+
+        Args:
+            enabled: True - клавиши берутся из press()/release().
+        """
+        self._held.clear()
+        self._override = _ScriptedKeys(self._held) if enabled else None
+
+    def press(self, key: int):
+        """Отмечает клавишу зажатой (только при подмене)."""
+        self._held.add(key)
+
+    def release(self, key: int):
+        """Отпускает клавишу (только при подмене)."""
+        self._held.discard(key)
+
+    def get_pressed(self):
+        """
+        Состояние клавиш в формате pygame.key.get_pressed().
+
+        Returns:
+            Объект, индексируемый кодом клавиши.
+        """
+        if self._override is not None:
+            return self._override
+        return pygame.key.get_pressed()
+
+
+# Глобальный экземпляр
+input_state = InputState()
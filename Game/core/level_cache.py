@@ -0,0 +1,118 @@
+"""
+Модуль кеша загруженных карт.
+
+Содержит класс LevelCache: для недавно посещённых карт хранится всё,
+что не зависит от игрока - разобранный TMX, коллизии с их сеткой,
+списки интерактивных объектов и сундуков и LevelRenderer с уже
+запечёнными чанками. Возврат через дверь на такую карту не разбирает
+TMX и не запекает чанки заново.
+
+Кеш ограничен числом карт (LEVEL_CACHE["MAX_LEVELS"]) и памятью
+запечённых чанков и тайлсетов (LEVEL_CACHE["MAX_BYTES"]); вытесняются
+давно не посещённые карты, текущая карта не вытесняется. Карты,
+подготовленные заранее (core/level_preloader.py), добавляются как самые
+давние: они вытесняются первыми, пока игрок в них не зашёл.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+from core.config import config
+
+
+class LevelCache:
+    """
+    LRU-кеш карт по пути к TMX.
+
+    Запись - словарь с ключами level, map_objects, collision_handler,
+    collision_objects, interactive_objects, interaction_zones, chest_objects,
+    level_renderer и map_size.
+    """
+
+    def __init__(self):
+        """Инициализация кеша."""
+        settings = config.LEVEL_CACHE
+        self.max_levels = settings.get("MAX_LEVELS", 4)
+        self.max_bytes = settings.get("MAX_BYTES", 192 * 1024 * 1024)
+        self._entries = OrderedDict()  # путь -> запись, от давних к недавним
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, map_path: str) -> Optional[dict]:
+        """
+        Возвращает запись карты и отмечает её как недавно использованную.
+
+        Args:
+            map_path: Путь к TMX (как в config.LEVEL_MAP_PATH).
+
+        Returns:
+            Запись или None, если карты нет в кеше.
+        """
+        entry = self._entries.get(map_path)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(map_path)
+        self.stats["hits"] += 1
+        return entry
+
+    def put(self, map_path: str, entry: dict, speculative: bool = False):
+        """
+        Сохраняет запись карты и вытесняет старые сверх лимитов.
+
+        Args:
+            map_path: Путь к TMX.
+            entry: Запись карты (см. описание класса).
+            speculative: Карта подготовлена заранее, игрок в ней ещё не был -
+                запись становится самой давней, а не текущей.
+        """
+        self._entries[map_path] = entry
+        self._entries.move_to_end(map_path, last=not speculative)
+        self.trim(keep=None if speculative else map_path)
+
+    def __contains__(self, map_path: str) -> bool:
+        """Есть ли карта в кеше (без учёта в статистике и LRU)."""
+        return map_path in self._entries
+
+    def trim(self, keep: Optional[str] = None):
+        """
+        Вытесняет давно посещённые карты, пока кеш не уложится в лимиты.
+
+        Чанки текущей карты могли дозапечься с момента put, поэтому
+        память пересчитывается при каждом вызове.
+
+        Args:
+            keep: Карта, которую нельзя вытеснять (текущая). Самая недавно
+                использованная карта не вытесняется никогда.
+        """
+        latest = next(reversed(self._entries), None)
+        for path in list(self._entries):
+            if len(self._entries) <= self.max_levels and self.get_bytes() <= self.max_bytes:
+                break
+            if path == keep or path == latest:
+                continue
+            del self._entries[path]
+            self.stats["evictions"] += 1
+            if config.DEBUG_MODE:
+                print(f"[LEVEL CACHE] Карта выгружена из кеша: {path}")
+
+    def clear(self):
+        """Удаляет все карты (например, при новой игре)."""
+        self._entries.clear()
+
+    def get_bytes(self) -> int:
+        """Память запечённых чанков и тайлсетов всех карт в кеше."""
+        return sum(entry["level_renderer"].memory_bytes() for entry in self._entries.values())
+
+    def get_stats(self) -> dict:
+        """
+        Статистика кеша для отладочного вывода.
+
+        Returns:
+            Число карт, занятая память в байтах, попадания, промахи
+            и вытеснения.
+        """
+        return {"levels": len(self._entries), "bytes": self.get_bytes(), **self.stats}
+
+
+# Глобальный экземпляр
+level_cache = LevelCache()
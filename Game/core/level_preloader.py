@@ -0,0 +1,313 @@
+"""
+Модуль фоновой подготовки карт за дверями.
+
+Содержит класс LevelPreloader: после загрузки карты GameResources
+передаёт сюда карты, в которые ведут её двери. Пока игрок ещё в текущей
+комнате, фоновый поток разбирает TMX, коллизии и объекты, раскладывает
+тайлы по чанкам и читает тайлсеты с диска. Всё, что требует окна pygame
+(convert_alpha тайлсетов, создание LevelRenderer и запекание чанков
+вокруг точки спавна), делается в главном потоке понемногу - в кадрах,
+где до следующего кадра остаётся свободное время. Готовая карта кладётся
+в кеш карт (core/level_cache.py), и переход через дверь её только
+подключает; если игрок успел дойти до двери раньше, take доделывает
+подготовку сразу.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import pygame
+
+from core.config import config
+from core.level_cache import level_cache
+from level.camera import Camera
+from level.level_renderer import LevelRenderer, bucket_tiles_by_chunk, tileset_paths
+
+# Сколько тайлов дорисовывать в чанк за один шаг запекания
+TILES_PER_STEP = 256
+
+
+class LevelPreloader:
+    """
+    Очередь карт на подготовку и фоновый поток разбора.
+
+    Задача проходит состояния queued -> parsing -> parsed (или failed);
+    шаги главного потока выполняются только над разобранными задачами.
+    """
+
+    def __init__(self):
+        """Инициализация предзагрузки."""
+        settings = config.LEVEL_PRELOAD
+        self.enabled = settings.get("ENABLED", True)
+        self.frame_budget = settings.get("FRAME_BUDGET_MS", 2.0) / 1000
+        self.transition_budget = settings.get("TRANSITION_BUDGET_MS", 8.0) / 1000
+        self.min_idle = settings.get("MIN_IDLE_MS", 4.0) / 1000
+        self.switch_interval = settings.get("SWITCH_INTERVAL_MS", 0.5) / 1000
+
+        self._condition = threading.Condition()
+        # путь -> {"map_path", "spawn_point_name", "state", "entry", "chunk_tiles", "spawn",
+        #          "images", "tilesets", "renderer", "camera_offset"}
+        self._jobs = OrderedDict()
+        self._thread = None
+        self.stats = {"scheduled": 0, "parsed": 0, "ready": 0, "taken": 0, "cancelled": 0,
+                      "errors": 0, "steps": 0, "max_step_ms": 0.0}
+
+    # ------------------------------------------------------------------
+    # Запросы из главного потока
+    # ------------------------------------------------------------------
+    def schedule(self, targets):
+        """
+        Заменяет очередь подготовки картами за дверями текущей комнаты.
+
+        Задачи для карт, в которые отсюда не попасть, отменяются; карты,
+        уже лежащие в кеше, не готовятся.
+
+        Args:
+            targets: Список (путь к карте, имя точки спавна).
+        """
+        if not self.enabled:
+            return
+        with self._condition:
+            wanted = {map_path for map_path, _ in targets}
+            for map_path in list(self._jobs):
+                if map_path not in wanted:
+                    del self._jobs[map_path]
+                    self.stats["cancelled"] += 1
+            for map_path, spawn_point_name in targets:
+                if map_path in self._jobs or map_path in level_cache:
+                    continue
+                self._jobs[map_path] = {"map_path": map_path, "spawn_point_name": spawn_point_name,
+                                        "state": "queued", "tilesets": {}, "renderer": None}
+                self.stats["scheduled"] += 1
+                if config.DEBUG_MODE:
+                    print(f"[PRELOAD] В очереди: {map_path}")
+            if any(job["state"] == "queued" for job in self._jobs.values()):
+                self._ensure_thread()
+                self._condition.notify_all()
+
+    def update(self, deadline: float, budget: float | None = None):
+        """
+        Выполняет шаги подготовки в свободное время кадра.
+
+        Шаг - конвертация одного тайлсета, создание рендерера, создание
+        поверхности чанка или отрисовка в неё TILES_PER_STEP тайлов. Шаги идут, пока до deadline остаётся
+        больше MIN_IDLE_MS и не израсходован FRAME_BUDGET_MS.
+
+        Args:
+            deadline: Время начала следующего кадра (time.perf_counter()).
+            budget: Время на шаги в секундах (по умолчанию FRAME_BUDGET_MS).
+        """
+        if not self._jobs:
+            return
+        if budget is None:
+            budget = self.frame_budget
+        start = time.perf_counter()
+        while True:
+            now = time.perf_counter()
+            if now - start >= budget or deadline - now < self.min_idle:
+                return
+            job = self._next_parsed()
+            if job is None:
+                return
+            try:
+                done = self._step(job)
+            except Exception as e:
+                self._fail(job, e)
+                continue
+            step_ms = (time.perf_counter() - now) * 1000
+            self.stats["steps"] += 1
+            self.stats["max_step_ms"] = max(self.stats["max_step_ms"], step_ms)
+            if done:
+                self._finish(job)
+
+    def take(self, map_path: str):
+        """
+        Забирает карту, которую не успели подготовить до перехода.
+
+        Если задача ещё в очереди, карта разбирается здесь же; если её
+        разбирает фоновый поток - дожидается его. Оставшиеся шаги
+        выполняются сразу.
+
+        Args:
+            map_path: Путь к TMX.
+
+        Returns:
+            Запись для кеша карт или None, если задачи для карты нет.
+        """
+        with self._condition:
+            job = self._jobs.get(map_path)
+            if job is None:
+                return None
+            parse_here = job["state"] == "queued"
+            if parse_here:
+                job["state"] = "parsing"
+            else:
+                while job["state"] == "parsing":
+                    self._condition.wait()
+
+        try:
+            if parse_here:
+                self._parse(job)
+                job["state"] = "parsed"
+            if job["state"] != "parsed":
+                return None
+            while not self._step(job):
+                pass
+        except Exception as e:
+            self._fail(job, e)
+            return None
+
+        with self._condition:
+            self._jobs.pop(map_path, None)
+        self.stats["taken"] += 1
+        job["entry"]["level_renderer"] = job["renderer"]
+        if config.DEBUG_MODE:
+            print(f"[PRELOAD] Подготовка завершена при переходе: {map_path}")
+        return job["entry"]
+
+    def clear(self):
+        """Отменяет все задачи (разбираемая сейчас карта будет отброшена)."""
+        with self._condition:
+            self.stats["cancelled"] += len(self._jobs)
+            self._jobs.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Статистика для отладочного вывода.
+
+        Returns:
+            Число задач в работе и счётчики: поставлено, разобрано,
+            готово заранее, доделано при переходе, отменено, ошибок,
+            шагов главного потока и самый долгий шаг в мс.
+        """
+        return {"pending": len(self._jobs), **self.stats}
+
+    # ------------------------------------------------------------------
+    # Главный поток
+    # ------------------------------------------------------------------
+    def _next_parsed(self):
+        with self._condition:
+            for job in self._jobs.values():
+                if job["state"] == "parsed":
+                    return job
+        return None
+
+    def _step(self, job) -> bool:
+        """Один шаг подготовки разобранной карты.
+
+        Returns:
+            True, если карта готова.
+        """
+        images = job["images"]
+        if images:
+            path, image = images.popitem()
+            job["tilesets"][path] = image.convert_alpha()
+            return False
+
+        if job["renderer"] is None:
+            entry = job["entry"]
+            job["renderer"] = LevelRenderer(entry["level"], None, tileset_images=job["tilesets"],
+                                            chunk_tiles=job["chunk_tiles"])
+            # Камера в точке спавна: ноги игрока в точке, центр - на полкадра выше
+            spawn_x, spawn_y = job["spawn"]
+            camera = Camera(*entry["map_size"])
+            job["camera_offset"] = camera.offset_for(spawn_x, spawn_y - config.FRAME_SIZE[1] // 2)
+            return False
+
+        return job["renderer"].bake_step(*job["camera_offset"], TILES_PER_STEP)
+
+    def _finish(self, job):
+        """Кладёт готовую карту в кеш карт."""
+        with self._condition:
+            if self._jobs.get(job["map_path"]) is not job:
+                return
+            del self._jobs[job["map_path"]]
+        entry = job["entry"]
+        entry["level_renderer"] = job["renderer"]
+        level_cache.put(job["map_path"], entry, speculative=True)
+        self.stats["ready"] += 1
+        if config.DEBUG_MODE:
+            print(f"[PRELOAD] Карта готова: {job['map_path']}")
+
+    def _fail(self, job, error: Exception):
+        with self._condition:
+            job["state"] = "failed"
+            if self._jobs.get(job["map_path"]) is job:
+                del self._jobs[job["map_path"]]
+        self.stats["errors"] += 1
+        if config.DEBUG_MODE:
+            print(f"[PRELOAD] Ошибка подготовки {job['map_path']}: {error}")
+
+    # ------------------------------------------------------------------
+    # Фоновый поток
+    # ------------------------------------------------------------------
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="LevelPreloader", daemon=True)
+            self._thread.start()
+
+    def _take_queued(self):
+        """Первая задача в очереди (вызывается под блокировкой)."""
+        for job in self._jobs.values():
+            if job["state"] == "queued":
+                job["state"] = "parsing"
+                return job
+        return None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                job = self._take_queued()
+                while job is None:
+                    self._condition.wait()
+                    job = self._take_queued()
+            # Разбор TMX держит GIL; с коротким интервалом переключения
+            # главный поток не ждёт его по 5 мс посреди кадра
+            previous_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(previous_interval, self.switch_interval))
+            try:
+                self._parse(job)
+                state = "parsed"
+            except Exception as e:
+                state = "failed"
+                self.stats["errors"] += 1
+                if config.DEBUG_MODE:
+                    print(f"[PRELOAD] Ошибка разбора {job['map_path']}: {e}")
+            finally:
+                sys.setswitchinterval(previous_interval)
+            with self._condition:
+                job["state"] = state
+                if state == "failed" and self._jobs.get(job["map_path"]) is job:
+                    del self._jobs[job["map_path"]]
+                self._condition.notify_all()
+
+    def _parse(self, job):
+        """Разбор карты без окна pygame: TMX, объекты, чанки и чтение тайлсетов."""
+        # game_resources импортирует этот модуль, поэтому импорт здесь
+        from core.game_resources import find_spawn_point, load_level_data
+
+        start = time.perf_counter()
+        entry = load_level_data(job["map_path"])
+        level = entry["level"]
+        job["chunk_tiles"] = bucket_tiles_by_chunk(level)
+        job["spawn"] = find_spawn_point(entry["map_objects"], job["spawn_point_name"])
+
+        images = {}
+        for path in tileset_paths(level):
+            try:
+                images[path] = pygame.image.load(path)
+            except (FileNotFoundError, pygame.error) as e:
+                # Рендерер сам сообщит о недостающем тайлсете при запекании
+                if config.DEBUG_MODE:
+                    print(f"[PRELOAD] Тайлсет не загружен '{path}': {e}")
+        job["images"] = images
+        job["entry"] = entry
+        self.stats["parsed"] += 1
+        if config.DEBUG_MODE:
+            print(f"[PRELOAD] Разобрана {job['map_path']} за {(time.perf_counter() - start) * 1000:.1f} мс")
+
+
+# Глобальный экземпляр
+level_preloader = LevelPreloader()
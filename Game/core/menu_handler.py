@@ -7,6 +7,7 @@
 
 import pygame
 from core.config import config
+from core.level_preloader import level_preloader
 from core.save_manager import load_game_state
 
 
@@ -95,7 +96,10 @@ class MenuHandler:
                 self.game.wait_for_key_release = False
                 self.game.game_state_manager.change_state(state, None)
             else:
-                # Обычный запуск новой игры с начального спавна
+                # Обычный запуск новой игры с начального спавна. Карта
+                # разбирается в фоне, пока экран затемняется
+                if not self.game.level:
+                    level_preloader.schedule([(config.LEVEL_MAP_PATH, None)])
                 self.game.waiting_for_first_update = True
                 self.game.wait_for_key_release = False
                 self.game.game_state_manager.change_state(state, None)
@@ -7,6 +7,16 @@
 
 import sys
 import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _project_root():
+    """Корень проекта (где лежит папка Game); ищется один раз."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    while not os.path.isdir(os.path.join(current_dir, "Game")) and current_dir != os.path.dirname(current_dir):
+        current_dir = os.path.dirname(current_dir)
+    return current_dir
 
 
 def resource_path(relative_path):
@@ -18,7 +28,14 @@ def resource_path(relative_path):
     if hasattr(sys, '_MEIPASS'):  # PyInstaller
         return os.path.join(sys._MEIPASS, relative_path)
     # Найти корень проекта (где лежит папка Game)
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    while not os.path.isdir(os.path.join(current_dir, "Game")) and current_dir != os.path.dirname(current_dir):
-        current_dir = os.path.dirname(current_dir)
-    return os.path.join(current_dir, relative_path) 
\ No newline at end of file
+    return os.path.join(_project_root(), relative_path) 
+
+def normalize_map_path(map_path):
+    """
+    Приводит путь к карте к виду от корня проекта (с префиксом Game/).
+    :param map_path: путь из свойств двери или config
+    :return: путь вида "Game/assets/Tiles/..."
+    """
+    if not map_path.replace('\\', '/').startswith('Game/'):
+        map_path = 'Game/' + map_path.lstrip('/\\')
+    return map_path
@@ -0,0 +1,205 @@
+"""
+Модуль вывода кадра на экран.
+
+Содержит класс FramePresenter, который переносит виртуальный экран
+(960x540) в окно игры одним из способов и замеряет время каждого способа,
+чтобы можно было выбрать самый быстрый для конкретной машины.
+"""
+
+from collections import deque
+
+import pygame
+from core.config import config
+
+
+class FramePresenter:
+    """
+    Вывод кадра в окно с выбором способа масштабирования.
+
+    Способы (config.RENDERING["PRESENT_MODE"]):
+    - "scale": масштабирование в заранее созданную поверхность и blit в окно;
+    - "integer": при целом масштабе - масштабирование прямо в поверхность
+      окна без промежуточной копии (иначе как "scale");
+    - "native": чанки уровня рисуются сразу в разрешении окна уже
+      увеличенными, а спрайты и интерфейс - в прозрачный слой размера
+      виртуального экрана, который накладывается поверх. Кадры с
+      полноэкранными панелями (диалог, инвентарь, смерть) выводятся как "integer".
+    """
+
+    MODES = ("scale", "integer", "native")
+
+    def __init__(self, game):
+        """
+        Инициализация вывода кадра.
+
+        Args:
+            game: Ссылка на основной объект игры.
+        """
+        self.game = game
+        settings = config.RENDERING
+        self.mode = settings.get("PRESENT_MODE", "integer")
+        if self.mode not in self.MODES:
+            if config.DEBUG_MODE:
+                print(f"[PRESENT] Неизвестный режим '{self.mode}', используется 'scale'")
+            self.mode = "scale"
+
+        self.output_size = (config.WIDTH, config.HEIGHT)
+        self.virtual_size = (config.VIRTUAL_WIDTH, config.VIRTUAL_HEIGHT)
+        scale_x = config.WIDTH / config.VIRTUAL_WIDTH
+        scale_y = config.HEIGHT / config.VIRTUAL_HEIGHT
+        self.scale = scale_x if scale_x == scale_y else None
+        self.integer_scale = (int(scale_x) if scale_x == scale_y and scale_x.is_integer()
+                              else None)
+
+        # Поверхности создаются один раз, а не в каждом кадре
+        self._target = None
+        self._overlay = None
+        self._overlay_target = None
+        self._saved_virtual = None
+
+        history = settings.get("PRESENT_TIMING_HISTORY", 240)
+        # Частичный вывод (только изменившиеся области) замеряется отдельно
+        self.timings = {path: deque(maxlen=history) for path in self.MODES + ("partial",)}
+        self.last_path = None
+
+    # ------------------------------------------------------------------
+    # Выбор способа
+    # ------------------------------------------------------------------
+    def _screen_matches_output(self) -> bool:
+        return self.game.screen.get_size() == self.output_size
+
+    def wants_native(self) -> bool:
+        """Можно ли вывести этот кадр в режиме native."""
+        if self.mode != "native" or not self.scale or not self._screen_matches_output():
+            return False
+        game = self.game
+        if not game.level_renderer or game.show_dialogue:
+            return False
+        if game.player and not game.player.is_alive():
+            return False
+        inventory = getattr(game.player_ui, 'inventory', None) if game.player_ui else None
+        if inventory and (inventory.inventory_open or inventory.acs_open):
+            return False
+        return True
+
+    def supports_partial(self) -> bool:
+        """Можно ли показывать только изменившиеся области (целый масштаб)."""
+        return self.integer_scale is not None and self._screen_matches_output()
+
+    # ------------------------------------------------------------------
+    # Режим native
+    # ------------------------------------------------------------------
+    def begin_native(self):
+        """
+        Рисует уровень прямо в окно и подменяет виртуальный экран
+        прозрачным слоем для спрайтов и интерфейса.
+        """
+        game = self.game
+        if self._overlay is None:
+            self._overlay = pygame.Surface(self.virtual_size, pygame.SRCALPHA)
+            self._overlay_target = pygame.Surface(self.output_size, pygame.SRCALPHA)
+
+        game.screen.fill((0, 0, 0))
+        game.level_renderer.render(game.screen, scale=self.scale)
+
+        self._overlay.fill((0, 0, 0, 0))
+        self._saved_virtual = game.virtual_screen
+        game.virtual_screen = self._overlay
+        if game.player_ui:
+            game.player_ui.screen = self._overlay
+
+    def end_native(self):
+        """Возвращает виртуальный экран и накладывает слой поверх уровня."""
+        game = self.game
+        game.virtual_screen = self._saved_virtual
+        if game.player_ui:
+            game.player_ui.screen = self._saved_virtual
+        self._saved_virtual = None
+
+        pygame.transform.scale(self._overlay, self.output_size, self._overlay_target)
+        game.screen.blit(self._overlay_target, (0, 0))
+
+    # ------------------------------------------------------------------
+    # Вывод
+    # ------------------------------------------------------------------
+    def present(self, virtual_screen: pygame.Surface) -> str:
+        """
+        Переносит виртуальный экран в окно (без flip).
+
+        Args:
+            virtual_screen: Полностью отрисованный виртуальный экран.
+
+        Returns:
+            Использованный способ ("scale" или "integer").
+        """
+        screen = self.game.screen
+        if self.mode != "scale" and self.integer_scale and self._screen_matches_output():
+            pygame.transform.scale(virtual_screen, self.output_size, screen)
+            return "integer"
+
+        if self._target is None:
+            self._target = pygame.Surface(self.output_size).convert(screen)
+        pygame.transform.scale(virtual_screen, self.output_size, self._target)
+        screen.blit(self._target, (0, 0))
+        return "scale"
+
+    def present_partial(self, virtual_screen: pygame.Surface, rects) -> bool:
+        """
+        Масштабирует в окно и показывает только указанные области.
+
+        Args:
+            virtual_screen: Виртуальный экран.
+            rects: Прямоугольники в координатах виртуального экрана.
+
+        Returns:
+            True, если кадр показан; False - нужен полный показ.
+        """
+        if not self.supports_partial():
+            return False
+
+        scale = self.integer_scale
+        screen = self.game.screen
+        updated = []
+        for rect in rects:
+            target = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+            pygame.transform.scale(virtual_screen.subsurface(rect), target.size,
+                                   screen.subsurface(target))
+            updated.append(target)
+        pygame.display.update(updated)
+        return True
+
+    def capture_scene(self) -> pygame.Surface:
+        """
+        Копия последнего кадра в размере виртуального экрана.
+
+        В режиме native виртуальный экран содержит только слой спрайтов,
+        поэтому снимок берётся из окна.
+        """
+        if self.last_path == "native":
+            return pygame.transform.scale(self.game.screen, self.virtual_size)
+        return self.game.virtual_screen.copy()
+
+    # ------------------------------------------------------------------
+    # Замеры
+    # ------------------------------------------------------------------
+    def record(self, path: str, seconds: float):
+        """Запоминает время кадра (отрисовка + вывод) для способа path."""
+        self.last_path = path
+        self.timings[path].append(seconds)
+
+    def get_timings(self) -> dict:
+        """
+        Статистика времени кадра по способам вывода.
+
+        Returns:
+            {способ: {"frames", "avg_ms", "max_ms"}} для использованных способов
+        """
+        result = {}
+        for path, samples in self.timings.items():
+            if samples:
+                result[path] = {
+                    "frames": len(samples),
+                    "avg_ms": sum(samples) * 1000 / len(samples),
+                    "max_ms": max(samples) * 1000,
+                }
+        return result
@@ -0,0 +1,368 @@
+"""
+Модуль покадрового профилировщика.
+
+Содержит класс FrameProfiler, который замеряет время фаз каждого кадра
+(события, обновление, уровень, спрайты, overlap-тайлы, интерфейс,
+масштабирование, fade-переход, flip) в кольцевом буфере фиксированного размера,
+считает перцентили, рисует график поверх экрана (F3) и выгружает
+историю в CSV или Chrome-trace JSON (chrome://tracing, Perfetto).
+"""
+
+import csv
+import json
+import os
+import time
+
+import pygame
+from core.config import config
+
+
+class _PhaseTimer:
+    """Контекстный менеджер одной фазы; создаётся один раз на фазу."""
+
+    __slots__ = ("profiler", "index", "start")
+
+    def __init__(self, profiler, index):
+        self.profiler = profiler
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._add(self.index, self.start, time.perf_counter())
+        return False
+
+
+class _NullTimer:
+    """Пустая фаза для выключенного профилировщика."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class FrameProfiler:
+    """
+    Профилировщик кадров с кольцевым буфером.
+
+    Использование:
+        profiler.begin_frame()
+        with profiler.phase("events"):
+            ...
+        profiler.end_frame()
+
+    Фаза может встречаться в кадре несколько раз - время суммируется,
+    а в Chrome-trace попадает каждый отрезок.
+    """
+
+    PHASES = ("events", "update", "level", "sprites", "overlap", "ui", "scale", "transition", "flip")
+    PHASE_COLORS = {
+        "events": (120, 120, 255),
+        "update": (80, 200, 255),
+        "level": (80, 200, 80),
+        "sprites": (200, 200, 80),
+        "overlap": (255, 160, 60),
+        "ui": (220, 100, 220),
+        "scale": (255, 80, 80),
+        "transition": (0, 220, 160),
+        "flip": (160, 160, 160),
+    }
+
+    def __init__(self, capacity: int | None = None):
+        """
+        Инициализация профилировщика.
+
+        Args:
+            capacity: Сколько последних кадров хранить.
+        """
+        settings = config.PROFILER
+        self.enabled = settings.get("ENABLED", True)
+        self.capacity = capacity or settings.get("HISTORY", 600)
+        self.export_dir = settings.get("EXPORT_DIR", "Game/userdata/profiles")
+        self.overlay_refresh = settings.get("OVERLAY_REFRESH_FRAMES", 30)
+        self._timers = {name: _PhaseTimer(self, i) for i, name in enumerate(self.PHASES)}
+        self._null_timer = _NullTimer()
+
+        # Кольцевой буфер: время начала кадра, полное время и время каждой фазы
+        self._frame_start = [0.0] * self.capacity
+        self._frame_total = [0.0] * self.capacity
+        self._phase_totals = [[0.0] * len(self.PHASES) for _ in range(self.capacity)]
+        self._spans = [[] for _ in range(self.capacity)]  # (фаза, начало, конец) для Chrome-trace
+        self._index = 0
+        self.count = 0
+        self.total_frames = 0  # Записано кадров с последнего reset (не ограничено буфером)
+
+        self._current_start = None
+        self._current_totals = [0.0] * len(self.PHASES)
+        self._current_spans = []
+
+        # Оверлей: статистика пересчитывается раз в overlay_refresh кадров,
+        # график хранится поверхностью и дорисовывается новыми столбиками
+        self._overlay_stats = None
+        self._overlay_stats_frame = 0
+        self._graph = None
+        self._graph_frame = 0
+        self._graph_max_ms = None
+
+    # ------------------------------------------------------------------
+    # Запись
+    # ------------------------------------------------------------------
+    def begin_frame(self):
+        """Начинает новый кадр."""
+        if not self.enabled:
+            return
+        self._current_start = time.perf_counter()
+        totals = self._current_totals
+        for i in range(len(totals)):
+            totals[i] = 0.0
+        self._current_spans = []
+
+    def phase(self, name: str):
+        """
+        Возвращает контекстный менеджер для замера фазы.
+
+        Args:
+            name: Имя фазы из PHASES.
+        """
+        if not self.enabled or self._current_start is None:
+            return self._null_timer
+        return self._timers[name]
+
+    def _add(self, index: int, start: float, end: float):
+        if self._current_start is None:
+            return
+        self._current_totals[index] += end - start
+        self._current_spans.append((index, start, end))
+
+    def end_frame(self):
+        """Завершает кадр и записывает его в кольцевой буфер."""
+        if not self.enabled or self._current_start is None:
+            return
+        slot = self._index
+        self._frame_start[slot] = self._current_start
+        self._frame_total[slot] = time.perf_counter() - self._current_start
+        self._phase_totals[slot][:] = self._current_totals
+        self._spans[slot] = self._current_spans
+        self._index = (slot + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.total_frames += 1
+        self._current_start = None
+
+    def reset(self):
+        """Очищает историю кадров."""
+        self._index = 0
+        self.count = 0
+        self.total_frames = 0
+        self._current_start = None
+        self._overlay_stats = None
+        self._graph = None
+
+    def _ordered_slots(self):
+        """Индексы записанных кадров от старого к новому."""
+        start = (self._index - self.count) % self.capacity
+        return [(start + i) % self.capacity for i in range(self.count)]
+
+    # ------------------------------------------------------------------
+    # Статистика
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _percentile(sorted_values, fraction):
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+        return sorted_values[index]
+
+    def get_stats(self) -> dict:
+        """
+        Перцентили времени кадра и фаз за историю буфера, в миллисекундах.
+
+        Returns:
+            {"frames", "frame": {...}, "phases": {фаза: {...}}, "worst": {...}}
+        """
+        slots = self._ordered_slots()
+        if not slots:
+            return {"frames": 0}
+
+        def summary(values):
+            ordered = sorted(values)
+            return {
+                "p50": self._percentile(ordered, 0.50) * 1000,
+                "p95": self._percentile(ordered, 0.95) * 1000,
+                "p99": self._percentile(ordered, 0.99) * 1000,
+                "max": ordered[-1] * 1000,
+                "avg": sum(ordered) * 1000 / len(ordered),
+            }
+
+        totals = [self._frame_total[slot] for slot in slots]
+        worst_slot = max(slots, key=lambda slot: self._frame_total[slot])
+        return {
+            "frames": len(slots),
+            "frame": summary(totals),
+            "phases": {name: summary([self._phase_totals[slot][i] for slot in slots])
+                       for i, name in enumerate(self.PHASES)},
+            "worst": {
+                "total_ms": self._frame_total[worst_slot] * 1000,
+                "frames_ago": (self._index - 1 - worst_slot) % self.capacity,
+                "phases_ms": {name: self._phase_totals[worst_slot][i] * 1000
+                              for i, name in enumerate(self.PHASES)},
+            },
+        }
+
+    def overlay_stats(self) -> dict:
+        """
+        Статистика для экрана отладки.
+
+        get_stats сортирует историю всех фаз (около миллисекунды на полном
+        буфере), поэтому для ежекадрового вывода результат пересчитывается
+        раз в OVERLAY_REFRESH_FRAMES кадров.
+
+        Returns:
+            Результат get_stats не старше OVERLAY_REFRESH_FRAMES кадров.
+        """
+        if (self._overlay_stats is None or
+                self.total_frames - self._overlay_stats_frame >= self.overlay_refresh):
+            self._overlay_stats = self.get_stats()
+            self._overlay_stats_frame = self.total_frames
+        return self._overlay_stats
+
+    # ------------------------------------------------------------------
+    # Экспорт
+    # ------------------------------------------------------------------
+    def _export_path(self, path, extension):
+        if path:
+            return path
+        os.makedirs(self.export_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        return os.path.join(self.export_dir, f"frames_{stamp}.{extension}")
+
+    def export_csv(self, path: str | None = None) -> str:
+        """
+        Выгружает историю кадров в CSV (одна строка на кадр, время в мс).
+
+        Args:
+            path: Путь к файлу (по умолчанию папка EXPORT_DIR).
+
+        Returns:
+            Путь к созданному файлу.
+        """
+        path = self._export_path(path, "csv")
+        slots = self._ordered_slots()
+        origin = self._frame_start[slots[0]] if slots else 0.0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "start_ms", "total_ms"] + [f"{name}_ms" for name in self.PHASES])
+            for number, slot in enumerate(slots):
+                writer.writerow(
+                    [number, f"{(self._frame_start[slot] - origin) * 1000:.3f}",
+                     f"{self._frame_total[slot] * 1000:.3f}"] +
+                    [f"{value * 1000:.3f}" for value in self._phase_totals[slot]]
+                )
+        return path
+
+    def export_chrome_trace(self, path: str | None = None) -> str:
+        """
+        Выгружает историю кадров в формате Chrome trace (chrome://tracing, Perfetto).
+
+        Args:
+            path: Путь к файлу (по умолчанию папка EXPORT_DIR).
+
+        Returns:
+            Путь к созданному файлу.
+        """
+        path = self._export_path(path, "json")
+        slots = self._ordered_slots()
+        origin = self._frame_start[slots[0]] if slots else 0.0
+        events = []
+        for number, slot in enumerate(slots):
+            events.append({
+                "name": "frame", "cat": "frame", "ph": "X", "pid": 0, "tid": 0,
+                "ts": (self._frame_start[slot] - origin) * 1e6,
+                "dur": self._frame_total[slot] * 1e6,
+                "args": {"frame": number},
+            })
+            for index, start, end in self._spans[slot]:
+                events.append({
+                    "name": self.PHASES[index], "cat": "phase", "ph": "X", "pid": 0, "tid": 0,
+                    "ts": (start - origin) * 1e6, "dur": (end - start) * 1e6,
+                })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    # ------------------------------------------------------------------
+    # Оверлей
+    # ------------------------------------------------------------------
+    def draw_overlay(self, surface: pygame.Surface, font: pygame.font.Font | None = None,
+                     width: int = 240, height: int = 80, max_ms: float = 33.3,
+                     stats: dict | None = None):
+        """
+        Рисует график времени последних кадров (столбики по фазам).
+
+        Args:
+            surface: Поверхность для отрисовки.
+            font: Шрифт для подписи перцентилей.
+            width: Ширина графика (по пикселю на кадр).
+            height: Высота графика.
+            max_ms: Время кадра, соответствующее верху графика.
+            stats: Уже посчитанная статистика (по умолчанию overlay_stats()).
+        """
+        if not self.enabled or not self.count:
+            return
+        left = surface.get_width() - width - 10
+        top = surface.get_height() - height - 10
+        pygame.draw.rect(surface, (0, 0, 0), (left - 1, top - 1, width + 2, height + 2))
+
+        scale = height / max_ms
+        graph = self._graph
+        new_frames = self.total_frames - self._graph_frame
+        if (graph is None or graph.get_size() != (width, height) or
+                self._graph_max_ms != max_ms or new_frames >= width):
+            graph = self._graph = pygame.Surface((width, height))
+            self._graph_max_ms = max_ms
+            new_frames = min(self.count, width)
+        elif new_frames > 0:
+            # Сдвигаем график влево и дорисовываем только новые кадры
+            graph.scroll(-new_frames, 0)
+            graph.fill((0, 0, 0), (width - new_frames, 0, new_frames, height))
+        self._graph_frame = self.total_frames
+
+        colors = [self.PHASE_COLORS[name] for name in self.PHASES]
+        slots = self._ordered_slots()[-new_frames:] if new_frames > 0 else []
+        for column, slot in enumerate(slots):
+            x = width - len(slots) + column
+            y = height
+            for i, value in enumerate(self._phase_totals[slot]):
+                bar = int(value * 1000 * scale)
+                if bar <= 0:
+                    continue
+                bar = min(bar, y)
+                pygame.draw.line(graph, colors[i], (x, y - 1), (x, y - bar))
+                y -= bar
+                if y <= 0:
+                    break
+            # Время вне фаз (ожидание, прочее) - серым
+            rest = int(self._frame_total[slot] * 1000 * scale) - (height - y)
+            if rest > 0 and y > 0:
+                pygame.draw.line(graph, (70, 70, 70), (x, y - 1), (x, max(0, y - rest)))
+        surface.blit(graph, (left, top))
+
+        # Линии 60 и 120 FPS
+        for fps in (60, 120):
+            line_y = top + height - int(1000 / fps * scale)
+            pygame.draw.line(surface, (255, 255, 255), (left, line_y), (left + width, line_y))
+
+        if font:
+            if stats is None:
+                stats = self.overlay_stats()
+            frame = stats["frame"]
+            text = font.render(f"p50 {frame['p50']:.1f} p95 {frame['p95']:.1f} "
+                               f"p99 {frame['p99']:.1f} max {frame['max']:.1f} ms",
+                               True, (255, 255, 255))
+            surface.blit(text, (left, top - text.get_height() - 2))
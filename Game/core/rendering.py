@@ -72,6 +72,7 @@ class Renderer:
             f"Objects: {len(self.game.collision_objects) if self.game.collision_objects else 0}",
         ]
 
+        # Строки меняются каждый кадр - мимо text_cache
         for i, text in enumerate(debug_text):
             surface = self.game.debug_font.render(text, True, (255, 255, 255))
             self.game.virtual_screen.blit(surface, (10, 10 + i * 20))
@@ -0,0 +1,439 @@
+"""
+Модуль двоичного формата сохранений.
+
+Один файл-контейнер с версией формата и секциями: игрок, инвентарь,
+диалоги, сундуки (и прочие секции верхнего уровня). Все строки (id
+предметов, имена слотов, ключи) хранятся один раз в таблице строк,
+а в записях на них ссылаются целые индексы. Слоты инвентаря и сундуков
+пишутся упакованными struct-записями, остальное - компактной
+msgpack-подобной кодировкой.
+
+Формат файла (little-endian):
+    MAGIC (4 байта) | версия u16 | число секций u16
+    секция: тег (4 байта) | длина u32 | данные
+Первая секция - таблица строк STRS. Неизвестные теги при чтении
+пропускаются, файл более новой версии не читается (ValueError).
+
+Журнал сундуков (chests.journal) - последовательность записей
+"длина u32 | контейнер с секцией CHST", в каждой только изменённые
+сундуки. Оборванная при сбое последняя запись при чтении отбрасывается.
+"""
+
+import json
+import os
+import struct
+
+MAGIC = b"SWFS"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_SECTION = struct.Struct("<4sI")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I8 = struct.Struct("<b")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_CHEST = struct.Struct("<IHH")  # id сундука, число слотов, число предметов
+_SLOT = struct.Struct("<HII")  # индекс слота, id предмета, количество
+
+# Секции верхнего уровня: ключ словаря сохранения -> тег
+SECTION_TAGS = {
+    "player": b"PLYR",
+    "inventory": b"INVT",
+    "dialogues": b"DLGS",
+    "chests": b"CHST",
+}
+_STRINGS_TAG = b"STRS"
+_MISC_TAG = b"MISC"
+
+# Теги значений общей кодировки
+_NONE, _FALSE, _TRUE, _INT8, _INT32, _INT64, _FLOAT, _STR, _LIST, _DICT = range(10)
+
+
+class _StringTable:
+    """Таблица строк: строка -> индекс при записи."""
+
+    def __init__(self):
+        self.strings = []
+        self.index = {}
+
+    def intern(self, text: str) -> int:
+        index = self.index.get(text)
+        if index is None:
+            index = self.index[text] = len(self.strings)
+            self.strings.append(text)
+        return index
+
+    def encode(self) -> bytes:
+        parts = [_U32.pack(len(self.strings))]
+        for text in self.strings:
+            raw = text.encode("utf-8")
+            parts.append(_U16.pack(len(raw)))
+            parts.append(raw)
+        return b"".join(parts)
+
+
+# ----------------------------------------------------------------------
+# Общая кодировка значений
+# ----------------------------------------------------------------------
+def _pack_value(value, strings: _StringTable, out: list):
+    if value is None:
+        out.append(bytes((_NONE,)))
+    elif value is True:
+        out.append(bytes((_TRUE,)))
+    elif value is False:
+        out.append(bytes((_FALSE,)))
+    elif isinstance(value, int):
+        if -128 <= value <= 127:
+            out.append(bytes((_INT8,)) + _I8.pack(value))
+        elif -2 ** 31 <= value < 2 ** 31:
+            out.append(bytes((_INT32,)) + _I32.pack(value))
+        else:
+            out.append(bytes((_INT64,)) + _I64.pack(value))
+    elif isinstance(value, float):
+        out.append(bytes((_FLOAT,)) + _F64.pack(value))
+    elif isinstance(value, str):
+        out.append(bytes((_STR,)) + _U32.pack(strings.intern(value)))
+    elif isinstance(value, (list, tuple)):
+        out.append(bytes((_LIST,)) + _U32.pack(len(value)))
+        for item in value:
+            _pack_value(item, strings, out)
+    elif isinstance(value, dict):
+        out.append(bytes((_DICT,)) + _U32.pack(len(value)))
+        for key, item in value.items():
+            _pack_value(key, strings, out)
+            _pack_value(item, strings, out)
+    else:
+        raise TypeError(f"Тип {type(value).__name__} не поддерживается форматом сохранения")
+
+
+def _unpack_value(data: bytes, offset: int, strings: list):
+    tag = data[offset]
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT8:
+        return _I8.unpack_from(data, offset)[0], offset + 1
+    if tag == _INT32:
+        return _I32.unpack_from(data, offset)[0], offset + 4
+    if tag == _INT64:
+        return _I64.unpack_from(data, offset)[0], offset + 8
+    if tag == _FLOAT:
+        return _F64.unpack_from(data, offset)[0], offset + 8
+    if tag == _STR:
+        return strings[_U32.unpack_from(data, offset)[0]], offset + 4
+    if tag == _LIST:
+        length = _U32.unpack_from(data, offset)[0]
+        offset += 4
+        result = []
+        for _ in range(length):
+            item, offset = _unpack_value(data, offset, strings)
+            result.append(item)
+        return result, offset
+    if tag == _DICT:
+        length = _U32.unpack_from(data, offset)[0]
+        offset += 4
+        result = {}
+        for _ in range(length):
+            key, offset = _unpack_value(data, offset, strings)
+            result[key], offset = _unpack_value(data, offset, strings)
+        return result, offset
+    raise ValueError(f"Неизвестный тег значения {tag} в сохранении")
+
+
+# ----------------------------------------------------------------------
+# Записи слотов
+# ----------------------------------------------------------------------
+def _pack_slots(slots: list, strings: _StringTable, out: list):
+    """Упаковывает список {"slot_index", "id", "count"} в записи _SLOT."""
+    out.append(_U32.pack(len(slots)))
+    pack = _SLOT.pack
+    intern = strings.intern
+    out.extend(pack(int(slot["slot_index"]), intern(slot["id"]), int(slot.get("count", 1)))
+               for slot in slots)
+
+
+def _unpack_slots(data: bytes, offset: int, strings: list):
+    count = _U32.unpack_from(data, offset)[0]
+    offset += 4
+    end = offset + count * _SLOT.size
+    slots = [{"slot_index": slot, "id": strings[item], "count": amount}
+             for slot, item, amount in _SLOT.iter_unpack(data[offset:end])]
+    return slots, end
+
+
+def _pack_inventory(inventory: dict, strings: _StringTable, out: list):
+    _pack_slots(inventory.get("inventory_slots", []), strings, out)
+    rest = {key: value for key, value in inventory.items() if key != "inventory_slots"}
+    _pack_value(rest, strings, out)
+
+
+def _unpack_inventory(data: bytes, strings: list) -> dict:
+    slots, offset = _unpack_slots(data, 0, strings)
+    rest, _ = _unpack_value(data, offset, strings)
+    return {"inventory_slots": slots, **rest}
+
+
+def _pack_chests(chests: dict, strings: _StringTable, out: list):
+    out.append(_U32.pack(len(chests)))
+    for key, chest in chests.items():
+        items = chest.get("items", [])
+        # Ключ словаря и chest_id совпадают у всех сундуков ChestManager
+        out.append(_CHEST.pack(strings.intern(key), int(chest.get("max_slots", 24)), len(items)))
+        if chest.get("chest_id", key) != key:
+            out.append(bytes((_TRUE,)) + _U32.pack(strings.intern(chest["chest_id"])))
+        else:
+            out.append(bytes((_FALSE,)))
+        pack = _SLOT.pack
+        intern = strings.intern
+        out.extend(pack(int(item["slot_index"]), intern(item["id"]), int(item.get("count", 1)))
+                   for item in items)
+
+
+def _unpack_chests(data: bytes, strings: list) -> dict:
+    count = _U32.unpack_from(data, 0)[0]
+    offset = 4
+    chests = {}
+    chest_size = _CHEST.size
+    slot_size = _SLOT.size
+    for _ in range(count):
+        key_index, max_slots, item_count = _CHEST.unpack_from(data, offset)
+        offset += chest_size
+        key = strings[key_index]
+        chest_id = key
+        if data[offset] == _TRUE:
+            chest_id = strings[_U32.unpack_from(data, offset + 1)[0]]
+            offset += 5
+        else:
+            offset += 1
+        end = offset + item_count * slot_size
+        chests[key] = {
+            "chest_id": chest_id,
+            "max_slots": max_slots,
+            "items": [{"slot_index": slot, "id": strings[item], "count": amount}
+                      for slot, item, amount in _SLOT.iter_unpack(data[offset:end])],
+        }
+        offset = end
+    return chests
+
+
+# ----------------------------------------------------------------------
+# Контейнер
+# ----------------------------------------------------------------------
+def encode_save(data: dict) -> bytes:
+    """
+    Кодирует словарь сохранения в двоичный контейнер.
+
+    Args:
+        data: {"player", "inventory", "dialogues", "chests", ...}
+
+    Returns:
+        Байты файла сохранения.
+    """
+    strings = _StringTable()
+    sections = []
+    misc = {}
+    for key, value in data.items():
+        tag = SECTION_TAGS.get(key)
+        if tag is None:
+            misc[key] = value
+            continue
+        out = []
+        if key == "inventory":
+            _pack_inventory(value or {}, strings, out)
+        elif key == "chests":
+            _pack_chests(value or {}, strings, out)
+        else:
+            _pack_value(value, strings, out)
+        sections.append((tag, b"".join(out)))
+    if misc:
+        out = []
+        _pack_value(misc, strings, out)
+        sections.append((_MISC_TAG, b"".join(out)))
+
+    # Таблица строк заполняется при упаковке секций, но пишется первой
+    sections.insert(0, (_STRINGS_TAG, strings.encode()))
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections))]
+    for tag, payload in sections:
+        parts.append(_SECTION.pack(tag, len(payload)))
+        parts.append(payload)
+    return b"".join(parts)
+
+
+def decode_save(raw: bytes) -> dict:
+    """
+    Читает двоичный контейнер сохранения.
+
+    Args:
+        raw: Байты файла.
+
+    Returns:
+        Словарь сохранения в том же виде, что передавался в encode_save.
+
+    Raises:
+        ValueError: Не файл сохранения или версия новее поддерживаемой.
+    """
+    if len(raw) < _HEADER.size:
+        raise ValueError("Файл сохранения повреждён")
+    magic, version, section_count = _HEADER.unpack_from(raw, 0)
+    if magic != MAGIC:
+        raise ValueError("Не файл сохранения SwordFall")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Версия сохранения {version} новее поддерживаемой {FORMAT_VERSION}")
+
+    names = {tag: key for key, tag in SECTION_TAGS.items()}
+    strings = []
+    result = {}
+    offset = _HEADER.size
+    for _ in range(section_count):
+        tag, length = _SECTION.unpack_from(raw, offset)
+        offset += _SECTION.size
+        payload = raw[offset:offset + length]
+        offset += length
+        if len(payload) != length:
+            raise ValueError("Файл сохранения обрезан")
+
+        if tag == _STRINGS_TAG:
+            count = _U32.unpack_from(payload, 0)[0]
+            position = 4
+            for _ in range(count):
+                size = _U16.unpack_from(payload, position)[0]
+                position += 2
+                strings.append(payload[position:position + size].decode("utf-8"))
+                position += size
+        elif tag == b"INVT":
+            result["inventory"] = _unpack_inventory(payload, strings)
+        elif tag == b"CHST":
+            result["chests"] = _unpack_chests(payload, strings)
+        elif tag == _MISC_TAG:
+            result.update(_unpack_value(payload, 0, strings)[0])
+        elif tag in names:
+            result[names[tag]] = _unpack_value(payload, 0, strings)[0]
+        # Секции из более новых версий формата пропускаются
+    return result
+
+
+class BinarySaveCodec:
+    """Кодек двоичного контейнера для SaveWorker."""
+
+    binary = True
+
+    @staticmethod
+    def read(path: str) -> dict:
+        with open(path, "rb") as f:
+            raw = f.read()
+        try:
+            return decode_save(raw)
+        except (struct.error, IndexError, KeyError) as e:
+            raise ValueError(f"Файл сохранения повреждён: {e}") from e
+
+    @staticmethod
+    def encode(data: dict) -> bytes:
+        return encode_save(data)
+
+
+class JsonSaveCodec:
+    """Кодек JSON-файлов (прежний формат) для SaveWorker."""
+
+    binary = False
+
+    def __init__(self, indent: int | None = 2):
+        self.indent = indent
+
+    @staticmethod
+    def read(path: str) -> dict:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def encode(self, data: dict) -> str:
+        return json.dumps(data, ensure_ascii=False, indent=self.indent)
+
+
+def encode_journal_record(chests: dict) -> bytes:
+    """
+    Кодирует запись журнала сундуков.
+
+    Args:
+        chests: {chest_id: данные сундука} - только изменённые сундуки.
+
+    Returns:
+        Байты для дописывания в конец журнала.
+    """
+    payload = encode_save({"chests": chests})
+    return _U32.pack(len(payload)) + payload
+
+
+def read_chest_journal(path: str) -> tuple[dict, int, bool]:
+    """
+    Читает журнал сундуков.
+
+    Записи применяются по порядку: более поздняя запись сундука заменяет
+    предыдущую. Чтение останавливается на первой оборванной записи.
+
+    Returns:
+        (сундуки из журнала, число целых записей, прочитан ли журнал до
+        конца). Если файла нет - ({}, 0, True). False означает хвост,
+        оборванный при сбое: дописанное после него уже не прочитать, и
+        журнал нужно сжать.
+    """
+    if not os.path.exists(path):
+        return {}, 0, True
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    chests = {}
+    records = 0
+    offset = 0
+    while offset + _U32.size <= len(raw):
+        length = _U32.unpack_from(raw, offset)[0]
+        start = offset + _U32.size
+        if start + length > len(raw):
+            break  # запись оборвана при сбое
+        try:
+            record = decode_save(raw[start:start + length])
+        except (ValueError, struct.error, IndexError, KeyError):
+            break
+        chests.update(record.get("chests", {}))
+        records += 1
+        offset = start + length
+    return chests, records, offset == len(raw)
+
+
+def read_save(path: str) -> dict | None:
+    """
+    Читает двоичное сохранение.
+
+    Returns:
+        Словарь сохранения или None, если файла нет.
+    """
+    if not os.path.exists(path):
+        return None
+    return BinarySaveCodec.read(path)
+
+
+def migrate_json_saves(save_json_path: str, chests_json_path: str) -> dict | None:
+    """
+    Собирает словарь сохранения из прежних JSON-файлов.
+
+    Args:
+        save_json_path: Путь к savegame.json (игрок, инвентарь, диалоги).
+        chests_json_path: Путь к chests.json (сундуки).
+
+    Returns:
+        Словарь для encode_save или None, если старых файлов нет.
+    """
+    data = {}
+    if os.path.exists(save_json_path):
+        save_data = JsonSaveCodec.read(save_json_path)
+        if isinstance(save_data, dict):
+            data.update(save_data)
+    if os.path.exists(chests_json_path):
+        chests = JsonSaveCodec.read(chests_json_path)
+        if isinstance(chests, dict):
+            data["chests"] = chests
+    return data or None
@@ -1,33 +1,90 @@
 """
 Модуль сохранения и загрузки состояния игры.
 
-Сохраняет в JSON (в папке Game/userdata) базовое состояние:
+Сохраняет (в папке Game/userdata) базовое состояние:
 - позиция игрока и текущая карта;
 - состояние инвентаря (слоты и экипировка);
 - прогресс диалогов с NPC.
 
+По умолчанию всё, включая сундуки ChestManager, хранится в одном двоичном
+контейнере save.bin (core/save_format.py, config.SAVE["FORMAT"]). Если его
+ещё нет, данные один раз переносятся из прежних savegame.json и chests.json.
+
 Функции стараются быть максимально безопасными: при любой ошибке просто
 выводится предупреждение в консоль и игра продолжает работать без сохранения.
+
+Запись выполняется в фоне (core/save_worker.py): в главном потоке снимается
+только снимок данных, а слияние с файлом, сериализация и запись - в потоке.
 """
 
 from __future__ import annotations
 
-import json
 import os
 from typing import Any, Dict
 
 from core.config import config
+from core.save_format import BinarySaveCodec, migrate_json_saves, read_save
+from core.save_worker import save_worker
 from dialogues.npc_dialogues import RoyalGuardDialogue, KingDialogue
 
 
 SAVE_FILE_PATH = os.path.join("Game", "userdata", "savegame.json")
+CHESTS_FILE_PATH = os.path.join("Game", "userdata", "chests.json")
+BINARY_SAVE_PATH = os.path.join("Game", "userdata", "save.bin")
+CHEST_JOURNAL_PATH = os.path.join("Game", "userdata", "chests.journal")
+
+# Секции, по которым понятно, что игра уже сохранялась (не только сундуки)
+_GAME_SECTIONS = ("player", "inventory", "dialogues")
+
+
+def _use_binary() -> bool:
+    """Включён ли двоичный формат сохранений."""
+    return config.SAVE.get("FORMAT", "binary") == "binary"
+
+
+def submit_save_sections(sections: Dict[str, Any]) -> None:
+    """
+    Ставит в очередь запись секций сохранения (остальные секции не меняются).
+
+    Args:
+        sections: {"player": ..., "inventory": ..., "chests": ...} - снимок данных.
+    """
+    if _use_binary():
+        save_worker.submit(BINARY_SAVE_PATH, sections, merge=True, codec=BinarySaveCodec)
+    elif set(sections) == {"chests"}:
+        # Прежний формат: сундуки лежат отдельным файлом
+        save_worker.submit(CHESTS_FILE_PATH, sections["chests"])
+    else:
+        save_worker.submit(SAVE_FILE_PATH, sections, merge=True)
+
+
+def read_save_data() -> Dict[str, Any] | None:
+    """
+    Читает все секции сохранения (дождавшись незаписанных сохранений).
 
+    В двоичном режиме при отсутствии save.bin переносит данные из JSON-файлов.
 
-def _ensure_save_dir() -> None:
-    """Гарантирует наличие директории для сохранений."""
-    save_dir = os.path.dirname(SAVE_FILE_PATH)
-    if save_dir and not os.path.exists(save_dir):
-        os.makedirs(save_dir, exist_ok=True)
+    Returns:
+        Словарь секций или None, если сохранений нет или файл не читается.
+    """
+    save_worker.flush()
+    try:
+        if not _use_binary():
+            data = migrate_json_saves(SAVE_FILE_PATH, CHESTS_FILE_PATH)
+            return data
+
+        data = read_save(BINARY_SAVE_PATH)
+        if data is None:
+            data = migrate_json_saves(SAVE_FILE_PATH, CHESTS_FILE_PATH)
+            if data:
+                save_worker.submit(BINARY_SAVE_PATH, data, codec=BinarySaveCodec)
+                if config.DEBUG_MODE:
+                    print(f"[SAVE] Сохранения перенесены из JSON в {BINARY_SAVE_PATH}")
+        return data
+    except (OSError, ValueError) as e:
+        if config.DEBUG_MODE:
+            print(f"[LOAD] Ошибка чтения сохранения: {e}")
+        return None
 
 
 def _serialize_inventory(game) -> Dict[str, Any]:
@@ -79,24 +136,14 @@ def _serialize_dialogues(game) -> Dict[str, Any]:
 
 def save_game_state(game) -> None:
     """
-    Сохраняет текущее состояние игры в JSON.
+    Сохраняет текущее состояние игры (save.bin или JSON, см. config.SAVE["FORMAT"]).
 
     Должно вызываться при выходе из игры или возврате в главное меню.
-    Загружает существующий файл и обновляет только измененные секции.
+    Снимок собирается сразу, а запись идёт в фоне: обновляются только
+    сохраняемые секции, остальные секции файла остаются как были.
     """
     try:
-        # Загружаем существующие данные, если файл есть
-        existing_data: Dict[str, Any] = {}
-        if os.path.exists(SAVE_FILE_PATH):
-            try:
-                with open(SAVE_FILE_PATH, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-            except Exception as e:
-                if config.DEBUG_MODE:
-                    print(f"[SAVE] Не удалось загрузить существующий файл: {e}")
-        
-        # Начинаем с существующих данных
-        data = existing_data.copy()
+        data: Dict[str, Any] = {}
 
         # Обновляем позицию игрока и карту
         player = getattr(game, "player", None)
@@ -121,12 +168,10 @@ def save_game_state(game) -> None:
                 print("[SAVE] Нет данных для сохранения.")
             return
 
-        _ensure_save_dir()
-        with open(SAVE_FILE_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        submit_save_sections(data)
 
         if config.DEBUG_MODE:
-            print(f"[SAVE] Состояние игры сохранено в {SAVE_FILE_PATH}")
+            print("[SAVE] Сохранение поставлено в очередь")
     except Exception as e:
         if config.DEBUG_MODE:
             print(f"[SAVE] Ошибка при сохранении игры: {e}")
@@ -193,17 +238,10 @@ def load_game_state(game) -> bool:
 
     Возвращает True, если загрузка прошла успешно и состояние было применено.
     """
-    if not os.path.exists(SAVE_FILE_PATH):
-        if config.DEBUG_MODE:
-            print(f"[LOAD] Файл сохранения не найден: {SAVE_FILE_PATH}")
-        return False
-
-    try:
-        with open(SAVE_FILE_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception as e:
+    data = read_save_data()
+    if not data or not any(key in data for key in _GAME_SECTIONS):
         if config.DEBUG_MODE:
-            print(f"[LOAD] Ошибка чтения файла сохранения: {e}")
+            print("[LOAD] Сохранение игры не найдено")
         return False
 
     try:
@@ -241,7 +279,7 @@ def load_game_state(game) -> bool:
             _restore_dialogues(game, dlg_data)
 
         if config.DEBUG_MODE:
-            print(f"[LOAD] Состояние игры успешно загружено из {SAVE_FILE_PATH}")
+            print("[LOAD] Состояние игры успешно загружено")
 
         return True
     except Exception as e:
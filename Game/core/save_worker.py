@@ -0,0 +1,296 @@
+"""
+Модуль фоновой записи сохранений.
+
+Содержит класс SaveWorker: главный поток быстро снимает снимок данных
+(словари из примитивов), а сериализация (JSON или двоичный контейнер
+core/save_format.py) и запись на диск выполняются в отдельном потоке. Запись атомарная (временный файл + os.replace),
+повторные запросы к одному файлу, пришедшие подряд, объединяются в одну запись.
+Для журналов (дописывание в конец файла) есть append и truncate.
+"""
+
+import atexit
+import os
+import threading
+import time
+
+from core.config import config
+from core.save_format import JsonSaveCodec
+
+
+class SaveWorker:
+    """
+    Фоновый поток записи файлов сохранений.
+
+    Запросы хранятся по пути файла: новый запрос к тому же файлу заменяет
+    ещё не записанный (или дополняет его секции при merge=True), поэтому
+    серия сохранений подряд даёт одну запись.
+    """
+
+    def __init__(self):
+        """Инициализация фоновой записи."""
+        settings = config.SAVE
+        self.async_enabled = settings.get("ASYNC", True)
+        self.coalesce_delay = settings.get("COALESCE_DELAY", 0.1)
+
+        self._condition = threading.Condition()
+        # путь -> {"data", "merge", "codec", "time", "delay"} или журнал {"chunks", "truncate", "time"}
+        self._pending = {}
+        self._json_codec = JsonSaveCodec()
+        self._writing = None  # путь, который сейчас записывается
+        self._flush_requested = False
+        self._thread = None
+        self.stats = {"requests": 0, "writes": 0, "coalesced": 0, "errors": 0,
+                      "last_write_ms": 0.0}
+
+    # ------------------------------------------------------------------
+    # Запросы из главного потока
+    # ------------------------------------------------------------------
+    def submit(self, path: str, data: dict, merge: bool = False, codec=None,
+               delay: float | None = None):
+        """
+        Ставит запись файла в очередь.
+
+        Args:
+            path: Путь к файлу.
+            data: Снимок данных. Не должен изменяться после передачи.
+            merge: Обновить только секции верхнего уровня, сохранив остальные
+                секции существующего файла.
+            codec: Формат файла (read/encode, см. core/save_format.py);
+                по умолчанию JSON с отступами.
+            delay: Запись через delay секунд после последнего запроса к файлу
+                (debounce). По умолчанию - через COALESCE_DELAY после первого.
+        """
+        with self._condition:
+            self.stats["requests"] += 1
+            pending = self._pending.get(path)
+            if pending is not None:
+                self.stats["coalesced"] += 1
+                if merge and pending["merge"]:
+                    data = {**pending["data"], **data}
+            if delay is None:
+                delay = self.coalesce_delay
+                queued_at = pending["time"] if pending else time.monotonic()
+            else:
+                queued_at = time.monotonic()
+            self._pending[path] = {"data": data, "merge": merge, "codec": codec or self._json_codec,
+                                   "time": queued_at, "delay": delay}
+            self._wake()
+
+        if not self.async_enabled:
+            # Синхронный режим (config.SAVE["ASYNC"] = False): пишем сразу
+            self._drain()
+
+    def append(self, path: str, chunk: bytes, on_error=None):
+        """
+        Ставит в очередь дописывание байтов в конец файла (журнал).
+
+        Args:
+            path: Путь к файлу журнала.
+            chunk: Готовая запись журнала.
+            on_error: Функция(ошибка), вызываемая из фонового потока, если
+                запись не удалась (запись могла оборваться посередине).
+        """
+        with self._condition:
+            self.stats["requests"] += 1
+            pending = self._pending.get(path)
+            if pending is not None:
+                self.stats["coalesced"] += 1
+                pending["chunks"].append(chunk)
+            else:
+                pending = {"chunks": [chunk], "truncate": False, "time": time.monotonic(),
+                           "on_error": []}
+                self._pending[path] = pending
+            if on_error is not None:
+                pending["on_error"].append(on_error)
+            self._wake()
+        if not self.async_enabled:
+            self._drain()
+
+    def truncate(self, path: str, on_error=None):
+        """
+        Очищает журнал после записей, поставленных в очередь раньше.
+
+        Недописанные записи журнала отбрасываются. Запрос ставится в конец
+        очереди, поэтому файл, в который перенесено содержимое журнала
+        (сжатие), записывается до очистки.
+
+        Args:
+            path: Путь к файлу журнала.
+            on_error: Функция(ошибка), вызываемая из фонового потока, если
+                очистка не удалась.
+        """
+        with self._condition:
+            self.stats["requests"] += 1
+            if self._pending.pop(path, None) is not None:
+                self.stats["coalesced"] += 1
+            self._pending[path] = {"chunks": [], "truncate": True, "time": time.monotonic(),
+                                   "on_error": [on_error] if on_error is not None else []}
+            self._wake()
+        if not self.async_enabled:
+            self._drain()
+
+    def discard(self, path: str):
+        """Отменяет ещё не записанный запрос к файлу."""
+        with self._condition:
+            self._pending.pop(path, None)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Дожидается записи всех запросов (выход из игры, перед чтением файла).
+
+        Args:
+            timeout: Максимальное ожидание в секундах (None - без ограничения).
+
+        Returns:
+            True, если очередь пуста.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._drain()
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self._flush_requested = False
+        return True
+
+    def is_busy(self) -> bool:
+        """Есть ли незаписанные запросы."""
+        with self._condition:
+            return bool(self._pending or self._writing)
+
+    # ------------------------------------------------------------------
+    # Фоновый поток
+    # ------------------------------------------------------------------
+    def _wake(self):
+        """Будит фоновый поток (вызывается под блокировкой)."""
+        if self.async_enabled:
+            self._ensure_thread()
+            self._condition.notify_all()
+        else:
+            self._flush_requested = True
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="SaveWorker", daemon=True)
+            self._thread.start()
+
+    def _take_ready(self, force: bool):
+        """Забирает запрос, который пора записать (вызывается под блокировкой).
+
+        Returns:
+            (путь, запрос) или None и время ожидания до следующего запроса.
+        """
+        now = time.monotonic()
+        wait = None
+        for path, request in self._pending.items():
+            ready_at = request["time"] + request.get("delay", self.coalesce_delay)
+            if force or ready_at <= now:
+                self._writing = path
+                return (path, self._pending.pop(path)), None
+            wait = ready_at - now if wait is None else min(wait, ready_at - now)
+        return None, wait
+
+    def _run(self):
+        while True:
+            with self._condition:
+                job, wait = self._take_ready(self._flush_requested)
+                while job is None:
+                    self._condition.wait(wait)
+                    job, wait = self._take_ready(self._flush_requested)
+            try:
+                self._write(*job)
+            finally:
+                with self._condition:
+                    self._writing = None
+                    self._condition.notify_all()
+
+    def _drain(self):
+        """Записывает все запросы в текущем потоке."""
+        while True:
+            with self._condition:
+                job, _ = self._take_ready(True)
+                if job is None:
+                    self._flush_requested = False
+                    return
+            try:
+                self._write(*job)
+            finally:
+                with self._condition:
+                    self._writing = None
+                    self._condition.notify_all()
+
+    def _write(self, path: str, request: dict):
+        """Сериализует снимок и атомарно заменяет файл."""
+        start = time.perf_counter()
+        try:
+            if "chunks" in request:
+                self._write_journal(path, request)
+                return
+            data = request["data"]
+            codec = request["codec"]
+            if request["merge"] and os.path.exists(path):
+                try:
+                    existing = codec.read(path)
+                    if isinstance(existing, dict):
+                        data = {**existing, **data}
+                except (OSError, ValueError) as e:
+                    if config.DEBUG_MODE:
+                        print(f"[SAVE] Не удалось прочитать {path}: {e}")
+
+            content = codec.encode(data)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            temp_path = f"{path}.tmp"
+            if codec.binary:
+                f = open(temp_path, "wb")
+            else:
+                f = open(temp_path, "w", encoding="utf-8")
+            with f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+            self._record_write(path, start)
+        except Exception as e:
+            self.stats["errors"] += 1
+            if config.DEBUG_MODE:
+                print(f"[SAVE] Ошибка записи {path}: {e}")
+            for callback in request.get("on_error", ()):
+                callback(e)
+
+    def _write_journal(self, path: str, request: dict):
+        """Дописывает записи в журнал (или переписывает его после truncate)."""
+        start = time.perf_counter()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        content = b"".join(request["chunks"])
+        target = f"{path}.tmp" if request["truncate"] else path
+        with open(target, "wb" if request["truncate"] else "ab") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if request["truncate"]:
+            os.replace(target, path)
+        self._record_write(path, start)
+
+    def _record_write(self, path: str, start: float):
+        self.stats["writes"] += 1
+        self.stats["last_write_ms"] = (time.perf_counter() - start) * 1000
+        if config.DEBUG_MODE:
+            print(f"[SAVE] Записан {path} за {self.stats['last_write_ms']:.1f} мс")
+
+
+# Глобальный экземпляр; незаписанное дописывается при любом выходе (в т.ч. sys.exit из меню)
+save_worker = SaveWorker()
+atexit.register(save_worker.flush, 5.0)
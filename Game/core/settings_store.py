@@ -0,0 +1,87 @@
+"""
+Модуль хранения пользовательских настроек.
+
+Содержит класс SettingsStore: настройки (звук, язык) читаются с диска
+один раз и дальше живут в памяти. Изменение применяется сразу, а запись
+файла откладывается до паузы в изменениях (debounce) и выполняется
+в потоке SaveWorker, поэтому перетаскивание ползунка громкости не пишет
+файл на каждое движение мыши. Незаписанные изменения дописываются при
+выходе (atexit в core/save_worker.py).
+"""
+
+import copy
+import json
+import os
+
+from core.save_format import JsonSaveCodec
+
+SOUND_SETTINGS_PATH = os.path.join("userdata", "sound_settings.json")
+CONFIG_SETTINGS_PATH = os.path.join("userdata", "config_settings.json")
+
+
+class SettingsStore:
+    """
+    Настройки пользователя в памяти с отложенной записью на диск.
+
+    Каждый файл настроек - словарь верхнего уровня; update меняет ключи
+    в памяти и ставит запись всего словаря в очередь SaveWorker.
+    """
+
+    def __init__(self):
+        """Инициализация хранилища."""
+        self._files = {}  # путь -> словарь настроек
+        self._codec = JsonSaveCodec(indent=None)
+
+    def load(self, path: str) -> dict:
+        """
+        Возвращает настройки файла (с диска - только при первом обращении).
+
+        Args:
+            path: Путь к JSON-файлу настроек.
+
+        Returns:
+            Словарь настроек; пустой, если файла нет или он повреждён.
+        """
+        settings = self._files.get(path)
+        if settings is None:
+            settings = {}
+            try:
+                if os.path.exists(path):
+                    data = self._codec.read(path)
+                    if isinstance(data, dict):
+                        settings = data
+            except (OSError, json.JSONDecodeError):
+                pass
+            self._files[path] = settings
+        return settings
+
+    def get(self, path: str, key: str, default=None):
+        """Значение одной настройки."""
+        return self.load(path).get(key, default)
+
+    def update(self, path: str, values: dict):
+        """
+        Меняет настройки в памяти и откладывает запись файла.
+
+        Args:
+            path: Путь к JSON-файлу настроек.
+            values: Новые значения ключей верхнего уровня.
+        """
+        settings = self.load(path)
+        settings.update(values)
+
+        # Локальный импорт: config читает настройки языка при создании,
+        # раньше, чем можно импортировать SaveWorker (он сам импортирует config)
+        from core.config import config
+        from core.save_worker import save_worker
+        save_worker.submit(path, copy.deepcopy(settings), codec=self._codec,
+                           delay=config.SAVE.get("SETTINGS_DEBOUNCE", 0.5))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Записывает отложенные изменения сразу."""
+        from core.save_worker import save_worker
+        return save_worker.flush(timeout)
+
+
+# Глобальный экземпляр
+settings_store = SettingsStore()
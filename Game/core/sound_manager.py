@@ -7,9 +7,9 @@
 
 import pygame
 import os
-import json
 from core.config import config
 from core.pathutils import resource_path
+from core.settings_store import settings_store, SOUND_SETTINGS_PATH
 
 
 class SoundManager:
@@ -54,17 +54,10 @@ class SoundManager:
     def load_settings(self):
         """Загружает настройки звука из файла."""
         try:
-            dir_path = "userdata"
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-            sound_path = os.path.join(dir_path, "sound_settings.json")
-            
-            if os.path.exists(sound_path):
-                with open(sound_path, "r") as f:
-                    settings = json.load(f)
-                    self.music_volume = settings.get("music_volume", 0.5)
-                    self.sound_volume = settings.get("sound_volume", 0.7)
-                    self.music_volumes = settings.get("music_volumes", {})
+            settings = settings_store.load(SOUND_SETTINGS_PATH)
+            self.music_volume = settings.get("music_volume", 0.5)
+            self.sound_volume = settings.get("sound_volume", 0.7)
+            self.music_volumes = dict(settings.get("music_volumes", {}))
             
             # Явно применяем громкость музыки и звуков после загрузки настроек
             pygame.mixer.music.set_volume(self.music_volume)
@@ -78,19 +71,13 @@ class SoundManager:
                 print(f"Ошибка загрузки настроек звука: {e}")
 
     def save_settings(self):
-        """Сохраняет настройки звука в файл."""
+        """Сохраняет настройки звука (запись файла отложена и идёт в фоне)."""
         try:
-            dir_path = "userdata"
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-            sound_path = os.path.join(dir_path, "sound_settings.json")
-            settings = {
+            settings_store.update(SOUND_SETTINGS_PATH, {
                 "music_volume": self.music_volume,
                 "sound_volume": self.sound_volume,
                 "music_volumes": self.music_volumes
-            }
-            with open(sound_path, "w") as f:
-                json.dump(settings, f)
+            })
         except Exception as e:
             if config.DEBUG_MODE:
                 print(f"Ошибка сохранения настроек звука: {e}")
@@ -112,7 +99,7 @@ class SoundManager:
             sound = pygame.mixer.Sound(full_path)
             sound.set_volume(self.sound_volume)
             return sound
-        except pygame.error as e:
+        except (pygame.error, FileNotFoundError) as e:
             if config.DEBUG_MODE:
                 print(f"[SoundManager] Ошибка загрузки звука {full_path}: {e}")
             # Создаем пустой звук, чтобы избежать ошибок
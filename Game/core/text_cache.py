@@ -0,0 +1,133 @@
+"""
+Модуль кеша шрифтов и отрисованного текста.
+
+Содержит два общих объекта:
+- FontRegistry (fonts) - один объект Font на (имя, размер, жирность):
+  шрифты не создаются заново в каждом кадре и в каждом модуле;
+- TextCache (text_cache) - готовые поверхности текста по ключу
+  (шрифт, размер, текст, цвет, сглаживание). Подписи интерфейса
+  (характеристики, кнопки, количество предметов, имена NPC) почти не
+  меняются между кадрами, поэтому font.render выполняется один раз.
+  Кеш ограничен TEXT_CACHE["MAX_ENTRIES"] строками, вытесняются давно
+  не использованные (часто меняющийся текст - FPS, таймеры - просто
+  проходит через кеш и вытесняется).
+"""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pygame
+
+from core.config import config
+
+
+class FontRegistry:
+    """
+    Реестр шрифтов: один объект на (имя, размер, жирность).
+    """
+
+    def __init__(self):
+        """Инициализация реестра."""
+        self._fonts = {}  # (имя, размер, жирный) -> pygame.font.Font
+
+    def get(self, size: int, name: Optional[str] = None, bold: bool = False) -> pygame.font.Font:
+        """
+        Возвращает общий шрифт.
+
+        Args:
+            size: Размер шрифта.
+            name: Имя системного шрифта (SysFont) или None - встроенный шрифт pygame.
+            bold: Жирное начертание.
+
+        Returns:
+            Шрифт (общий - не менять его стиль).
+        """
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            if name is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+            else:
+                font = pygame.font.SysFont(name, size, bold=bold)
+            self._fonts[key] = font
+        return font
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+
+class TextCache:
+    """
+    LRU-кеш поверхностей текста.
+    """
+
+    def __init__(self, font_registry: FontRegistry):
+        """
+        Инициализация кеша.
+
+        Args:
+            font_registry: Реестр, из которого берутся шрифты.
+        """
+        self.fonts = font_registry
+        self.max_entries = config.TEXT_CACHE.get("MAX_ENTRIES", 512)
+        self._surfaces = OrderedDict()  # ключ -> поверхность, от давних к недавним
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def render(self, text: str, size: int, color: Tuple[int, ...], name: Optional[str] = None,
+               bold: bool = False, antialias: bool = True) -> pygame.Surface:
+        """
+        Возвращает поверхность текста (из кеша или отрисованную).
+
+        Args:
+            text: Текст.
+            size: Размер шрифта.
+            color: Цвет текста.
+            name: Имя системного шрифта или None - встроенный шрифт pygame.
+            bold: Жирное начертание.
+            antialias: Сглаживание.
+
+        Returns:
+            Общая поверхность (не изменять: set_alpha, fill и т.п.
+            испортят текст у всех, кто его использует).
+        """
+        key = (name, size, bold, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.stats["hits"] += 1
+            return surface
+
+        self.stats["misses"] += 1
+        surface = self.fonts.get(size, name, bold).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.stats["evictions"] += 1
+        return surface
+
+    def clear(self):
+        """Удаляет все поверхности (например, при смене языка)."""
+        self._surfaces.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Статистика кеша для отладочного вывода.
+
+        Returns:
+            Число строк и шрифтов, занятая память в байтах, попадания,
+            промахи (= вызовы font.render), вытеснения и доля попаданий.
+        """
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "entries": len(self._surfaces),
+            "fonts": len(self.fonts),
+            "bytes": sum(surface.get_pitch() * surface.get_height() for surface in self._surfaces.values()),
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            **self.stats,
+        }
+
+
+# Глобальные экземпляры
+fonts = FontRegistry()
+text_cache = TextCache(fonts)
@@ -8,6 +8,7 @@
 import pygame
 import time
 import sys
+from collections import deque
 if sys.platform == "win32":
     import ctypes
     try:
@@ -25,12 +26,22 @@ from core.sound_manager import SoundManager
 from core.game_state_manager import GameStateManager
 from core.menu_handler import MenuHandler
 from core.game_resources import GameResources
+from core.presenter import FramePresenter
+from core.profiler import FrameProfiler
+from core.pathutils import normalize_map_path
+from core.text_cache import fonts, text_cache
+from core.level_cache import level_cache
+from core.level_preloader import level_preloader
+from level.interaction_zones import InteractionZones
+from level.map_objects import MapObjectRegistry
 from UI.main_menu import MainMenu
 from UI.settings_menu import SettingsMenu
 from UI.language_menu import LanguageMenu
 from UI.music_settings_menu import MusicSettingsMenu
 from UI.talk_button import TalkButton
 from UI.player_ui import PlayerUI
+from UI.icon_cache import icon_cache
+from level.animation_atlas import animation_atlas
 from items.items_loader import load_all_items
 
 
@@ -63,6 +74,8 @@ class Game:
             vsync=1
         )
         pygame.display.set_caption(config.GAME_NAME)
+        self.presenter = FramePresenter(self)
+        self.profiler = FrameProfiler()
 
         # Загрузка иконки
         try:
@@ -87,9 +100,9 @@ class Game:
         self._init_game_objects()
 
         # Отладочная информация
-        self.fps_history = []
+        self.fps_history = deque(maxlen=config.PROFILER.get("FPS_HISTORY", 300))
         self.last_log_time = time.time()
-        self.debug_font = pygame.font.SysFont('Arial', 16)
+        self.debug_font = fonts.get(16, 'Arial')
 
         # Кнопка разговора
         self.talk_button_img = pygame.image.load(config.DIALOGUE_BUTTON["IMAGE_PATH"]).convert_alpha()
@@ -107,7 +120,7 @@ class Game:
         self.show_dialogue = False
         self.dialogue_text = ""
         self.dialogue_start_time = 0
-        self.dialogue_font = pygame.font.SysFont('Arial', config.DIALOGUE_PANEL["FONT_SIZE"])
+        self.dialogue_font = fonts.get(config.DIALOGUE_PANEL["FONT_SIZE"], 'Arial')
         self.dialogue_text_shown = ""
         self.dialogue_type_time = 0
         self.dialogue_type_speed = 0.025
@@ -116,6 +129,7 @@ class Game:
         self.waiting_for_first_update = False
         self.unlock_control_time = 0
         self.wait_for_key_release = False
+        self.level_loads = 0  # Счётчик загрузок карт (GameLoop сбрасывает по нему интерполяцию)
 
         # Изображения NPC
         self.guard_img = config.load_npc_image("GUARD")
@@ -173,6 +187,8 @@ class Game:
         self.all_sprites = None
         self.npc_dialogues = {}
         self.interactive_objects = []
+        self.interaction_zones = InteractionZones()
+        self.map_objects = MapObjectRegistry()
         self.chest_objects = []  # Объекты сундуков для анимации
         
         # UI игрока (будет инициализирован после создания игрока)
@@ -220,70 +236,82 @@ class Game:
         """Проверить клик по кнопке разговора."""
         return self.talk_button.check_talk_button_click(mouse_pos)
 
-    def _render_game(self):
-        """Отрисовка игровой сцены."""
+    def _render_game(self, draw_level=True):
+        """Отрисовка игровой сцены.
+
+        Args:
+            draw_level: Рисовать ли чанки уровня (в режиме вывода native
+                уровень уже нарисован в окне)
+        """
         if not all([self.player, self.camera, self.level, self.level_renderer, self.all_sprites]):
             return
 
+        profiler = self.profiler
+
         # Отрисовка уровня
-        if self.level_renderer:
-            self.level_renderer.render(self.virtual_screen)
+        if self.level_renderer and draw_level:
+            with profiler.phase("level"):
+                self.level_renderer.render(self.virtual_screen)
 
         # Отрисовка спрайтов и анимации сундука с Y-сортировкой
-        if self.all_sprites and self.camera:
-            # Проверяем, нужно ли рисовать анимацию сундука
-            chest_needs_draw = (hasattr(self, 'chest_handler') and 
-                               self.chest_handler.chest_state in ('opening', 'closing') and 
-                               self.chest_handler.animating_obj)
-            
-            # Получаем Y-координату сундука для сортировки
-            chest_y = None
-            if chest_needs_draw:
-                chest_y = int(self.chest_handler.animating_obj.y)
-            
-            for sprite in self.all_sprites:
-                # Если есть анимация сундука и игрок ниже сундука (больше Y), рисуем сундук первым
-                if chest_needs_draw and sprite == self.player and chest_y is not None:
-                    if self.player.hitbox.centery > chest_y:
-                        self.chest_handler.draw(self.virtual_screen, self.camera)
-                        chest_needs_draw = False  # Уже нарисовали
-                
-                self.virtual_screen.blit(sprite.image, self.camera.apply(sprite.rect))
-            
-            # Если сундук не был нарисован (игрок выше сундука), рисуем его теперь
-            if chest_needs_draw:
-                self.chest_handler.draw(self.virtual_screen, self.camera)
-
-        # Отрисовка индикаторов урона и лечения
-        if self.player:
-            self.player.draw_indicators(self.virtual_screen)
-
-        # Отладочная отрисовка
-        if config.DEBUG_MODE and self.player and self.camera:
-            pygame.draw.rect(self.virtual_screen, (0, 255, 0),
-                             self.camera.apply(self.player.hitbox), 1)
-            if self.collision_objects:
-                for obj in self.collision_objects:
-                    pygame.draw.rect(self.virtual_screen, (255, 0, 0),
-                                     self.camera.apply(obj['rect']), 1)
+        with profiler.phase("sprites"):
+            if self.all_sprites and self.camera:
+                # Проверяем, нужно ли рисовать анимацию сундука
+                chest_needs_draw = (hasattr(self, 'chest_handler') and 
+                                   self.chest_handler.chest_state in ('opening', 'closing') and 
+                                   self.chest_handler.animating_obj)
+
+                # Получаем Y-координату сундука для сортировки
+                chest_y = None
+                if chest_needs_draw:
+                    chest_y = int(self.chest_handler.animating_obj.y)
+
+                for sprite in self.all_sprites:
+                    # Если есть анимация сундука и игрок ниже сундука (больше Y), рисуем сундук первым
+                    if chest_needs_draw and sprite == self.player and chest_y is not None:
+                        if self.player.hitbox.centery > chest_y:
+                            self.chest_handler.draw(self.virtual_screen, self.camera)
+                            chest_needs_draw = False  # Уже нарисовали
+
+                    self.virtual_screen.blit(sprite.image, self.camera.apply(sprite.rect))
+
+                # Если сундук не был нарисован (игрок выше сундука), рисуем его теперь
+                if chest_needs_draw:
+                    self.chest_handler.draw(self.virtual_screen, self.camera)
+
+            # Отрисовка индикаторов урона и лечения
+            if self.player:
+                self.player.draw_indicators(self.virtual_screen)
+
+            # Отладочная отрисовка
+            if config.DEBUG_MODE and self.player and self.camera:
+                pygame.draw.rect(self.virtual_screen, (0, 255, 0),
+                                 self.camera.apply(self.player.hitbox), 1)
+                if self.collision_objects:
+                    for obj in self.collision_objects:
+                        pygame.draw.rect(self.virtual_screen, (255, 0, 0),
+                                         self.camera.apply(obj['rect']), 1)
+
         # Отрисовка наложенных тайлов
         if self.level_renderer and self.player:
-            self.level_renderer.render_overlap_tiles(
-                self.virtual_screen,
-                (self.player.hitbox.centerx, self.player.hitbox.centery)
-            )
+            with profiler.phase("overlap"):
+                self.level_renderer.render_overlap_tiles(
+                    self.virtual_screen,
+                    (self.player.hitbox.centerx, self.player.hitbox.centery)
+                )
 
         # Отрисовка UI игрока
-        if self.player_ui:
-            self.player_ui.update(self.dt)
-            self.player_ui.draw()
-            
-            # Отрисовка экрана смерти
-            if not self.player.is_alive():
-                self.player_ui.draw_death_screen()
+        with profiler.phase("ui"):
+            if self.player_ui:
+                self.player_ui.update(self.dt)
+                self.player_ui.draw()
+
+                # Отрисовка экрана смерти
+                if not self.player.is_alive():
+                    self.player_ui.draw_death_screen()
 
-        if config.DEBUG_MODE:
-            self._draw_debug_info()
+            if config.DEBUG_MODE:
+                self._draw_debug_info()
 
     def _update_typewriter_text(self):
         """Обновление текста с эффектом печатной машинки."""
@@ -309,11 +337,46 @@ class Game:
             f"Anim State: {self.player.state_name if self.player else 'N/A'}",
             f"Objects: {len(self.collision_objects) if self.collision_objects else 0}",
         ]
-
+        if self.level_renderer:
+            stats = self.level_renderer.get_stats()
+            debug_text.append(
+                f"Chunks: {stats['resident_chunks']}/{stats['total_chunks']} "
+                f"{stats['resident_bytes'] // (1024 * 1024)}MB hit/miss {stats['hits']}/{stats['misses']}"
+            )
+        levels = level_cache.get_stats()
+        debug_text.append(f"Levels: {levels['levels']} cached {levels['bytes'] // (1024 * 1024)}MB "
+                          f"hit/miss {levels['hits']}/{levels['misses']}")
+        preload = level_preloader.get_stats()
+        debug_text.append(f"Preload: {preload['pending']} pending, ready {preload['ready']}, "
+                          f"taken {preload['taken']}, max step {preload['max_step_ms']:.1f}ms")
+        icons = icon_cache.get_stats()
+        debug_text.append(f"Icons: {icons['icons']} ({icons['unused']} unused, {icons['thumbnails']} thumbs) "
+                          f"{icons['bytes'] // 1024}KB hit/miss {icons['hits']}/{icons['misses']}")
+        sprites = animation_atlas.get_stats()
+        debug_text.append(f"Sprites: {sprites['sheets']} sheets, {sprites['frames']} frames "
+                          f"{sprites['bytes'] // 1024}KB hit/miss {sprites['frame_hits']}/{sprites['frame_misses']}")
+        texts = text_cache.get_stats()
+        debug_text.append(f"Text: {texts['entries']} ({texts['fonts']} fonts) {texts['bytes'] // 1024}KB "
+                          f"hit rate {texts['hit_rate'] * 100:.0f}%")
+        for path, timing in self.presenter.get_timings().items():
+            debug_text.append(f"Present {path}: {timing['avg_ms']:.2f}ms avg, "
+                              f"{timing['max_ms']:.2f}ms max ({timing['frames']})")
+
+        frame_stats = self.profiler.overlay_stats()
+        if frame_stats["frames"]:
+            worst = frame_stats["worst"]
+            slowest = max(worst["phases_ms"], key=worst["phases_ms"].get)
+            debug_text.append(f"Worst frame: {worst['total_ms']:.2f}ms "
+                              f"({slowest} {worst['phases_ms'][slowest]:.2f}ms)")
+
+        # Строки меняются каждый кадр: рендерим напрямую, не вытесняя из
+        # text_cache постоянные надписи интерфейса
         for i, text in enumerate(debug_text):
             surface = self.debug_font.render(text, True, (255, 255, 255))
             self.virtual_screen.blit(surface, (10, 10 + i * 20))
 
+        self.profiler.draw_overlay(self.virtual_screen, self.debug_font, stats=frame_stats)
+
     def _load_new_map(self, map_path):
         """Загрузить новую карту."""
         self.game_resources.load_new_map(map_path)
@@ -321,17 +384,19 @@ class Game:
     def load_new_map(self, map_path):
         """Публичный метод для загрузки новой карты."""
         # Универсальная проверка и автодобавление префикса Game/
-        if not map_path.replace('\\', '/').startswith('Game/'):
-            map_path = f'Game/{map_path.lstrip("/\\")}'
-        self._load_new_map(map_path)
+        self._load_new_map(normalize_map_path(map_path))
 
     def update_talk_button_state(self):
         """Публичный метод для обновления состояния кнопки разговора."""
         self._update_talk_button_state()
 
-    def render_game(self):
+    def render_game(self, draw_level=True):
         """Публичный метод для отрисовки игровой сцены."""
-        self._render_game()
+        self._render_game(draw_level)
+
+    def capture_scene(self):
+        """Копия последнего кадра в размере виртуального экрана (фон для инвентаря)."""
+        return self.presenter.capture_scene()
 
     def update_talk_button_alpha(self):
         """Публичный метод для обновления прозрачности кнопки разговора."""
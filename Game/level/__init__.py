@@ -14,8 +14,13 @@
 - Player: основной класс игрока с анимациями и состоянием
 - Camera: система камеры для следования за игроком
 - SpriteSheet: обработка спрайтшитов и анимаций
+- AnimationAtlas: общий кеш спрайтшитов и кадров анимаций
 - LevelRenderer: рендеринг уровня, тайлов и объектов
 - CollisionHandler: обработка коллизий между объектами
+- CollisionObjects: объекты коллизий с пространственной сеткой
+- SpatialGrid: равномерная сетка для поиска объектов рядом с областью
+- InteractionZones, InteractionType: зоны кнопки взаимодействия и типы объектов
+- MapObjectRegistry: индексы объектов карты (имя, тип, слой, сетка)
 - PlayerMovementHandler: управление движением игрока
 
 Все компоненты уровня доступны для импорта из других модулей игры.
@@ -24,6 +29,10 @@
 from .player import Player
 from .camera import Camera
 from .spritesheet import SpriteSheet
+from .animation_atlas import AnimationAtlas, animation_atlas
 from .level_renderer import LevelRenderer
-from .collisions import CollisionHandler
+from .spatial_grid import SpatialGrid
+from .collisions import CollisionHandler, CollisionObjects
+from .interaction_zones import InteractionType, InteractionZone, InteractionZones
+from .map_objects import MapObjectRegistry
 from .player_movement import PlayerMovementHandler
@@ -0,0 +1,143 @@
+"""
+Модуль общего атласа кадров анимаций.
+
+Содержит класс AnimationAtlas: спрайтшит загружается с диска один раз,
+а каждый кадр вырезается один раз и хранится по ключу
+(путь к спрайтшиту, прямоугольник кадра). Все экземпляры Player и оба
+набора анимаций (с оружием и без) берут кадры отсюда, поэтому смена
+экипировки - это поиск в словаре, а не декодирование PNG и десятки
+новых поверхностей.
+"""
+
+import os
+from typing import Iterable, List, Tuple
+
+import pygame
+
+from core.config import config
+
+
+class AnimationAtlas:
+    """
+    Кеш спрайтшитов и вырезанных из них кадров.
+    """
+
+    def __init__(self):
+        """Инициализация атласа."""
+        self._sheets = {}  # путь -> поверхность спрайтшита
+        self._frames = {}  # (путь, (x, y, ширина, высота)) -> кадр
+        self._sequences = {}  # (путь, позиции кадров, ширина, высота) -> список кадров
+        self.stats = {"sheet_loads": 0, "frame_hits": 0, "frame_misses": 0}
+
+    def get_sheet(self, path: str, width: int = 128, height: int = 64) -> pygame.Surface:
+        """
+        Возвращает спрайтшит (с диска - только при первом обращении).
+
+        Args:
+            path: Путь к файлу спрайтшита.
+            width: Ширина заглушки, если файл не загрузился.
+            height: Высота заглушки.
+
+        Returns:
+            Общая поверхность спрайтшита или красная заглушка с крестом.
+        """
+        sheet = self._sheets.get(path)
+        if sheet is None:
+            sheet = self._load_sheet(path, width, height)
+            self._sheets[path] = sheet
+            self.stats["sheet_loads"] += 1
+        return sheet
+
+    def get_frame(self, path: str, rect: Tuple[int, int, int, int]) -> pygame.Surface:
+        """
+        Возвращает кадр спрайтшита.
+
+        Args:
+            path: Путь к файлу спрайтшита.
+            rect: Прямоугольник кадра (x, y, ширина, высота).
+
+        Returns:
+            Общая поверхность кадра (не изменять).
+        """
+        key = (path, tuple(rect))
+        frame = self._frames.get(key)
+        if frame is not None:
+            self.stats["frame_hits"] += 1
+            return frame
+
+        self.stats["frame_misses"] += 1
+        x, y, width, height = key[1]
+        frame = pygame.Surface((width, height), pygame.SRCALPHA)
+        frame.blit(self.get_sheet(path, width, height), (0, 0), key[1])
+        self._frames[key] = frame
+        return frame
+
+    def get_frames(self, path: str, positions: Iterable[Tuple[int, int]], width: int,
+                   height: int) -> List[pygame.Surface]:
+        """
+        Кадры одной анимации.
+
+        Args:
+            path: Путь к файлу спрайтшита.
+            positions: Левые верхние углы кадров на спрайтшите.
+            width: Ширина кадра.
+            height: Высота кадра.
+
+        Returns:
+            Список общих поверхностей кадров (не изменять список).
+        """
+        key = (path, tuple(tuple(position) for position in positions), width, height)
+        frames = self._sequences.get(key)
+        if frames is None:
+            frames = [self.get_frame(path, (x, y, width, height)) for x, y in key[1]]
+            self._sequences[key] = frames
+        else:
+            self.stats["frame_hits"] += len(frames)
+        return frames
+
+    def clear(self):
+        """Выгружает все спрайтшиты и кадры."""
+        self._sheets.clear()
+        self._frames.clear()
+        self._sequences.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Статистика атласа для отладочного вывода.
+
+        Returns:
+            Число спрайтшитов и кадров, занятая память в байтах,
+            загрузки спрайтшитов, попадания и промахи по кадрам.
+        """
+        surfaces = list(self._sheets.values()) + list(self._frames.values())
+        return {
+            "sheets": len(self._sheets),
+            "frames": len(self._frames),
+            "bytes": sum(surface.get_pitch() * surface.get_height() for surface in surfaces),
+            **self.stats,
+        }
+
+    def _load_sheet(self, path: str, width: int, height: int) -> pygame.Surface:
+        try:
+            # Проверяем существование файла
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Файл не найден: {path}")
+
+            sheet = pygame.image.load(path).convert_alpha()
+            if config.DEBUG_MODE:
+                print(f"✅ Спрайт загружен: {path}")
+            return sheet
+
+        except Exception as e:
+            if config.DEBUG_MODE:
+                print(f"❌ Ошибка загрузки спрайта: {e}")
+            # Создаём красный квадрат вместо спрайта
+            sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(sheet, (255, 0, 0), (0, 0, width, height))
+            pygame.draw.line(sheet, (0, 0, 0), (0, 0), (width, height), 2)
+            pygame.draw.line(sheet, (0, 0, 0), (width, 0), (0, height), 2)
+            return sheet
+
+
+# Глобальный экземпляр
+animation_atlas = AnimationAtlas()
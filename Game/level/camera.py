@@ -28,6 +28,16 @@ class Camera:
         self.offset = pygame.math.Vector2()
         self.level_rect = pygame.Rect(0, 0, level_width, level_height)
 
+    def set_level_size(self, level_width: int, level_height: int) -> None:
+        """
+        Меняет границы уровня (камера переносится на новую карту).
+
+        Args:
+            level_width: Ширина уровня в пикселях.
+            level_height: Высота уровня в пикселях.
+        """
+        self.level_rect = pygame.Rect(0, 0, level_width, level_height)
+
     def apply(self, rect: pygame.Rect) -> pygame.Rect:
         """
         Применяет смещение камеры к объекту.
@@ -48,17 +58,30 @@ class Camera:
             target: Объект, за которым следует камера (обычно игрок).
         """
         # Центрируем камеру на хитбоксе игрока
-        target_x = target.hitbox.centerx - config.VIRTUAL_WIDTH // 2
-        target_y = target.hitbox.centery - config.VIRTUAL_HEIGHT // 2
+        self.offset.x, self.offset.y = self.offset_for(target.hitbox.centerx,
+                                                       target.hitbox.centery)
+
+    def offset_for(self, center_x: float, center_y: float) -> tuple[float, float]:
+        """
+        Смещение камеры, центрированной на точке, с учётом границ уровня.
+
+        Args:
+            center_x: X точки в координатах уровня.
+            center_y: Y точки в координатах уровня.
+
+        Returns:
+            Кортеж (x, y) смещения.
+        """
+        target_x = center_x - config.VIRTUAL_WIDTH // 2
+        target_y = center_y - config.VIRTUAL_HEIGHT // 2
 
         # Жёсткие границы для камеры
-        self.offset.x = max(0, min(target_x,
-                                   self.level_rect.width - config.VIRTUAL_WIDTH))
-        self.offset.y = max(0, min(target_y,
-                                   self.level_rect.height - config.VIRTUAL_HEIGHT))
+        offset_x = max(0, min(target_x, self.level_rect.width - config.VIRTUAL_WIDTH))
+        offset_y = max(0, min(target_y, self.level_rect.height - config.VIRTUAL_HEIGHT))
 
         # Фикс для маленьких уровней
         if self.level_rect.width < config.VIRTUAL_WIDTH:
-            self.offset.x = (self.level_rect.width - config.VIRTUAL_WIDTH) // 2
+            offset_x = (self.level_rect.width - config.VIRTUAL_WIDTH) // 2
         if self.level_rect.height < config.VIRTUAL_HEIGHT:
-            self.offset.y = (self.level_rect.height - config.VIRTUAL_HEIGHT) // 2
+            offset_y = (self.level_rect.height - config.VIRTUAL_HEIGHT) // 2
+        return offset_x, offset_y
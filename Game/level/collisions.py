@@ -5,8 +5,61 @@
 и игроком с поддержкой скольжения вдоль стен.
 """
 
+import math
+
 import pygame
 from core.config import config
+from level.map_objects import MapObjectRegistry
+from level.spatial_grid import SpatialGrid
+
+
+class CollisionObjects:
+    """
+    Объекты коллизий с пространственной сеткой.
+
+    Хранит словари {'rect', 'type', 'properties'} в порядке добавления и
+    позволяет быстро получить объекты рядом с областью. Объекты
+    добавляются только через add(), поэтому сетка всегда совпадает со
+    списком; удаления нет - набор строится один раз при загрузке карты.
+    """
+
+    def __init__(self, objects=(), cell_size: int | None = None):
+        """
+        Инициализация набора.
+
+        Args:
+            objects: Начальные объекты коллизий.
+            cell_size: Размер ячейки сетки в пикселях.
+        """
+        if cell_size is None:
+            cell_size = config.COLLISION_SETTINGS.get("GRID_CELL_SIZE", 128)
+        self._objects = []
+        self.grid = SpatialGrid(cell_size)
+        for obj in objects:
+            self.add(obj)
+
+    def __iter__(self):
+        return iter(self._objects)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def add(self, obj: dict) -> None:
+        """Добавляет объект коллизии и регистрирует его в сетке."""
+        self._objects.append(obj)
+        self.grid.insert(obj, obj['rect'])
+
+    def query(self, rect) -> list:
+        """
+        Возвращает объекты коллизий рядом с областью.
+
+        Args:
+            rect: Область запроса в мировых координатах.
+
+        Returns:
+            Кандидаты на пересечение в порядке добавления.
+        """
+        return self.grid.query(rect)
 
 
 class CollisionHandler:
@@ -22,37 +75,37 @@ class CollisionHandler:
         self.collision_buffer = 1  # Небольшой буфер для предотвращения "залипания"
 
     @staticmethod
-    def load_collision_objects(tmx_map):
+    def load_collision_objects(tmx_map, map_objects: MapObjectRegistry | None = None):
         """
         Загружает объекты коллизий из TMX карты.
         
         Args:
             tmx_map: Загруженная TMX карта.
+            map_objects: Реестр объектов этой карты (если уже построен).
             
         Returns:
-            Список объектов коллизий с их свойствами.
+            Объекты коллизий с их свойствами (CollisionObjects
+            с пространственной сеткой для быстрых запросов).
         """
-        collision_objects = []
-        collision_layer = tmx_map.get_layer_by_name(
-            config.COLLISION_SETTINGS["COLLISION_LAYER_NAME"]
-        )
-
-        if collision_layer:
-            for obj in collision_layer:
-                if obj.properties.get("collision",
-                                      config.COLLISION_SETTINGS["DEFAULT_COLLISION"]):
-                    collision_rect = pygame.Rect(
-                        int(obj.x),
-                        int(obj.y),
-                        int(obj.width),
-                        int(obj.height)
-                    )
-                    properties = {
-                        'rect': collision_rect,
-                        'type': obj.properties.get("type", "solid"),
-                        'properties': dict(obj.properties)
-                    }
-                    collision_objects.append(properties)
+        if map_objects is None:
+            map_objects = MapObjectRegistry(tmx_map)
+        collision_objects = CollisionObjects()
+
+        for obj in map_objects.find(layer=config.COLLISION_SETTINGS["COLLISION_LAYER_NAME"]):
+            if obj.properties.get("collision",
+                                  config.COLLISION_SETTINGS["DEFAULT_COLLISION"]):
+                collision_rect = pygame.Rect(
+                    int(obj.x),
+                    int(obj.y),
+                    int(obj.width),
+                    int(obj.height)
+                )
+                properties = {
+                    'rect': collision_rect,
+                    'type': obj.properties.get("type", "solid"),
+                    'properties': dict(obj.properties)
+                }
+                collision_objects.add(properties)
 
         return collision_objects
 
@@ -68,6 +121,9 @@ class CollisionHandler:
             Объект коллизии или None, если коллизии нет.
         """
         buffered_rect = rect.inflate(-self.collision_buffer, -self.collision_buffer)
+        # Для CollisionObjects проверяем только соседей по сетке
+        if isinstance(collision_objects, CollisionObjects):
+            collision_objects = collision_objects.query(buffered_rect)
         for obj in collision_objects:
             if buffered_rect.colliderect(obj['rect']):
                 return obj
@@ -152,3 +208,124 @@ class CollisionHandler:
                         final_y = test_rect.y
 
         return final_x, final_y
+
+    def resolve_movement(self, hitbox: pygame.Rect, dx: float, dy: float,
+                         collision_objects: list,
+                         origin: tuple[float, float] | None = None) -> tuple[float, float]:
+        """
+        Перемещает хитбокс со скольжением вдоль стен (swept AABB).
+
+        Вместо проверки конечных позиций ищется момент первого касания
+        на всём пути движения, поэтому быстрый объект не проскакивает
+        через тонкие стены. После касания заблокированная ось обнуляется,
+        а остаток пути проходится по второй оси (скольжение).
+
+        Объекты, с которыми хитбокс уже пересекается в начале хода,
+        игнорируются, чтобы игрок мог из них выйти.
+
+        Args:
+            hitbox: Хитбокс в начальной позиции (не изменяется).
+            dx: Смещение по X за ход.
+            dy: Смещение по Y за ход.
+            collision_objects: Объекты коллизий (список или CollisionObjects).
+            origin: Точная (дробная) позиция хитбокса, если она отличается
+                от целочисленной hitbox.topleft.
+
+        Returns:
+            Кортеж (final_x, final_y) с финальными координатами хитбокса.
+        """
+        if origin is None:
+            origin = (hitbox.x, hitbox.y)
+        # Тот же буфер, что и в check_collision (rect.inflate(-b, -b))
+        buffer = self.collision_buffer
+        x = float(origin[0] + buffer // 2)
+        y = float(origin[1] + buffer // 2)
+        width = hitbox.width - buffer
+        height = hitbox.height - buffer
+        start_x = x
+        start_y = y
+
+        indexed = isinstance(collision_objects, CollisionObjects)
+        # Не больше двух касаний: после каждого одна из осей обнуляется
+        for _ in range(2):
+            if not dx and not dy:
+                break
+
+            candidates = collision_objects
+            if indexed:
+                left = math.floor(min(x, x + dx))
+                top = math.floor(min(y, y + dy))
+                candidates = collision_objects.query((
+                    left, top,
+                    math.ceil(max(x, x + dx)) + width - left,
+                    math.ceil(max(y, y + dy)) + height - top
+                ))
+
+            hit_time = 1.0
+            hit_axis_x = False
+            for obj in candidates:
+                rect = obj['rect']
+                ox = rect.x
+                oy = rect.y
+                ow = rect.width
+                oh = rect.height
+                if ow <= 0 or oh <= 0:
+                    continue
+
+                # Уже пересекаемся в начальной позиции хода - пропускаем
+                if (start_x < ox + ow and start_x + width > ox
+                        and start_y < oy + oh and start_y + height > oy):
+                    continue
+
+                if dx > 0:
+                    entry_x = (ox - (x + width)) / dx
+                    exit_x = (ox + ow - x) / dx
+                elif dx < 0:
+                    entry_x = (ox + ow - x) / dx
+                    exit_x = (ox - (x + width)) / dx
+                elif x < ox + ow and x + width > ox:
+                    entry_x = -math.inf
+                    exit_x = math.inf
+                else:
+                    continue
+
+                if dy > 0:
+                    entry_y = (oy - (y + height)) / dy
+                    exit_y = (oy + oh - y) / dy
+                elif dy < 0:
+                    entry_y = (oy + oh - y) / dy
+                    exit_y = (oy - (y + height)) / dy
+                elif y < oy + oh and y + height > oy:
+                    entry_y = -math.inf
+                    exit_y = math.inf
+                else:
+                    continue
+
+                entry = entry_x if entry_x > entry_y else entry_y
+                # Небольшой допуск на погрешность вычислений при касании
+                if entry < -1e-9 or entry >= hit_time or entry >= min(exit_x, exit_y):
+                    continue
+
+                hit_time = entry if entry > 0.0 else 0.0
+                # При одновременном касании блокируем Y, как раньше
+                # сохранялось движение по X при скольжении
+                hit_axis_x = entry_x > entry_y
+
+            if hit_time >= 1.0:
+                x += dx
+                y += dy
+                break
+
+            # Двигаемся до касания; по оси удара встаём ровно на границу
+            if hit_axis_x:
+                x = float(round(x + dx * hit_time))
+                y += dy * hit_time
+                dx = 0.0
+                dy *= 1.0 - hit_time
+            else:
+                x += dx * hit_time
+                y = float(round(y + dy * hit_time))
+                dx *= 1.0 - hit_time
+                dy = 0.0
+
+        return x - buffer // 2, y - buffer // 2
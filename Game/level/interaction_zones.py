@@ -0,0 +1,134 @@
+"""
+Модуль зон взаимодействия.
+
+Содержит перечисление InteractionType (разобранное свойство
+interactive_type объекта карты) и класс InteractionZones - зоны, в которых
+появляется кнопка взаимодействия (NPC, двери, сундуки), с уже увеличенными
+прямоугольниками в пространственной сетке. Зоны строятся один раз при
+загрузке карты, а в кадре проверяются только зоны рядом с хитбоксом игрока.
+"""
+
+from enum import Enum
+
+import pygame
+from core.config import config
+from level.spatial_grid import SpatialGrid
+
+
+class InteractionType(Enum):
+    """Тип интерактивного объекта карты."""
+
+    GUARD = "guard"
+    KING = "king"
+    DOORS = "doors"
+    CHEST = "chest"
+    OTHER = "other"
+
+    @classmethod
+    def parse(cls, value) -> "InteractionType":
+        """
+        Разбирает свойство interactive_type.
+
+        Args:
+            value: Значение свойства ('the guard', 'royal_guard', 'King', ...).
+
+        Returns:
+            Тип объекта; OTHER для неизвестных значений.
+        """
+        return _TYPE_NAMES.get(str(value or '').lower(), cls.OTHER)
+
+
+# Значения interactive_type (в нижнем регистре) -> тип
+_TYPE_NAMES = {
+    'the guard': InteractionType.GUARD,
+    'royal_guard': InteractionType.GUARD,
+    'king': InteractionType.KING,
+    'doors': InteractionType.DOORS,
+    'chest': InteractionType.CHEST,
+}
+
+
+class InteractionZone:
+    """Зона взаимодействия одного объекта карты."""
+
+    __slots__ = ("obj", "rect", "type")
+
+    def __init__(self, obj, rect: pygame.Rect, interaction_type: InteractionType):
+        """
+        Инициализация зоны.
+
+        Args:
+            obj: Объект карты (pytmx).
+            rect: Увеличенный прямоугольник зоны в мировых координатах.
+            interaction_type: Разобранный interactive_type.
+        """
+        self.obj = obj
+        self.rect = rect
+        self.type = interaction_type
+
+
+class InteractionZones:
+    """
+    Зоны взаимодействия с пространственной сеткой.
+
+    Хранятся только объекты, у которых есть кнопка взаимодействия
+    (тип не OTHER), в исходном порядке объектов карты. Зоны добавляются
+    только через add(), поэтому сетка всегда совпадает с набором.
+    """
+
+    def __init__(self, objects=(), cell_size: int | None = None):
+        """
+        Инициализация зон.
+
+        Args:
+            objects: Интерактивные объекты карты.
+            cell_size: Размер ячейки сетки в пикселях.
+        """
+        settings = config.INTERACTION_ZONES
+        if cell_size is None:
+            cell_size = settings.get("GRID_CELL_SIZE", 128)
+        self.inflate = settings.get("INFLATE", 10)
+        self._zones = []
+        self.grid = SpatialGrid(cell_size)
+        for obj in objects:
+            self.add(obj)
+
+    def __iter__(self):
+        return iter(self._zones)
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def add(self, obj) -> InteractionZone | None:
+        """
+        Добавляет зону для объекта карты.
+
+        Args:
+            obj: Интерактивный объект карты.
+
+        Returns:
+            Зона или None, если у объекта нет кнопки взаимодействия.
+        """
+        interaction_type = InteractionType.parse(obj.properties.get('interactive_type', ''))
+        if interaction_type is InteractionType.OTHER:
+            return None
+        rect = pygame.Rect(int(obj.x), int(obj.y), int(obj.width), int(obj.height))
+        zone = InteractionZone(obj, rect.inflate(self.inflate, self.inflate), interaction_type)
+        self._zones.append(zone)
+        self.grid.insert(zone, zone.rect)
+        return zone
+
+    def find(self, rect: pygame.Rect) -> InteractionZone | None:
+        """
+        Первая зона (в порядке объектов карты), пересекающаяся с областью.
+
+        Args:
+            rect: Область в мировых координатах (хитбокс игрока).
+
+        Returns:
+            Зона или None.
+        """
+        for zone in self.grid.query(rect):
+            if rect.colliderect(zone.rect):
+                return zone
+        return None
@@ -2,6 +2,7 @@ import pytmx
 import pygame
 from level.level_renderer import LevelRenderer
 from level.collisions import CollisionHandler
+from level.map_objects import MapObjectRegistry
 from level.player import Player
 from level.camera import Camera
 from core.config import config
@@ -12,19 +13,20 @@ class LevelManager:
         self.tmx_data = pytmx.util_pygame.load_pygame(level_path)
         self.width = self.tmx_data.width * self.tmx_data.tilewidth
         self.height = self.tmx_data.height * self.tmx_data.tileheight
+        self.map_objects = MapObjectRegistry(self.tmx_data)
         self.collision_handler = CollisionHandler()
-        self.collision_objects = self.collision_handler.load_collision_objects(self.tmx_data)
+        self.collision_objects = self.collision_handler.load_collision_objects(self.tmx_data, self.map_objects)
         self.player = self._init_player()
         self.camera = Camera(self.width, self.height)
         self.renderer = LevelRenderer(self.tmx_data, self.camera)
 
     def _init_player(self):
         # Поиск стартовой позиции игрока в объектном слое
-        for layer in self.tmx_data.layers:
-            if hasattr(layer, "name") and layer.name == config.PLAYER_SETTINGS["PLAYER_LAYER_NAME"]:
-                for obj in layer:
-                    if obj.name == config.PLAYER_SETTINGS["PLAYER_OBJECT_NAME"]:
-                        return Player(int(obj.x), int(obj.y))
+        spawn = self.map_objects.first(self.map_objects.find(
+            layer=config.PLAYER_SETTINGS["PLAYER_LAYER_NAME"],
+            name=config.PLAYER_SETTINGS["PLAYER_OBJECT_NAME"]))
+        if spawn is not None:
+            return Player(int(spawn.x), int(spawn.y))
         # Если не найдено, ставим по центру
         return Player(self.width // 2, self.height // 2)
 
@@ -1,17 +1,64 @@
+import time
+from collections import OrderedDict
+
 import pygame
 import pytmx
 from core.config import config
 
+# Размер чанка в тайлах
+CHUNK_SIZE = 32
+
+
+def bucket_tiles_by_chunk(tmx_data, chunk_size=CHUNK_SIZE):
+    """Раскладывает тайлы всех слоёв по чанкам за один проход.
+
+    Не трогает pygame, поэтому может выполняться в фоновом потоке
+    (core/level_preloader.py). Порядок слоёв внутри каждого чанка
+    сохраняется, поэтому результат отрисовки совпадает с послойным обходом.
+
+    Returns:
+        dict: {(chunk_x, chunk_y): [(x_offset, y_offset, image), ...]}
+    """
+    buckets = {}
+    tile_w = tmx_data.tilewidth
+    tile_h = tmx_data.tileheight
+
+    for layer in tmx_data.layers:
+        if isinstance(layer, pytmx.TiledTileLayer):
+            for x, y, image in layer.tiles():
+                key = (x // chunk_size, y // chunk_size)
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = buckets[key] = []
+                bucket.append(((x % chunk_size) * tile_w, (y % chunk_size) * tile_h, image))
+
+    return buckets
+
+
+def tileset_paths(tmx_data):
+    """Пути к файлам тайлсетов, которые используются на карте."""
+    return sorted({image[0] for image in tmx_data.images if image})
+
 
 class LevelRenderer:
-    def __init__(self, tmx_data, camera):
+    def __init__(self, tmx_data, camera, tileset_images=None, chunk_tiles=None):
+        """
+        Args:
+            tmx_data: Разобранная карта (pytmx без загрузчика изображений)
+            camera: Камера; может быть подключена позже через attach_camera
+            tileset_images: Уже загруженные и сконвертированные тайлсеты
+                {путь: поверхность} (из фоновой предзагрузки)
+            chunk_tiles: Готовая раскладка тайлов по чанкам (bucket_tiles_by_chunk)
+        """
         self.tmx_data = tmx_data
         self.camera = camera
-        self.tileset_images = {}
-        self.chunk_size = 32
+        self.tileset_images = dict(tileset_images or {})
+        self.chunk_size = CHUNK_SIZE
         self.chunk_width = self.chunk_size * self.tmx_data.tilewidth
         self.chunk_height = self.chunk_size * self.tmx_data.tileheight
-        self.chunks_info = {}
+        self.chunks_info = OrderedDict()  # (chunk_x, chunk_y) -> поверхность, в порядке LRU
+        self._tile_surface_cache = {}  # image -> готовая поверхность тайла (None, если тайлсет не найден)
+        self._scaled_chunks = {}  # (chunk_x, chunk_y) -> (масштаб, поверхность) для вывода в разрешении экрана
         self.overlap_layers = []  # Слои, которые рисуются поверх игрока
 
         # Находим слои с overlap_player = True
@@ -19,110 +66,348 @@ class LevelRenderer:
             if hasattr(layer, "properties") and layer.properties.get("overlap_player", False):
                 self.overlap_layers.append(layer)
 
-        self._create_all_chunks()
+        # Потоковый режим: чанки запекаются по мере приближения камеры
+        streaming = config.LEVEL_STREAMING
+        self.streaming = streaming.get("ENABLED", False)
+        self.budget_bytes = streaming.get("BUDGET_BYTES", 64 * 1024 * 1024)
+        self.prefetch_ring = streaming.get("PREFETCH_RING", 1)
+        self.prefetch_per_frame = streaming.get("PREFETCH_PER_FRAME", 1)
+        self.resident_bytes = 0
+        self._last_camera = None
+        self._partial_chunk = None  # [ключ, поверхность, следующий тайл, время] для bake_step
+        self.stats = {
+            "hits": 0,  # Видимый чанк уже был в памяти
+            "misses": 0,  # Видимый чанк пришлось запекать в кадре отрисовки
+            "prefetched": 0,  # Чанки, запечённые заранее по направлению движения
+            "evictions": 0,
+            "bake_count": 0,
+            "bake_time": 0.0  # Суммарное время запекания, сек
+        }
+
+        if chunk_tiles is None:
+            chunk_tiles = bucket_tiles_by_chunk(self.tmx_data, self.chunk_size)
+        self._chunk_tiles = chunk_tiles
+        self._overlap_index = self._build_overlap_index()
+        if not self.streaming:
+            self._create_all_chunks()
 
     def _get_chunk_coords(self, tile_x, tile_y):
         return tile_x // self.chunk_size, tile_y // self.chunk_size
 
-    def _create_chunk(self, chunk_x, chunk_y):
+    def _create_chunk(self, chunk_x, chunk_y, tiles):
+        """Собирает поверхность одного чанка из заранее отобранных тайлов.
+
+        Args:
+            chunk_x: Координата чанка по X (в чанках)
+            chunk_y: Координата чанка по Y (в чанках)
+            tiles: Список (x_offset, y_offset, image) в порядке слоёв
+
+        Returns:
+            pygame.Surface: Запечённый чанк
+        """
+        start = time.perf_counter()
         chunk = pygame.Surface((self.chunk_width, self.chunk_height), pygame.SRCALPHA)
-        x_1 = chunk_x * self.chunk_size
-        y_1 = chunk_y * self.chunk_size
-        x_2 = (chunk_x + 1) * self.chunk_size
-        y_2 = (chunk_y + 1) * self.chunk_size
+        self._blit_tiles(chunk, tiles)
+        self._store_chunk((chunk_x, chunk_y), chunk, time.perf_counter() - start)
+        return chunk
 
-        for layer in self.tmx_data.layers:
+    def _blit_tiles(self, chunk, tiles):
+        for x_offset, y_offset, image in tiles:
+            tile_surface = self._get_cached_tile_surface(image)
+            if tile_surface is not None:
+                chunk.blit(tile_surface, (x_offset, y_offset))
+
+    def _store_chunk(self, key, chunk, bake_time):
+        self.chunks_info[key] = chunk
+        self.resident_bytes += chunk.get_pitch() * chunk.get_height()
+        self.stats["bake_count"] += 1
+        self.stats["bake_time"] += bake_time
+
+    def _build_overlap_index(self):
+        """Строит индекс тайлов overlap_player по клеткам карты.
+
+        Поверхности тайлов (с отражениями и поворотами) готовятся здесь же,
+        поэтому в кадре остаётся только поиск клетки под игроком.
+
+        Returns:
+            dict: {(tile_x, tile_y): [поверхность, ...]} в порядке слоёв
+        """
+        index = {}
+        for layer in self.overlap_layers:
             if isinstance(layer, pytmx.TiledTileLayer):
                 for x, y, image in layer.tiles():
-                    if x_1 <= x < x_2 and y_1 <= y < y_2:
-                        x_offset = (x - x_1) * self.tmx_data.tilewidth
-                        y_offset = (y - y_1) * self.tmx_data.tileheight
-                        tileset_path, rect, flags = image
-
-                        if tileset_path not in self.tileset_images:
-                            try:
-                                self.tileset_images[tileset_path] = pygame.image.load(tileset_path).convert_alpha()
-                            except FileNotFoundError:
-                                if config.DEBUG_MODE:
-                                    print(f"Ошибка: Не удалось найти файл тайлсета '{tileset_path}'")
-                                continue
-
-                        tileset_image = self.tileset_images[tileset_path]
-                        tile_surface = tileset_image.subsurface(rect)
-
-                        # Правильная обработка трансформаций (как в Tiled)
-                        if flags.flipped_diagonally:
-                            tile_surface = pygame.transform.rotate(tile_surface, -90)
-                            if flags.flipped_horizontally or flags.flipped_vertically:
-                                tile_surface = pygame.transform.flip(tile_surface, flags.flipped_horizontally,
-                                                                     flags.flipped_vertically)
-                        else:
-                            if flags.flipped_horizontally or flags.flipped_vertically:
-                                tile_surface = pygame.transform.flip(tile_surface, flags.flipped_horizontally,
-                                                                     flags.flipped_vertically)
-
-                        chunk.blit(tile_surface, (x_offset, y_offset))
-
-        self.chunks_info[(chunk_x, chunk_y)] = chunk
+                    tile_surface = self._get_cached_tile_surface(image)
+                    if tile_surface is not None:
+                        index.setdefault((x, y), []).append(tile_surface)
+        return index
 
     def _create_all_chunks(self):
-        for layer in self.tmx_data.layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                for x, y, image in layer.tiles():
-                    chunk_x, chunk_y = self._get_chunk_coords(x, y)
-                    if (chunk_x, chunk_y) not in self.chunks_info:
-                        self._create_chunk(chunk_x, chunk_y)
+        for (chunk_x, chunk_y), tiles in self._chunk_tiles.items():
+            self._create_chunk(chunk_x, chunk_y, tiles)
+
+    def _visible_chunk_range(self, camera_x, camera_y):
+        """Диапазон видимых чанков (включительно) для смещения камеры."""
+        return (int(camera_x // self.chunk_width),
+                int(camera_y // self.chunk_height),
+                int((camera_x + config.VIRTUAL_WIDTH) // self.chunk_width),
+                int((camera_y + config.VIRTUAL_HEIGHT) // self.chunk_height))
+
+    def _get_chunk(self, key):
+        """Возвращает видимый чанк, при необходимости запекая его.
+
+        Args:
+            key: Координаты чанка (chunk_x, chunk_y)
+
+        Returns:
+            pygame.Surface или None, если в чанке нет тайлов
+        """
+        chunk = self.chunks_info.get(key)
+        if chunk is not None:
+            if self.streaming:
+                self.chunks_info.move_to_end(key)
+                self.stats["hits"] += 1
+            return chunk
+
+        tiles = self._chunk_tiles.get(key)
+        if tiles is None:
+            return None
+        self.stats["misses"] += 1
+        return self._create_chunk(key[0], key[1], tiles)
+
+    def _prefetch(self, visible_range, camera_x, camera_y):
+        """Запекает кольцо чанков по направлению движения камеры."""
+        if self._last_camera is None or self.prefetch_ring <= 0:
+            self._last_camera = (camera_x, camera_y)
+            return
+        dx = camera_x - self._last_camera[0]
+        dy = camera_y - self._last_camera[1]
+        self._last_camera = (camera_x, camera_y)
+        if not dx and not dy:
+            return
+
+        min_x, min_y, max_x, max_y = visible_range
+        ring = self.prefetch_ring
+        if dx > 0:
+            max_x += ring
+        elif dx < 0:
+            min_x -= ring
+        if dy > 0:
+            max_y += ring
+        elif dy < 0:
+            min_y -= ring
+
+        budget = self.prefetch_per_frame
+        for chunk_x in range(min_x, max_x + 1):
+            for chunk_y in range(min_y, max_y + 1):
+                key = (chunk_x, chunk_y)
+                if key in self.chunks_info or key not in self._chunk_tiles:
+                    continue
+                if budget <= 0:
+                    return
+                self._create_chunk(chunk_x, chunk_y, self._chunk_tiles[key])
+                self.stats["prefetched"] += 1
+                budget -= 1
+
+    def _evict(self, visible_range):
+        """Выгружает самые давно использованные чанки сверх бюджета памяти.
+
+        Видимые чанки не выгружаются, даже если бюджет превышен.
+        """
+        if self.resident_bytes <= self.budget_bytes:
+            return
+        min_x, min_y, max_x, max_y = visible_range
+        for key in list(self.chunks_info):
+            if self.resident_bytes <= self.budget_bytes:
+                break
+            if min_x <= key[0] <= max_x and min_y <= key[1] <= max_y:
+                continue
+            chunk = self.chunks_info.pop(key)
+            self.resident_bytes -= chunk.get_pitch() * chunk.get_height()
+            scaled = self._scaled_chunks.pop(key, None)
+            if scaled:
+                self.resident_bytes -= scaled[1].get_pitch() * scaled[1].get_height()
+            self.stats["evictions"] += 1
+
+    def _get_scaled_chunk(self, key, scale):
+        """Возвращает чанк, заранее увеличенный в scale раз (для вывода
+        сразу в разрешении экрана, без масштабирования всего кадра)."""
+        chunk = self._get_chunk(key)
+        if chunk is None or scale == 1:
+            return chunk
+
+        cached = self._scaled_chunks.get(key)
+        if cached and cached[0] == scale:
+            return cached[1]
+        if cached:
+            self.resident_bytes -= cached[1].get_pitch() * cached[1].get_height()
+
+        start = time.perf_counter()
+        scaled = pygame.transform.scale(
+            chunk, (round(self.chunk_width * scale), round(self.chunk_height * scale)))
+        self._scaled_chunks[key] = (scale, scaled)
+        self.resident_bytes += scaled.get_pitch() * scaled.get_height()
+        self.stats["bake_time"] += time.perf_counter() - start
+        return scaled
 
-    def render(self, surface, player_pos=None):
+    def warm_up(self):
+        """Запекает видимые чанки заранее (вызывается при загрузке карты),
+        чтобы первый кадр не тратил время на запекание."""
+        if not self.streaming:
+            return
+        for key in self._visible_keys(self.camera.offset.x, self.camera.offset.y):
+            if key not in self.chunks_info:
+                self._create_chunk(key[0], key[1], self._chunk_tiles[key])
+
+    def bake_step(self, camera_x, camera_y, tile_limit):
+        """Запекает чанки, видимые при заданном смещении камеры, по частям.
+
+        За вызов выполняется одно действие: создание поверхности чанка
+        или отрисовка в неё не больше tile_limit тайлов (в порядке слоёв).
+        Недопечённый чанк в chunks_info не попадает; если его успел
+        запечь кадр отрисовки, частичный отбрасывается.
+
+        Args:
+            camera_x: Смещение камеры по X
+            camera_y: Смещение камеры по Y
+            tile_limit: Не больше стольких тайлов за вызов
+
+        Returns:
+            bool: True, если все видимые чанки запечены
+        """
+        if not self.streaming:
+            return True
+        start = time.perf_counter()
+        partial = self._partial_chunk
+        if partial is not None and partial[0] in self.chunks_info:
+            partial = self._partial_chunk = None
+
+        if partial is None:
+            for key in self._visible_keys(camera_x, camera_y):
+                if key not in self.chunks_info:
+                    break
+            else:
+                return True
+            chunk = pygame.Surface((self.chunk_width, self.chunk_height), pygame.SRCALPHA)
+            self._partial_chunk = [key, chunk, 0, time.perf_counter() - start]
+            return False
+
+        key, chunk, index, bake_time = partial
+        tiles = self._chunk_tiles[key]
+        end = min(len(tiles), index + tile_limit)
+        self._blit_tiles(chunk, tiles[index:end])
+        bake_time += time.perf_counter() - start
+        if end < len(tiles):
+            partial[2:] = [end, bake_time]
+        else:
+            self._partial_chunk = None
+            self._store_chunk(key, chunk, bake_time)
+        return False
+
+    def _visible_keys(self, camera_x, camera_y):
+        """Координаты непустых чанков, видимых при заданном смещении камеры."""
+        min_x, min_y, max_x, max_y = self._visible_chunk_range(camera_x, camera_y)
+        return [(chunk_x, chunk_y)
+                for chunk_x in range(min_x, max_x + 1)
+                for chunk_y in range(min_y, max_y + 1)
+                if (chunk_x, chunk_y) in self._chunk_tiles]
+
+    def attach_camera(self, camera):
+        """Подключает камеру (рендерер карты из кеша уровней переживает смену камеры).
+
+        Направление для предзагрузки считается заново с первого кадра.
+        """
+        self.camera = camera
+        self._last_camera = None
+
+    def memory_bytes(self):
+        """Память запечённых чанков (с увеличенными копиями) и тайлсетов, в байтах."""
+        return self.resident_bytes + sum(image.get_pitch() * image.get_height()
+                                         for image in self.tileset_images.values())
+
+    def get_stats(self):
+        """Статистика потоковой подгрузки для подбора бюджета памяти.
+
+        Returns:
+            dict: Счётчики попаданий/промахов, время запекания и занятая память
+        """
+        stats = dict(self.stats)
+        stats["resident_chunks"] = len(self.chunks_info)
+        stats["total_chunks"] = len(self._chunk_tiles)
+        stats["resident_bytes"] = self.resident_bytes
+        stats["budget_bytes"] = self.budget_bytes
+        return stats
+
+    def render(self, surface, player_pos=None, scale=1):
+        """Рисует видимые чанки.
+
+        Args:
+            surface: Поверхность для отрисовки
+            player_pos: Позиция игрока для тайлов overlap_player
+            scale: Масштаб вывода (>1 - чанки рисуются сразу в разрешении
+                экрана; player_pos в этом режиме не поддерживается)
+        """
         camera_x = self.camera.offset.x
         camera_y = self.camera.offset.y
 
+        visible_range = self._visible_chunk_range(camera_x, camera_y)
+        min_x, min_y, max_x, max_y = visible_range
+
         # Отрисовка обычных слоёв (под игроком)
-        for chunk_x in range(int(camera_x // self.chunk_width),
-                             int((camera_x + config.VIRTUAL_WIDTH) // self.chunk_width) + 1):
-            for chunk_y in range(int(camera_y // self.chunk_height),
-                                 int((camera_y + config.VIRTUAL_HEIGHT) // self.chunk_height) + 1):
-                if (chunk_x, chunk_y) in self.chunks_info:
-                    chunk = self.chunks_info[(chunk_x, chunk_y)]
+        for chunk_x in range(min_x, max_x + 1):
+            for chunk_y in range(min_y, max_y + 1):
+                chunk = self._get_scaled_chunk((chunk_x, chunk_y), scale)
+                if chunk is not None:
                     chunk_screen_x = chunk_x * self.chunk_width - camera_x
                     chunk_screen_y = chunk_y * self.chunk_height - camera_y
-                    surface.blit(chunk, (chunk_screen_x, chunk_screen_y))
+                    surface.blit(chunk, (round(chunk_screen_x * scale), round(chunk_screen_y * scale)))
+
+        if self.streaming:
+            self._prefetch(visible_range, camera_x, camera_y)
+            self._evict(visible_range)
 
         # Отрисовка слоёв overlap_player (если игрок зашёл за них)
-        if player_pos:
-            for layer in self.overlap_layers:
-                if isinstance(layer, pytmx.TiledTileLayer):
-                    for x, y, image in layer.tiles():
-                        tile_rect = pygame.Rect(x * self.tmx_data.tilewidth, y * self.tmx_data.tileheight,
-                                                self.tmx_data.tilewidth, self.tmx_data.tileheight)
-                        if tile_rect.collidepoint(player_pos):
-                            # Отрисовка тайла поверх игрока
-                            tile_surface = self._get_tile_surface(image)
-                            surface.blit(tile_surface, (tile_rect.x - camera_x, tile_rect.y - camera_y))
+        if player_pos and scale == 1:
+            self.render_overlap_tiles(surface, player_pos)
 
     def render_overlap_tiles(self, surface, player_pos):
-        camera_x = self.camera.offset.x
-        camera_y = self.camera.offset.y
+        tile_w = self.tmx_data.tilewidth
+        tile_h = self.tmx_data.tileheight
+        tile_x = int(player_pos[0] // tile_w)
+        tile_y = int(player_pos[1] // tile_h)
 
-        for layer in self.overlap_layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                for x, y, image in layer.tiles():
-                    tile_rect = pygame.Rect(
-                        x * self.tmx_data.tilewidth,
-                        y * self.tmx_data.tileheight,
-                        self.tmx_data.tilewidth,
-                        self.tmx_data.tileheight
-                    )
-                    if tile_rect.collidepoint(player_pos):
-                        try:
-                            tile_surface = self._get_tile_surface(image)
-                            surface.blit(
-                                tile_surface,
-                                (tile_rect.x - camera_x, tile_rect.y - camera_y)
-                            )
-                        except Exception as e:
-                            if config.DEBUG_MODE:
-                                print(f"Ошибка при отрисовке тайла: {e}")
+        tiles = self._overlap_index.get((tile_x, tile_y))
+        if not tiles:
+            return
+
+        screen_x = tile_x * tile_w - self.camera.offset.x
+        screen_y = tile_y * tile_h - self.camera.offset.y
+        for tile_surface in tiles:
+            surface.blit(tile_surface, (screen_x, screen_y))
+
+    def _get_cached_tile_surface(self, image):
+        """Возвращает поверхность тайла с уже применёнными трансформациями.
+
+        Одинаковые тайлы встречаются на карте сотни раз, поэтому
+        subsurface и повороты выполняются один раз на уникальный тайл.
+        """
+        try:
+            return self._tile_surface_cache[image]
+        except KeyError:
+            pass
+
+        tileset_path = image[0]
+        if tileset_path not in self.tileset_images:
+            try:
+                self.tileset_images[tileset_path] = pygame.image.load(tileset_path).convert_alpha()
+            except FileNotFoundError:
+                if config.DEBUG_MODE:
+                    print(f"Ошибка: Не удалось найти файл тайлсета '{tileset_path}'")
+                self._tile_surface_cache[image] = None
+                return None
+
+        tile_surface = self._get_tile_surface(image)
+        self._tile_surface_cache[image] = tile_surface
+        return tile_surface
 
     def _get_tile_surface(self, image):
         tileset_path, rect, flags = image
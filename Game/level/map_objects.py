@@ -0,0 +1,155 @@
+"""
+Модуль реестра объектов карты.
+
+Содержит класс MapObjectRegistry: объекты всех объектных слоёв TMX
+обходятся один раз при загрузке карты и раскладываются по индексам -
+по имени, по свойству object_type, по interactive_type, по слою и
+в пространственной сетке. Загрузка ресурсов, точки спавна, коллизии
+и двери берут объекты отсюда, а не перебирают слои pytmx заново.
+"""
+
+import pygame
+import pytmx
+from core.config import config
+from level.spatial_grid import SpatialGrid
+
+
+class MapObjectRegistry:
+    """
+    Индексы объектов карты.
+
+    Все выборки возвращают объекты в порядке карты (слой за слоем,
+    объекты в порядке слоя). Списки - общие, их нельзя изменять.
+    """
+
+    def __init__(self, tmx_map=None, cell_size: int | None = None):
+        """
+        Строит индексы за один проход по объектным слоям.
+
+        Args:
+            tmx_map: Разобранная карта (pytmx.TiledMap) или None - пустой реестр.
+            cell_size: Размер ячейки пространственной сетки в пикселях.
+        """
+        if cell_size is None:
+            cell_size = config.COLLISION_SETTINGS.get("GRID_CELL_SIZE", 128)
+        self.objects = []
+        self.interactive = []  # interactive = True
+        self.chests = []  # chest = True (анимация сундука)
+        self.grid = SpatialGrid(cell_size)
+        self._by_name = {}
+        self._by_object_type = {}
+        self._by_interactive_type = {}  # interactive_type в нижнем регистре
+        self._by_layer = {}
+        self._info = {}  # id(объект) -> (порядковый номер, имя слоя, прямоугольник)
+
+        if tmx_map is not None:
+            for layer in tmx_map.layers:
+                if isinstance(layer, pytmx.TiledObjectGroup):
+                    for obj in layer:
+                        self._add(obj, layer.name)
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def _add(self, obj, layer_name: str) -> None:
+        properties = obj.properties
+        rect = pygame.Rect(int(obj.x), int(obj.y), int(obj.width), int(obj.height))
+        self._info[id(obj)] = (len(self.objects), layer_name, rect)
+        self.objects.append(obj)
+        self._by_layer.setdefault(layer_name, []).append(obj)
+        if obj.name:
+            self._by_name.setdefault(obj.name, []).append(obj)
+        object_type = properties.get('object_type')
+        if object_type:
+            self._by_object_type.setdefault(object_type, []).append(obj)
+        interactive_type = str(properties.get('interactive_type', '')).lower()
+        if interactive_type:
+            self._by_interactive_type.setdefault(interactive_type, []).append(obj)
+        if properties.get('interactive', False):
+            self.interactive.append(obj)
+        if properties.get('chest', False):
+            self.chests.append(obj)
+        # Точечные объекты (спавны) тоже попадают в сетку - как прямоугольник 1x1
+        self.grid.insert(obj, pygame.Rect(rect.x, rect.y, max(1, rect.width), max(1, rect.height)))
+
+    def find(self, name: str | None = None, object_type: str | None = None,
+             interactive_type: str | None = None, layer: str | None = None) -> list:
+        """
+        Объекты, подходящие под все заданные условия.
+
+        Args:
+            name: Имя объекта.
+            object_type: Свойство object_type.
+            interactive_type: Свойство interactive_type (без учёта регистра).
+            layer: Имя слоя.
+
+        Returns:
+            Список объектов в порядке карты (все объекты, если условий нет).
+        """
+        if interactive_type is not None:
+            interactive_type = interactive_type.lower()
+        buckets = []
+        for value, index in ((name, self._by_name), (object_type, self._by_object_type),
+                             (interactive_type, self._by_interactive_type), (layer, self._by_layer)):
+            if value is not None:
+                bucket = index.get(value)
+                if not bucket:
+                    return []
+                buckets.append(bucket)
+        if not buckets:
+            return list(self.objects)
+
+        # Перебираем самую короткую выборку, остальные условия проверяем на месте
+        candidates = min(buckets, key=len)
+        if len(buckets) == 1:
+            return list(candidates)
+        info = self._info
+        return [obj for obj in candidates
+                if (name is None or obj.name == name) and
+                (object_type is None or obj.properties.get('object_type') == object_type) and
+                (interactive_type is None or
+                 str(obj.properties.get('interactive_type', '')).lower() == interactive_type) and
+                (layer is None or info[id(obj)][1] == layer)]
+
+    def first(self, *groups):
+        """
+        Первый в порядке карты объект из одной или нескольких выборок.
+
+        Args:
+            groups: Списки объектов (например, результаты find).
+
+        Returns:
+            Объект или None, если выборки пусты.
+        """
+        info = self._info
+        return min((obj for group in groups for obj in group),
+                   key=lambda obj: info[id(obj)][0], default=None)
+
+    def layer_of(self, obj) -> str | None:
+        """Имя слоя, в котором лежит объект."""
+        info = self._info.get(id(obj))
+        return info[1] if info else None
+
+    def rect_of(self, obj) -> pygame.Rect | None:
+        """Прямоугольник объекта в мировых координатах (общий - не изменять)."""
+        info = self._info.get(id(obj))
+        return info[2] if info else None
+
+    def query(self, rect) -> list:
+        """
+        Объекты, пересекающиеся с областью.
+
+        Args:
+            rect: Область в мировых координатах (pygame.Rect).
+
+        Returns:
+            Список объектов в порядке карты; точечные объекты
+            учитываются как прямоугольник 1x1.
+        """
+        info = self._info
+        found = []
+        for obj in self.grid.query(rect):
+            obj_rect = info[id(obj)][2]
+            if rect.colliderect((obj_rect.x, obj_rect.y, max(1, obj_rect.width), max(1, obj_rect.height))):
+                found.append(obj)
+        return found
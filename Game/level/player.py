@@ -11,16 +11,18 @@
 
 from __future__ import annotations
 
+import os
 from typing import Optional, List, Tuple, Dict
 
 import pygame
 
 from core.config import config
 from level.player_stats import PlayerStats
-from level.spritesheet import SpriteSheet
+from level.animation_atlas import animation_atlas
 from level.player_movement import PlayerMovementHandler
 from core.combat_system import CombatSystem
 from core.pathutils import resource_path
+from core.text_cache import text_cache
 
 
 class Player(pygame.sprite.Sprite):
@@ -122,7 +124,6 @@ class Player(pygame.sprite.Sprite):
 
         # Индикаторы урона / лечения
         self._indicators: List[Dict[str, object]] = []
-        self._indicator_font = pygame.font.Font(None, 24)
 
     # ------------------------------------------------------------------
     # Инициализация анимаций
@@ -150,12 +151,10 @@ class Player(pygame.sprite.Sprite):
             frames_xy: List[Tuple[int, int]] = params["frames"]  # type: ignore[assignment]
             anim_speed: float = float(params.get("animation_speed", 0.15))
 
-            # Используем resource_path для корректной работы с путями
+            # Используем resource_path для корректной работы с путями.
+            # Кадры общие (атлас): повторная загрузка - только поиск в словаре
             full_sheet_path = resource_path(sheet_path)
-            sheet = SpriteSheet(full_sheet_path, width=frame_w, height=frame_h)
-            frames: List[pygame.Surface] = []
-            for x, y in frames_xy:
-                frames.append(sheet.get_image(x, y, frame_w, frame_h))
+            frames = animation_atlas.get_frames(full_sheet_path, frames_xy, frame_w, frame_h)
 
             self._animations[state] = {
                 "frames": frames,
@@ -228,8 +227,10 @@ class Player(pygame.sprite.Sprite):
         frame_w, frame_h = config.FRAME_SIZE  # 128x64
         
         try:
-            # Загружаем весь спрайт для определения размеров
-            temp_sheet = pygame.image.load(full_path).convert_alpha()
+            if not os.path.exists(full_path):
+                raise FileNotFoundError(f"Файл не найден: {full_path}")
+            # Спрайт берётся из атласа (загружается с диска один раз)
+            temp_sheet = animation_atlas.get_sheet(full_path, frame_w, frame_h)
             sheet_width = temp_sheet.get_width()
             sheet_height = temp_sheet.get_height()
             
@@ -250,9 +251,8 @@ class Player(pygame.sprite.Sprite):
                 x = col * frame_w
                 y = row * frame_h
                 
-                # Извлекаем кадр напрямую
-                frame = pygame.Surface((frame_w, frame_h), pygame.SRCALPHA)
-                frame.blit(temp_sheet, (0, 0), (x, y, frame_w, frame_h))
+                # Кадр из атласа (общий для всех загрузок)
+                frame = animation_atlas.get_frame(full_path, (x, y, frame_w, frame_h))
                 
                 if frame_idx < 20:
                     # Первые 20 кадров - атака вправо
@@ -425,6 +425,25 @@ class Player(pygame.sprite.Sprite):
         # Сбрасываем базовое состояние анимации
         self.set_state("idle_front")
 
+    def place_at(self, x: int, y: int) -> None:
+        """
+        Переносит игрока в точку (x, y) - позицию ног, как в конструкторе.
+
+        Используется при переходе между картами: игрок (с характеристиками,
+        анимациями и подписчиками) не пересоздаётся, сбрасываются только
+        позиция, движение, атака и индикаторы.
+        """
+        self.rect.midbottom = (x, y)
+        hb_cfg = config.PLAYER_HITBOX
+        self.hitbox.x = self.rect.centerx - self.hitbox.width // 2 + hb_cfg["X_OFFSET"]
+        self.hitbox.y = self.rect.top + hb_cfg["Y_OFFSET"]
+        self._movement_handler.subpixel_x = self._movement_handler.subpixel_y = 0.0
+        self.is_walking = False
+        self._was_walking = False
+        self.is_attacking = False
+        self._indicators.clear()
+        self.set_state("idle_front")
+
     def take_damage(self, amount: float, source: str = "unknown") -> float:
         """
         Наносит урон игроку.
@@ -573,6 +592,16 @@ class Player(pygame.sprite.Sprite):
             ind for ind in self._indicators if float(ind["age"]) < float(ind["lifetime"])
         ]
 
+    def indicator_positions(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Мировые позиции активных индикаторов в целых пикселях (как при отрисовке).
+
+        Returns:
+            Кортеж (x, y) по одному на индикатор (пустой, если их нет).
+        """
+        return tuple((int(ind["pos"][0]), int(ind["pos"][1]))  # type: ignore[index]
+                     for ind in self._indicators)
+
     def draw_indicators(self, surface: pygame.Surface) -> None:
         """
         Отрисовывает индикаторы урона / лечения.
@@ -593,7 +622,7 @@ class Player(pygame.sprite.Sprite):
             pos = ind["pos"]  # type: ignore[assignment]
 
             text = f"{int(value)}" if value > 0 else f"{int(value)}"
-            text_surface = self._indicator_font.render(text, True, color)
+            text_surface = text_cache.render(text, 24, color)
 
             screen_x = pos[0] - offset_x - text_surface.get_width() // 2
             screen_y = pos[1] - offset_y - text_surface.get_height()
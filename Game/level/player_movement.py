@@ -2,6 +2,7 @@ import pygame
 import math
 from level.collisions import CollisionHandler
 from core.config import config
+from core.input_state import input_state
 
 
 class PlayerMovementHandler:
@@ -11,6 +12,10 @@ class PlayerMovementHandler:
         self.collision_buffer = 2
         self.last_state = "idle_front"  # Запоминаем последнее состояние
         self.state_change_time = 0  # Время последнего изменения состояния
+        # Дробная часть позиции, потерянная при записи в целочисленный hitbox.
+        # Без неё скорость зависела бы от длины шага (округление 1.5px -> 2px).
+        self.subpixel_x = 0.0
+        self.subpixel_y = 0.0
 
     def handle_movement(self, dt, level_width, level_height, collision_objects):
         # Гарантированно останавливаем звук шагов при открытом меню/инвентаре
@@ -58,7 +63,7 @@ class PlayerMovementHandler:
             return
         
         pygame.event.pump()  # Обновляем состояние клавиш
-        keys = pygame.key.get_pressed()
+        keys = input_state.get_pressed()
         move_x = keys[pygame.K_d] - keys[pygame.K_a]
         move_y = keys[pygame.K_s] - keys[pygame.K_w]
         # print("move_x:", move_x, "move_y:", move_y)  # Отладка
@@ -70,48 +75,13 @@ class PlayerMovementHandler:
             move_x /= length
             move_y /= length
 
-        # Движение игрока без скольжения и снижения скорости
-        original_x = self.player.hitbox.x
-        original_y = self.player.hitbox.y
-        
-        # Сначала пробуем двигаться по обеим осям
-        new_x, new_y = self.collision_handler.handle_movement_collisions(
-            self.player, original_x + move_x * self.player.speed * dt,
-            original_y + move_y * self.player.speed * dt,
-            collision_objects
-        )
-        
-        # Если движение по обеим осям заблокировано, пробуем по одной оси
-        if abs(new_x - original_x) < 0.1 and abs(new_y - original_y) < 0.1 and move_x != 0 and move_y != 0:
-            # Пробуем только по X
-            temp_x, _ = self.collision_handler.handle_movement_collisions(
-                self.player, original_x + move_x * self.player.speed * dt,
-                original_y,
-                collision_objects
-            )
-            # Пробуем только по Y
-            _, temp_y = self.collision_handler.handle_movement_collisions(
-                self.player, original_x,
-                original_y + move_y * self.player.speed * dt,
-                collision_objects
-            )
-            # Выбираем то, что не заблокировано
-            if abs(temp_x - original_x) >= 0.1:
-                new_x = temp_x
-                new_y = original_y
-            elif abs(temp_y - original_y) >= 0.1:
-                new_x = original_x
-                new_y = temp_y
-        
-        # Ограничение по границам уровня
-        new_x = max(0, min(new_x, level_width - self.player.hitbox.width))
-        new_y = max(0, min(new_y, level_height - self.player.hitbox.height))
-        
+        new_x, new_y = self.resolve_position(move_x, move_y, dt, level_width, level_height,
+                                             collision_objects)
+
         # Двигаем только хитбокс. Привязка спрайта к хитбоксу
         # происходит в Player.update (через rect.midbottom),
         # как в предыдущей версии класса Player.
-        self.player.hitbox.x = new_x
-        self.player.hitbox.y = new_y
+        self.apply_position(new_x, new_y)
 
         # Анимация с улучшенной логикой
         self._update_animation_state(move_x, move_y, dt)
@@ -159,6 +129,90 @@ class PlayerMovementHandler:
                         steps_channel.stop()
                         self.player._steps_channel = None
 
+    def resolve_position(self, move_x, move_y, dt, level_width, level_height, collision_objects):
+        """Вычисляет новую позицию хитбокса с учётом коллизий и границ уровня.
+
+        Args:
+            move_x: Направление по X (-1..1, нормализовано для диагонали)
+            move_y: Направление по Y (-1..1, нормализовано для диагонали)
+            dt: Время кадра в секундах
+            level_width: Ширина уровня в пикселях
+            level_height: Высота уровня в пикселях
+            collision_objects: Объекты коллизий
+
+        Returns:
+            tuple: (new_x, new_y)
+        """
+        step_x = move_x * self.player.speed * dt
+        step_y = move_y * self.player.speed * dt
+
+        if config.COLLISION_SETTINGS.get("SWEPT_RESOLVER", False):
+            hitbox = self.player.hitbox
+            new_x, new_y = self.collision_handler.resolve_movement(
+                hitbox, step_x, step_y, collision_objects,
+                origin=(hitbox.x + self.subpixel_x, hitbox.y + self.subpixel_y)
+            )
+        else:
+            new_x, new_y = self._resolve_position_legacy(step_x, step_y, move_x, move_y,
+                                                         collision_objects)
+
+        # Ограничение по границам уровня
+        new_x = max(0, min(new_x, level_width - self.player.hitbox.width))
+        new_y = max(0, min(new_y, level_height - self.player.hitbox.height))
+        return new_x, new_y
+
+    def apply_position(self, new_x, new_y):
+        """Записывает позицию в хитбокс и запоминает дробный остаток.
+
+        Args:
+            new_x: Новая X координата (может быть дробной)
+            new_y: Новая Y координата (может быть дробной)
+        """
+        hitbox = self.player.hitbox
+        hitbox.x = new_x
+        hitbox.y = new_y
+        if config.COLLISION_SETTINGS.get("SWEPT_RESOLVER", False):
+            self.subpixel_x = new_x - hitbox.x
+            self.subpixel_y = new_y - hitbox.y
+        else:
+            self.subpixel_x = self.subpixel_y = 0.0
+
+    def _resolve_position_legacy(self, step_x, step_y, move_x, move_y, collision_objects):
+        """Прежний алгоритм: диагональ -> X -> Y с повторными попытками по осям."""
+        original_x = self.player.hitbox.x
+        original_y = self.player.hitbox.y
+
+        # Сначала пробуем двигаться по обеим осям
+        new_x, new_y = self.collision_handler.handle_movement_collisions(
+            self.player, original_x + step_x,
+            original_y + step_y,
+            collision_objects
+        )
+
+        # Если движение по обеим осям заблокировано, пробуем по одной оси
+        if abs(new_x - original_x) < 0.1 and abs(new_y - original_y) < 0.1 and move_x != 0 and move_y != 0:
+            # Пробуем только по X
+            temp_x, _ = self.collision_handler.handle_movement_collisions(
+                self.player, original_x + step_x,
+                original_y,
+                collision_objects
+            )
+            # Пробуем только по Y
+            _, temp_y = self.collision_handler.handle_movement_collisions(
+                self.player, original_x,
+                original_y + step_y,
+                collision_objects
+            )
+            # Выбираем то, что не заблокировано
+            if abs(temp_x - original_x) >= 0.1:
+                new_x = temp_x
+                new_y = original_y
+            elif abs(temp_y - original_y) >= 0.1:
+                new_x = original_x
+                new_y = temp_y
+
+        return new_x, new_y
+
     def _update_animation_state(self, move_x, move_y, dt):
         self.state_change_time += dt
 
@@ -0,0 +1,117 @@
+"""
+Модуль пространственной сетки.
+
+Содержит класс SpatialGrid - равномерную сетку для быстрого поиска
+прямоугольных объектов рядом с заданной областью (broadphase).
+"""
+
+import pygame
+
+
+class SpatialGrid:
+    """
+    Равномерная сетка для статических прямоугольных объектов.
+
+    Каждый объект регистрируется во всех ячейках, которые пересекает его
+    прямоугольник. Запрос возвращает только объекты из ячеек, покрытых
+    областью запроса, в порядке их добавления.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        """
+        Инициализация сетки.
+
+        Args:
+            cell_size: Размер ячейки в пикселях.
+        """
+        self.cell_size = max(1, int(cell_size))
+        self.cells = {}
+        self.items = []
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _cell_range(self, x: int, y: int, width: int, height: int) -> tuple[int, int, int, int]:
+        """Диапазон ячеек (включительно), которые покрывает прямоугольник."""
+        size = self.cell_size
+        return x // size, y // size, (x + width - 1) // size, (y + height - 1) // size
+
+    def insert(self, item, rect: pygame.Rect) -> None:
+        """
+        Добавляет объект в сетку.
+
+        Прямоугольники нулевой площади не добавляются: colliderect
+        для них всегда ложен.
+
+        Args:
+            item: Любой объект.
+            rect: Прямоугольник объекта в мировых координатах.
+        """
+        index = len(self.items)
+        self.items.append(item)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+
+        min_x, min_y, max_x, max_y = self._cell_range(rect.x, rect.y, rect.width, rect.height)
+        cells = self.cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is None:
+                    cells[(cell_x, cell_y)] = [index]
+                else:
+                    cell.append(index)
+
+    def query(self, rect) -> list:
+        """
+        Возвращает объекты, чьи ячейки пересекаются с областью.
+
+        Это кандидаты для точной проверки, а не точный результат.
+
+        Args:
+            rect: Область запроса (pygame.Rect или кортеж x, y, w, h).
+
+        Returns:
+            Список объектов без повторов в порядке добавления.
+        """
+        x, y, width, height = rect
+        if width <= 0 or height <= 0:
+            return []
+
+        min_x, min_y, max_x, max_y = self._cell_range(x, y, width, height)
+        cells = self.cells
+
+        # Быстрый путь: область целиком в одной ячейке
+        if min_x == max_x and min_y == max_y:
+            cell = cells.get((min_x, min_y))
+            if not cell:
+                return []
+            items = self.items
+            return [items[i] for i in cell]
+
+        found = set()
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell:
+                    found.update(cell)
+        items = self.items
+        return [items[i] for i in sorted(found)]
+
+    def query_point(self, x: float, y: float) -> list:
+        """
+        Возвращает объекты из ячейки, содержащей точку.
+
+        Args:
+            x: Координата X в мировых координатах.
+            y: Координата Y в мировых координатах.
+
+        Returns:
+            Список объектов ячейки в порядке добавления.
+        """
+        size = self.cell_size
+        cell = self.cells.get((int(x // size), int(y // size)))
+        if not cell:
+            return []
+        items = self.items
+        return [items[i] for i in cell]